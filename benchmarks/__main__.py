@@ -0,0 +1,25 @@
+import argparse
+import json
+from .suite import SCENARIOS, TRANSPORTS, run_benchmarks, format_results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark the SDK against a local fake Rebrandly server.')
+    parser.add_argument('scenarios', nargs='*', help='scenarios to run, all by default: ' + ', '.join(SCENARIOS))
+    parser.add_argument('--size', type=int, default=200, help='links created, fetched, listed or deleted per scenario')
+    parser.add_argument('--latency', type=float, default=0, help='server side latency added to every request, in milliseconds')
+    parser.add_argument('--error-rate', type=float, default=0, help='share of requests failing with --error-status')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--transport', choices=TRANSPORTS, default='requests')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+    unknown_scenarios = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown_scenarios:
+        parser.error('unknown scenarios: ' + ', '.join(unknown_scenarios))
+    results = run_benchmarks(size=args.size, scenarios=args.scenarios, latency=args.latency / 1000, error_rate=args.error_rate, error_status=args.error_status, transport=args.transport)
+    if args.json:
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+    else:
+        print(format_results(results))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,338 @@
+import datetime
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+DEFAULT_DOMAIN = {"id": "8f104cc5b6ee4a4ba7897b06ac2ddcfb", "ref": "/domains/8f104cc5b6ee4a4ba7897b06ac2ddcfb", "fullName": "rebrand.ly",
+    "sharing": {"protocol": {"allowed": ["http", "https"], "default": "https"}}, "active": True}
+DEFAULT_WORKSPACE = {"id": "b2b5e4c7e8aa4e49a5c1ae1f0f2c5a47", "name": "Main workspace", "type": "classic", "default": True}
+APPS = [{"id": "0f3b2b5c1e8a4d0b9c6a8e4f1d2c3b4a", "name": "Example iOS app"}, {"id": "5a1c9e2d7b3f4a6e8d0c2b4a6f8e0d1c", "name": "Example Android app"}]
+# The API never returns more than this many links per page
+MAX_PAGE_SIZE = 25
+EPOCH = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+
+def _not_found(source):
+    return 404, {"code": "NotFound", "source": source}
+
+# In-memory stand-in for the Rebrandly API covering the endpoints used by the SDK. handle is the five-argument handler
+# InMemoryTransport takes, handle(method, path, params, body, headers) returning (status_code, json_body, headers), and
+# FakeRebrandlyServer serves it over HTTP. latency seconds are added to every request and a share error_rate of requests
+# fail with error_status.
+class FakeRebrandlyApi:
+    def __init__(self, latency=0, error_rate=0, error_status=503, seed=None, api_key=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        # When set, requests made with another api key are rejected
+        self.api_key = api_key
+        self.random = random.Random(seed)
+        self._clock = 0
+        self._lock = threading.Lock()
+        self.links = {}
+        self.routes = {}
+        self.deep_links = {}
+        self.opengraphs = {}
+        self.workspaces = {DEFAULT_WORKSPACE["id"]: self._with_timestamps(dict(DEFAULT_WORKSPACE), self._now())}
+        self.workspace_domains = {DEFAULT_WORKSPACE["id"]: [DEFAULT_DOMAIN["id"]]}
+        self.domains = {DEFAULT_DOMAIN["id"]: dict(DEFAULT_DOMAIN)}
+        self.request_count = 0
+
+    # Timestamps advance by one second per write so ordering by date is deterministic
+    def _now(self):
+        self._clock += 1
+        return (EPOCH + datetime.timedelta(seconds=self._clock)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+    def _with_timestamps(self, resource, now):
+        resource.setdefault("createdAt", now)
+        resource["updatedAt"] = now
+        return resource
+
+    def seed_links(self, count, domain=DEFAULT_DOMAIN):
+        with self._lock:
+            return [self._add_link({"destination": f"https://example.com/articles/{i}", "title": f"Article {i}"}, domain) for i in range(count)]
+
+    def handle(self, method, path, params, body, headers=None):
+        if self.latency:
+            time.sleep(self.latency() if callable(self.latency) else self.latency)
+        with self._lock:
+            self.request_count += 1
+            if self.api_key is not None and (headers or {}).get('apikey') != self.api_key:
+                return 401, {"code": "Unauthorized"}, {}
+            if self.error_rate and self.random.random() < self.error_rate:
+                return self.error_status, {"code": "ServiceUnavailable" if self.error_status != 429 else "RateLimitExceeded"}, {"Retry-After": "0"}
+            result = self._route(method, path.rstrip('/').split('/')[2:], params, body)
+        return result if len(result) == 3 else result + ({},)
+
+    def _route(self, method, parts, params, body):
+        resource = parts[0] if parts else ''
+        if resource == 'links':
+            return self._route_links(method, parts[1:], params, body)
+        if resource == 'workspaces':
+            return self._route_workspaces(method, parts[1:], body)
+        if resource == 'domains' and method == 'GET' and len(parts) == 1:
+            return 200, list(self.domains.values())
+        if resource == 'apps' and method == 'GET' and len(parts) == 1:
+            return 200, APPS
+        return _not_found(resource or 'resource')
+
+    def _route_links(self, method, parts, params, body):
+        if not parts:
+            if method == 'GET':
+                return 200, self._list_links(params)
+            if method == 'POST':
+                return self._create_link(body)
+            if method == 'PUT':
+                return self._bulk_create_links(body)
+            if method == 'DELETE':
+                deleted = [link_id for link_id in body["links"] if self._delete_link(link_id)]
+                return 200, {"count": len(deleted)}
+        if parts == ['count'] and method == 'GET':
+            return 200, {"count": len(self._filter_links(params))}
+        link = self.links.get(parts[0])
+        if link is None:
+            return _not_found('link')
+        link_id = parts[0]
+        if len(parts) == 1:
+            if method == 'GET':
+                return 200, link
+            if method == 'POST':
+                for field in ('destination', 'title', 'description'):
+                    if body.get(field):
+                        link[field] = body[field]
+                self._with_timestamps(link, self._now())
+                return 200, link
+            if method == 'DELETE':
+                self._delete_link(link_id)
+                return 200, link
+        sub_resource = parts[1] if len(parts) > 1 else ''
+        if sub_resource == 'favourite' and method == 'POST':
+            link["favourite"] = bool(body.get("favourite"))
+            self._with_timestamps(link, self._now())
+            return 200, link
+        if sub_resource == 'rules':
+            return self._route_routes(method, link_id, parts[2:], body)
+        if sub_resource == 'apps':
+            return self._route_deep_links(method, link_id, parts[2:], body)
+        if sub_resource == 'opengraph':
+            if method == 'GET':
+                return 200, self.opengraphs.get(link_id, {})
+            if method == 'POST':
+                self.opengraphs[link_id] = body
+                return 200, body
+            if method == 'DELETE':
+                self.opengraphs.pop(link_id, None)
+                return 200, {}
+        return _not_found('link')
+
+    def _route_routes(self, method, link_id, parts, body):
+        routes = self.routes.setdefault(link_id, {})
+        if not parts:
+            if method == 'GET':
+                return 200, list(routes.values())
+            if method == 'POST':
+                route = self._with_timestamps(dict(body, id=uuid.uuid4().hex), self._now())
+                routes[route["id"]] = route
+                return 200, route
+        elif parts[0] in routes:
+            if method == 'POST':
+                routes[parts[0]].update(body)
+                return 200, self._with_timestamps(routes[parts[0]], self._now())
+            if method == 'DELETE':
+                return 200, routes.pop(parts[0])
+        return _not_found('rule')
+
+    def _route_deep_links(self, method, link_id, parts, body):
+        deep_links = self.deep_links.setdefault(link_id, {})
+        if not parts:
+            if method == 'GET':
+                return 200, list(deep_links.values())
+            return _not_found('app')
+        app = next((app for app in APPS if app["id"] == parts[0]), None)
+        if app is None:
+            return _not_found('app')
+        if method == 'POST':
+            if not isinstance(body, dict) or not isinstance(body.get("path"), str):
+                return 400, {"code": "InvalidFormat", "source": "path"}
+            deep_link = self._with_timestamps({"id": app["id"], "path": body["path"], "active": True, "app": app}, self._now())
+            deep_links[app["id"]] = deep_link
+            return 200, deep_link
+        if method == 'DELETE' and app["id"] in deep_links:
+            return 200, deep_links.pop(app["id"])
+        return _not_found('app')
+
+    def _route_workspaces(self, method, parts, body):
+        if not parts:
+            if method == 'GET':
+                return 200, list(self.workspaces.values())
+            if method == 'POST':
+                workspace = self._with_timestamps({"id": uuid.uuid4().hex, "name": body["name"], "type": body["type"], "default": False}, self._now())
+                self.workspaces[workspace["id"]] = workspace
+                self.workspace_domains[workspace["id"]] = []
+                return 200, workspace
+        workspace = self.workspaces.get(parts[0]) if parts else None
+        if workspace is None:
+            return _not_found('workspace')
+        if len(parts) == 1:
+            if method == 'GET':
+                return 200, workspace
+            if method == 'POST':
+                workspace["name"] = body.get("name") or workspace["name"]
+                return 200, self._with_timestamps(workspace, self._now())
+            if method == 'DELETE':
+                if workspace["type"] == 'extended':
+                    return 403, {"code": "CouldNotDeleteExtendedWorkspace"}
+                self.workspace_domains.pop(parts[0], None)
+                return 200, self.workspaces.pop(parts[0])
+        if parts[1:2] == ['domains']:
+            if len(parts) == 2 and method == 'GET':
+                return 200, [self.domains[domain_id] for domain_id in self.workspace_domains[parts[0]]]
+            if len(parts) == 3 and method == 'POST':
+                if parts[2] not in self.domains:
+                    return _not_found('domain')
+                self.workspace_domains[parts[0]].append(parts[2])
+                return 200, workspace
+        return _not_found('workspace')
+
+    def _link_errors(self, link):
+        destination = link.get("destination")
+        if not destination:
+            return [{"property": "destination", "code": "RequiredField"}]
+        if not destination.startswith(('http://', 'https://')):
+            return [{"property": "destination", "code": "InvalidFormat"}]
+        return []
+
+    def _link_domain(self, link):
+        domain_id = link.get("domainId") or (link.get("domain") or {}).get("id")
+        if not domain_id:
+            return DEFAULT_DOMAIN
+        return self.domains.get(domain_id)
+
+    def _add_link(self, link, domain):
+        link_id = uuid.uuid4().hex
+        slashtag = link.get("slashtag") or link_id[:7]
+        stored = self._with_timestamps({
+            "id": link_id, "title": link.get("title") or link["destination"], "slashtag": slashtag, "destination": link["destination"],
+            "shortUrl": domain["fullName"] + '/' + slashtag, "domainId": domain["id"], "domainName": domain["fullName"],
+            "domain": {"id": domain["id"], "ref": domain["ref"], "fullName": domain["fullName"], "sharing": domain["sharing"], "active": True},
+            "status": "active", "tags": [], "clicks": 0, "isPublic": False, "favourite": False, "forwardParameters": True, "https": True,
+            "integrated": False, "creator": {"id": "d2a8c7a5f1e34b0c9b6d4e2f0a8c6e4b", "fullName": "Benchmark", "avatarUrl": ""}
+        }, self._now())
+        if link.get("description"):
+            stored["description"] = link["description"]
+        self.links[link_id] = stored
+        return stored
+
+    def _create_link(self, body):
+        errors = self._link_errors(body)
+        if errors:
+            return 403, {"code": "InvalidFormat", "errors": errors}
+        domain = self._link_domain(body)
+        if domain is None:
+            return _not_found('domain')
+        return 200, self._add_link(body, domain)
+
+    # Like the enterprise endpoint, a single invalid link rejects the whole batch
+    def _bulk_create_links(self, body):
+        for link in body:
+            errors = self._link_errors(link)
+            if errors:
+                return 403, {"code": "InvalidFormat", "errors": errors}
+            if self._link_domain(link) is None:
+                return _not_found('domain')
+        return 200, [self._add_link(link, self._link_domain(link)) for link in body]
+
+    def _delete_link(self, link_id):
+        for store in (self.routes, self.deep_links, self.opengraphs):
+            store.pop(link_id, None)
+        return self.links.pop(link_id, None) is not None
+
+    def _filter_links(self, params):
+        links = list(self.links.values())
+        filters = {'domain.id': lambda link: link["domainId"], 'domain.fullName': lambda link: link["domainName"],
+            'slashtag': lambda link: link["slashtag"], 'creator.id': lambda link: link["creator"]["id"]}
+        for param, field in filters.items():
+            if params.get(param):
+                links = [link for link in links if field(link) == params[param]]
+        if params.get('favourite') in ('true', 'false'):
+            links = [link for link in links if link["favourite"] == (params['favourite'] == 'true')]
+        if params.get('dateFrom'):
+            links = [link for link in links if link["createdAt"] >= params['dateFrom']]
+        if params.get('dateTo'):
+            links = [link for link in links if link["createdAt"] < params['dateTo']]
+        return links
+
+    def _list_links(self, params):
+        links = self._filter_links(params)
+        order_by = params.get('orderBy') or 'createdAt'
+        links.sort(key=lambda link: (link.get(order_by) or '', link["id"]), reverse=(params.get('orderDir') or 'desc') == 'desc')
+        start = 0
+        if params.get('last'):
+            ids = [link["id"] for link in links]
+            if params['last'] in ids:
+                start = ids.index(params['last']) + 1
+        limit = min(int(params.get('limit') or MAX_PAGE_SIZE), MAX_PAGE_SIZE)
+        return links[start:start + limit]
+
+# Serves a FakeRebrandlyApi over HTTP/1.1 on localhost from a background thread. Use it as a context manager and pass url as
+# both api_url and enterprise_api_url.
+class FakeRebrandlyServer:
+    def __init__(self, api=None, host='127.0.0.1', port=0):
+        self.api = api or FakeRebrandlyApi()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _handler_class(self):
+        api = self.api
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately, which Nagle's algorithm would hold back on keep-alive connections
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                url_parts = urlsplit(self.path)
+                params = {key: values[-1] for key, values in parse_qs(url_parts.query, keep_blank_values=True).items()}
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status_code, response_json, headers = api.handle(self.command, url_parts.path, params, body, self.headers)
+                content = json.dumps(response_json).encode('utf-8')
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, kwargs={'poll_interval': 0.05}, name='fake-rebrandly-server', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
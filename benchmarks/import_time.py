@@ -0,0 +1,44 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each step runs after the previous ones in the same fresh interpreter
+STEPS = {
+    'import': "from src.rebrandly_official.rebrandly_client import RebrandlyClient",
+    'construct': "client = RebrandlyClient('benchmark-api-key')",
+    'links': "client.links",
+    'all_sub_clients': "client.workspaces; client.domains",
+}
+
+def _measure_once():
+    timed_steps = '\n'.join(f"started_at = time.perf_counter()\n{statement}\ntimings[{name!r}] = time.perf_counter() - started_at"
+        for name, statement in STEPS.items())
+    code = f"import json, time\ntimings = {{}}\n{timed_steps}\nprint(json.dumps(timings))"
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+def run_import_benchmark(repeat=10):
+    runs = [_measure_once() for _ in range(repeat)]
+    return {name: {"median": statistics.median(run[name] for run in runs), "min": min(run[name] for run in runs)} for name in STEPS}
+
+def format_results(results):
+    lines = [f"{'step':<16} {'median ms':>10} {'min ms':>10}"]
+    for name, timing in results.items():
+        lines.append(f"{name:<16} {timing['median'] * 1000:>10.2f} {timing['min'] * 1000:>10.2f}")
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.import_time', description='Measure the cold start cost of importing and using the client.')
+    parser.add_argument('--repeat', type=int, default=10, help='fresh interpreters to measure in')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+    results = run_import_benchmark(repeat=args.repeat)
+    print(json.dumps(results, indent=2) if args.json else format_results(results))
+
+if __name__ == '__main__':
+    main()
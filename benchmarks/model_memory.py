@@ -0,0 +1,53 @@
+import argparse
+import gc
+import json
+import tracemalloc
+from benchmarks.fake_server import FakeRebrandlyApi
+from src.rebrandly_official.codec import JsonCodec, OrjsonCodec, orjson
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from src.rebrandly_official.transports import InMemoryTransport
+
+# Bytes still allocated once every link of a listing of size links is held, as dicts or as models
+def measure_listing(size=2000, codec=None, use_models=False):
+    api = FakeRebrandlyApi()
+    api.seed_links(size)
+    client = RebrandlyClient('benchmark-api-key', transport=InMemoryTransport(api.handle), codec=codec, use_models=use_models)
+    page = client.links.list()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        links = list(page.iter_all())
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(links) == size
+    return retained
+
+def run_model_memory_benchmark(size=2000):
+    codecs = {'json': JsonCodec}
+    if orjson is not None:
+        codecs['orjson'] = OrjsonCodec
+    results = {}
+    for name, codec in codecs.items():
+        dicts = measure_listing(size, codec(), use_models=False)
+        models = measure_listing(size, codec(), use_models=True)
+        results[name] = {"dicts": dicts, "models": models, "ratio": models / dicts}
+    return results
+
+def format_results(results, size):
+    lines = [f"{'codec':<8} {'dicts KB':>10} {'models KB':>10} {'ratio':>7}   ({size} links)"]
+    for name, result in results.items():
+        lines.append(f"{name:<8} {result['dicts'] / 1024:>10.0f} {result['models'] / 1024:>10.0f} {result['ratio']:>7.2f}")
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.model_memory', description='Compare the memory held by a listing as dicts and as models.')
+    parser.add_argument('--size', type=int, default=2000, help='links listed')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+    results = run_model_memory_benchmark(size=args.size)
+    print(json.dumps(results) if args.json else format_results(results, args.size))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+import statistics
+import time
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from src.rebrandly_official.retry_policy import RetryPolicy
+from src.rebrandly_official.transports import InMemoryTransport, Http2Transport
+from .fake_server import FakeRebrandlyApi, FakeRebrandlyServer, DEFAULT_DOMAIN
+
+BULK_DELETE_CHUNK_SIZE = 25
+
+class BenchmarkResult:
+    def __init__(self, name, operations, duration, latencies, errors=0):
+        self.name = name
+        # Number of SDK level operations, e.g. links created rather than requests made
+        self.operations = operations
+        self.duration = duration
+        self.latencies = sorted(latencies)
+        self.errors = errors
+
+    @property
+    def throughput(self):
+        return self.operations / self.duration if self.duration else 0.0
+
+    def percentile(self, quantile):
+        if not self.latencies:
+            return None
+        return self.latencies[min(len(self.latencies) - 1, int(quantile * len(self.latencies)))]
+
+    def to_dict(self):
+        return {
+            "name": self.name, "operations": self.operations, "duration": self.duration, "throughput": self.throughput, "errors": self.errors,
+            "latency_mean": statistics.fmean(self.latencies) if self.latencies else None,
+            "latency_p50": self.percentile(0.5), "latency_p99": self.percentile(0.99)
+        }
+
+# Times each call and counts failures instead of stopping, so error injection shows up in the report
+def _time_calls(fn, items):
+    latencies = []
+    errors = 0
+    started_at = time.perf_counter()
+    for item in items:
+        call_started_at = time.perf_counter()
+        try:
+            fn(item)
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - call_started_at)
+    return time.perf_counter() - started_at, latencies, errors
+
+def bench_create(client, api, size):
+    duration, latencies, errors = _time_calls(lambda i: client.links.create(f"https://example.com/create/{i}"), range(size))
+    return BenchmarkResult('create', size, duration, latencies, errors)
+
+def bench_get(client, api, size):
+    link_ids = [link["id"] for link in api.seed_links(size)]
+    duration, latencies, errors = _time_calls(client.links.get, link_ids)
+    return BenchmarkResult('get', size, duration, latencies, errors)
+
+# Every page request is timed through the instrumentation hooks
+def bench_list_all(client, api, size):
+    api.seed_links(size)
+    page_latencies = []
+    hook = client.instrumentation.on_response(lambda event: page_latencies.append(event.latency))
+    errors = 0
+    started_at = time.perf_counter()
+    try:
+        listed = sum(1 for _ in client.links.list().iter_all(prefetch=2))
+    except Exception:
+        listed = 0
+        errors = 1
+    duration = time.perf_counter() - started_at
+    client.instrumentation.remove_hook(hook)
+    return BenchmarkResult('list_all', listed, duration, page_latencies, errors)
+
+def bench_bulk_create(client, api, size):
+    links = [{"destination": f"https://example.com/bulk/{i}", "domain": {"id": DEFAULT_DOMAIN["id"]}} for i in range(size)]
+    chunk_latencies = []
+    hook = client.instrumentation.on_response(lambda event: chunk_latencies.append(event.latency))
+    started_at = time.perf_counter()
+    result = client.links.bulk_create_chunked(None, links)
+    duration = time.perf_counter() - started_at
+    client.instrumentation.remove_hook(hook)
+    return BenchmarkResult('bulk_create', len(result.created), duration, chunk_latencies, len(result.errors))
+
+def bench_bulk_delete(client, api, size):
+    link_ids = [link["id"] for link in api.seed_links(size)]
+    chunks = [link_ids[i:i + BULK_DELETE_CHUNK_SIZE] for i in range(0, len(link_ids), BULK_DELETE_CHUNK_SIZE)]
+    duration, latencies, errors = _time_calls(client.links.bulk_delete, chunks)
+    return BenchmarkResult('bulk_delete', size, duration, latencies, errors)
+
+SCENARIOS = {
+    'create': bench_create,
+    'get': bench_get,
+    'list_all': bench_list_all,
+    'bulk_create': bench_bulk_create,
+    'bulk_delete': bench_bulk_delete
+}
+
+TRANSPORTS = ('requests', 'http2', 'memory')
+
+# The memory transport calls the fake api directly, the others go through the local server
+def _transport(name, api):
+    if name == 'memory':
+        return InMemoryTransport(api.handle)
+    if name == 'http2':
+        return Http2Transport()
+    return None
+
+# Each scenario gets a fresh server so earlier scenarios do not change the data set
+def run_benchmarks(size=200, scenarios=None, latency=0, error_rate=0, error_status=503, seed=0, transport='requests', client_options=None):
+    results = []
+    for name in scenarios or SCENARIOS:
+        api = FakeRebrandlyApi(latency=latency, error_rate=error_rate, error_status=error_status, seed=seed)
+        with FakeRebrandlyServer(api) as server:
+            options = dict(retry_policy=RetryPolicy(backoff_factor=0), transport=_transport(transport, api))
+            options.update(client_options or {})
+            client = RebrandlyClient('benchmark-api-key', api_url=server.url, enterprise_api_url=server.url, **options)
+            try:
+                results.append(SCENARIOS[name](client, api, size))
+            finally:
+                client.executor.shutdown()
+                client.session.close()
+    return results
+
+def format_results(results):
+    lines = [f"{'scenario':<12} {'ops':>7} {'errors':>7} {'seconds':>9} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9}"]
+    for result in results:
+        p50, p99 = result.percentile(0.5), result.percentile(0.99)
+        lines.append(f"{result.name:<12} {result.operations:>7} {result.errors:>7} {result.duration:>9.3f} {result.throughput:>10.1f} "
+            f"{(p50 or 0) * 1000:>9.3f} {(p99 or 0) * 1000:>9.3f}")
+    return '\n'.join(lines)
@@ -13,6 +13,10 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/rebrandly/rebrandly-python",
     packages=setuptools.find_packages(),
+    extras_require={
+        "async": ["httpx"],
+        "http2": ["httpx[http2]"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,28 @@
+import importlib
+
+# Exported names are imported from their modules on first access, so `import rebrandly_official` stays cheap
+_EXPORTS = {
+    'RebrandlyClient': 'rebrandly_client',
+    'AsyncRebrandlyClient': 'async_rebrandly_client',
+    'RebrandlyClientPool': 'client_pool',
+    'LinkCache': 'link_cache',
+    'RetryPolicy': 'retry_policy',
+    'TokenBucketRateLimiter': 'rate_limiter',
+    'LatencyHistogram': 'instrumentation',
+    'LinkValidator': 'link_validator',
+    'LinkMirror': 'link_mirror',
+    'Http2Transport': 'transports',
+    'InMemoryTransport': 'transports',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + _EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import sys
+from .rebrandly_client import RebrandlyClient
+
+def create_client(args, concurrency):
+    api_key = args.api_key or os.environ.get('REBRANDLY_API_KEY')
+    if not api_key:
+        raise SystemExit('An api key is required: pass --api-key or set REBRANDLY_API_KEY.')
+    api_url = args.api_url or RebrandlyClient.API_URL
+    enterprise_api_url = args.enterprise_api_url or args.api_url or RebrandlyClient.ENTERPRISE_API_URL
+    return RebrandlyClient(api_key, api_url=api_url, enterprise_api_url=enterprise_api_url, pool_maxsize=concurrency + 1,
+        enterprise_pool_maxsize=concurrency, max_workers=concurrency)
+
+def run_import(args):
+    from .link_import import detect_format, import_links
+    client = create_client(args, args.max_in_flight)
+    format = args.format or detect_format(args.input)
+    output = open(args.output, 'w', encoding='utf-8') if args.output != '-' else sys.stdout
+    try:
+        with open(args.input, newline='', encoding='utf-8') as source:
+            summary = import_links(client.links, source, output, workspace_id=args.workspace, format=format,
+                chunk_size=args.chunk_size, max_in_flight=args.max_in_flight)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        client.executor.shutdown()
+    print(json.dumps(summary.to_dict()), file=sys.stderr)
+    return 0 if summary.ok else 1
+
+def run_export(args):
+    from .link_export import SUB_RESOURCES, export_links, open_export
+    client = create_client(args, args.max_workers)
+    sub_resources = () if args.links_only else tuple(SUB_RESOURCES)
+    output = open_export(args.output) if args.output != '-' else sys.stdout
+    try:
+        summary = export_links(client.links, output, workspace_id=args.workspace, updated_since=args.since or '', sub_resources=sub_resources)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        client.executor.shutdown()
+    print(json.dumps(summary.to_dict()), file=sys.stderr)
+    return 0 if summary.ok else 1
+
+def add_client_arguments(parser):
+    parser.add_argument('--api-key', help='defaults to the REBRANDLY_API_KEY environment variable')
+    parser.add_argument('--workspace', default='', help='workspace id, the default workspace when omitted')
+    parser.add_argument('--api-url', help='e.g. a local test server, also used for enterprise requests unless --enterprise-api-url is set')
+    parser.add_argument('--enterprise-api-url')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m rebrandly_official', description='Command line tools for the Rebrandly API.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help='create links from a JSONL or CSV file')
+    import_parser.add_argument('input', help='JSONL file with one link per line, or CSV file with API fields as headers')
+    import_parser.add_argument('--output', default='-', help='JSONL file receiving one result per input row, stdout by default')
+    import_parser.add_argument('--format', choices=('jsonl', 'csv'), help='detected from the file extension by default')
+    import_parser.add_argument('--chunk-size', type=int, default=100, help='links per bulk request')
+    import_parser.add_argument('--max-in-flight', type=int, default=4, help='bulk requests sent concurrently')
+    add_client_arguments(import_parser)
+    import_parser.set_defaults(run=run_import)
+
+    export_parser = commands.add_parser('export', help='write every link with its routes, deep links and OpenGraph to JSONL')
+    export_parser.add_argument('output', help='JSONL file, gzip compressed when it ends in .gz, or - for stdout')
+    export_parser.add_argument('--since', help='only export links updated at or after this timestamp, e.g. the watermark of the previous export')
+    export_parser.add_argument('--links-only', action='store_true', help='skip routes, deep links and OpenGraph')
+    export_parser.add_argument('--max-workers', type=int, default=8, help='sub-resource requests sent concurrently')
+    add_client_arguments(export_parser)
+    export_parser.set_defaults(run=run_export)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,10 @@
+from .domains import Domains
+from .models import Domain
+from .async_paginated_response import AsyncPaginatedResponse
+
+class AsyncDomains(Domains):
+    async def list(self):
+        response = await self.session.get(self.base_domains_uri, operation='domains.list', page=1)
+        domains = self.evaluate_response_status_code_return_object(response, 'List', 'all')
+        if type(domains) == list:
+            return AsyncPaginatedResponse(response, self.session, items=domains, codec=self.codec, model=Domain if self.use_models else None, operation='domains.list')
@@ -0,0 +1,264 @@
+import asyncio
+from collections import deque
+from requests.exceptions import HTTPError
+from .links import Links
+from .concurrency import gather
+from .models import Link, Route, DeepLink
+from .bulk_create_result import BulkCreateResult
+from .async_paginated_response import AsyncPaginatedResponse
+from .async_sharded_scan import AsyncShardedScan
+
+class AsyncLinks(Links):
+    async def get(self, link_id, workspace_id=None):
+        url = self.base_links_uri + '/' + link_id
+        params = {
+            'workspace':workspace_id
+        }
+        response = await self.session.get(url, params=params, operation='links.get')
+        return self._as_model(Link, self.evaluate_response_status_code_return_object(response, 'Get', 'link', link_id))
+
+    async def update(self, link_id, destination, title, favourite='', description='', workspace_id='', current=None):
+        current = self._known_link(link_id, workspace_id, current)
+        send_favourite, send_body = self._update_requests(destination, title, favourite, description, current)
+        if send_favourite:
+            await self.favourite(link_id, favourite, workspace_id=workspace_id)
+        if not send_body:
+            return self._as_model(Link, dict(current, favourite=favourite) if send_favourite else current)
+        url = self.base_links_uri + '/' + link_id
+        body = {
+            'destination':destination,
+            'title':title
+        }
+        if description:
+            body["description"] = description
+        data = self.codec.dumps(body)
+        response = await self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.update')
+        return self._as_model(Link, self.evaluate_response_status_code_return_object(response, 'Update', 'link', link_id))
+
+    # Same as Links.get_many, without the fallback to listing the workspace
+    async def get_many(self, link_ids, workspace_id=None, max_workers=8, return_exceptions=True):
+        unique_ids = list(dict.fromkeys(link_ids))
+        semaphore = asyncio.Semaphore(max_workers)
+        async def read_link(link_id):
+            async with semaphore:
+                return await self.get(link_id, workspace_id=workspace_id)
+        links = await gather((read_link(link_id) for link_id in unique_ids), return_exceptions=return_exceptions)
+        found = dict(zip(unique_ids, links))
+        return [found[link_id] for link_id in link_ids]
+
+    async def update_many(self, updates, current=None, workspace_id='', max_workers=4, return_exceptions=False):
+        known_links = self._index_known_links(current)
+        semaphore = asyncio.Semaphore(max_workers)
+        async def update_link(update):
+            async with semaphore:
+                link = self._known_link(update['id'], workspace_id, known_links.get(update['id']))
+                if link is None and not ('destination' in update and 'title' in update):
+                    link = self._known_link(update['id'], workspace_id, await self.get(update['id'], workspace_id=workspace_id or None))
+                return await self.update(workspace_id=workspace_id, **self._update_arguments(update, link))
+        return await gather((update_link(update) for update in updates), return_exceptions=return_exceptions)
+
+    async def favourite(self, link_id, favourite, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id + '/favourite'
+        body = {
+            'favourite':favourite
+        }
+        data = self.codec.dumps(body)
+        response = await self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.favourite')
+        return self.evaluate_response_status_code_return_object(response, 'Favourite', 'link', link_id)
+
+    async def list(self, workspace_id='',order_by='', order_dir='', limit='',favourite='',domain_id='',domain_name='',creator_id='',slashtag='',date_from='',date_to=''):
+        url = self.base_links_uri
+        params = {
+            'workspace':workspace_id,
+            'orderBy':order_by,
+            'orderDir':order_dir,
+            'limit':limit,
+            'favourite':favourite,
+            'domain.id':domain_id,
+            'domain.fullName':domain_name,
+            'creator.id':creator_id,
+            'slashtag':slashtag,
+            'dateFrom':date_from,
+            'dateTo':date_to
+        }
+        response = await self.session.get(url, params=params, operation='links.list', page=1)
+        links = self.evaluate_response_status_code_return_object(response, 'List', 'links', 'all_links')
+        if type(links) == list:
+            return AsyncPaginatedResponse(response, self.session, items=links, codec=self.codec, model=Link if self.use_models else None, operation='links.list')
+
+    async def create(self, destination, slashtag='', title='', domain_id='', domain_name='', description='', workspace_id=''):
+        url = self.base_links_uri
+        params = {
+            'workspace':workspace_id
+        }
+        body = {
+            "destination": destination,
+            "slashtag":slashtag,
+            "title":title,
+            "domain":{
+                "id": domain_id,
+                "fullName": domain_name
+            }
+        }
+        if description:
+            body["description"] = description
+        data = self.codec.dumps(body)
+        response = await self.session.post(url, params=params, data=data, operation='links.create')
+        return self._as_model(Link, self.evaluate_response_status_code_return_object(response, 'Create', 'link', ''))
+
+    async def bulk_create(self, workspace_id, links):
+        for link in links:
+            self.check_link_validity(link)
+        response = await self._send_bulk_create(workspace_id, links)
+        return self.evaluate_response_status_code_return_object(response, 'Bulk create', 'links', '')
+
+    async def _send_bulk_create(self, workspace_id, links):
+        data = self.codec.dumps(links)
+        return await self.session.put(self.base_enterprise_links_uri, params={"workspace":workspace_id}, data=data, operation='links.bulk_create')
+
+    async def bulk_create_chunked(self, workspace_id, links, chunk_size=Links.BULK_CREATE_CHUNK_SIZE, max_workers=4):
+        result = BulkCreateResult()
+        chunks = self._partition_bulk_create_chunks(links, chunk_size, result)
+        semaphore = asyncio.Semaphore(max_workers)
+        async def create_chunk(chunk):
+            async with semaphore:
+                return await self._bulk_create_chunk(workspace_id, chunk)
+        for outcomes in await asyncio.gather(*(create_chunk(chunk) for chunk in chunks)):
+            self._record_bulk_create_outcomes(outcomes, result)
+        return result
+
+    # Async generator yielding the same (index, created_link, error) outcomes as Links.bulk_create_stream, with chunks sent as tasks
+    async def bulk_create_stream(self, workspace_id, links, chunk_size=Links.BULK_CREATE_CHUNK_SIZE, max_in_flight=4):
+        if max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1.')
+        pending = deque()
+        for chunk, failures in self._stream_bulk_create_batches(links, chunk_size):
+            if len(pending) >= max_in_flight:
+                for outcome in await self._finish_bulk_create_batch(*pending.popleft()):
+                    yield outcome
+            task = asyncio.ensure_future(self._bulk_create_chunk(workspace_id, chunk)) if chunk else None
+            pending.append((task, failures))
+        while pending:
+            for outcome in await self._finish_bulk_create_batch(*pending.popleft()):
+                yield outcome
+
+    async def _finish_bulk_create_batch(self, task, failures):
+        outcomes = await task if task is not None else []
+        return sorted(outcomes + failures, key=lambda outcome: outcome[0])
+
+    # Walks every shard concurrently on the event loop, consumed with async for. Results are merged in order_by order when it is set.
+    def scan(self, shards, max_workers=4, order_by='', order_dir='', **list_params):
+        return AsyncShardedScan(self, shards, max_workers=max_workers, order_by=order_by, order_dir=order_dir, list_params=list_params)
+
+    async def _bulk_create_chunk(self, workspace_id, chunk):
+        links = [link for _, link in chunk]
+        try:
+            response = await self._send_bulk_create(workspace_id, links)
+        # Transport failures come from httpx rather than requests
+        except Exception as error:
+            return [(index, None, error) for index, _ in chunk]
+        try:
+            created_links = self.evaluate_response_status_code_return_object(response, 'Bulk create', 'links', '')
+        except (HTTPError, ValueError) as error:
+            if len(chunk) == 1 or not self._rejects_individual_links(response):
+                return [(index, None, error) for index, _ in chunk]
+            middle = len(chunk) // 2
+            return await self._bulk_create_chunk(workspace_id, chunk[:middle]) + await self._bulk_create_chunk(workspace_id, chunk[middle:])
+        return [(index, created_link, None) for (index, _), created_link in zip(chunk, created_links)]
+
+    async def count(self, favourite=None, domain_id='', domain_name='',workspace_id=''):
+        url = self.base_links_uri + '/count'
+        favourite_str = str(favourite).lower()
+        params = {
+            'favourite':favourite_str,
+            'domain.id':domain_id,
+            'domain.fullName':domain_name,
+            'workspace':workspace_id
+        }
+        response = await self.session.get(url, params=params, operation='links.count')
+        return self.evaluate_response_status_code_return_count(response, 'Count', 'links', '')
+
+    async def delete(self, link_id, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id
+        response = await self.session.delete(url, params={"workspace":workspace_id}, operation='links.delete')
+        return self.evaluate_response_status_code_return_object(response, 'Delete', 'link', link_id)
+
+    # Links param expects an array of strings
+    async def bulk_delete(self, links, workspace_id=''):
+        url = self.base_links_uri
+        data = self.codec.dumps({"links": links})
+        response = await self.session.delete(url, params={"workspace":workspace_id}, data=data, operation='links.bulk_delete')
+        return self.evaluate_response_status_code_return_count(response, 'Bulk delete', 'workspace', workspace_id)
+
+    async def create_route(self, link_id, route: dict, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id + '/rules'
+        data = self.codec.dumps(route)
+        response = await self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.create_route')
+        return self.evaluate_response_status_code_return_object(response, 'Create route', 'link', link_id)
+
+    async def update_route(self, link_id, route_id, routes, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id + '/rules/' + route_id
+        data = self.codec.dumps(routes)
+        response = await self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.update_route')
+        return self.evaluate_response_status_code_return_object(response, 'Update route', 'link', link_id)
+
+    async def list_routes(self, link_id, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id + '/rules'
+        response = await self.session.get(url, params={"workspace":workspace_id}, operation='links.list_routes')
+        return self._as_model(Route, self.evaluate_response_status_code_return_object(response, 'Get routes', 'link', link_id))
+
+    async def delete_route(self, link_id, route_id, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id + '/rules/' + route_id
+        response = await self.session.delete(url, params={"workspace":workspace_id}, operation='links.delete_route')
+        return self.evaluate_response_status_code_return_object(response, 'Delete route', 'link', link_id)
+
+    async def get_apps(self, workspace_id=''):
+        url = self.base_uri + '/apps'
+        response = await self.session.get(url, params={"workspace":workspace_id}, operation='links.get_apps')
+        return self.evaluate_response_status_code_return_object(response, 'get', 'apps', 'any')
+
+    async def list_deep_links(self, link_id, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id + '/apps'
+        response = await self.session.get(url, params={"workspace":workspace_id}, operation='links.list_deep_links')
+        return self._as_model(DeepLink, self.evaluate_response_status_code_return_object(response, 'List deep links', 'link', link_id))
+
+    async def create_deep_link(self, link_id, app_id, path, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id + '/apps/' + app_id
+        data = self.codec.dumps(path)
+        response = await self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.create_deep_link')
+        return self.evaluate_response_status_code_return_object(response, 'Update deep link', 'link', link_id)
+
+    async def delete_deep_link(self, link_id, app_id, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id + '/apps/' + app_id
+        response = await self.session.delete(url, params={"workspace":workspace_id}, operation='links.delete_deep_link')
+        return self.evaluate_response_status_code_return_object(response, 'Delete deep link', 'link', link_id)
+
+    async def delete_deep_links(self, link_id, workspace_id=''):
+        apps = await self.list_deep_links(link_id, workspace_id=workspace_id)
+        if len(apps) == 0:
+            return 0
+        await gather(self.delete_deep_link(link_id, app['id'], workspace_id=workspace_id) for app in apps)
+        return len(apps)
+
+    async def get_opengraph(self, link_id, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id +'/opengraph'
+        response = await self.session.get(url, params={"workspace":workspace_id}, operation='links.get_opengraph')
+        return self.evaluate_response_status_code_return_object(response, 'Get opengraph', 'link', link_id)
+
+    async def delete_opengraph(self, link_id, workspace_id=''):
+        url = self.base_links_uri + '/' + link_id +'/opengraph'
+        response = await self.session.delete(url, params={"workspace":workspace_id}, operation='links.delete_opengraph')
+        return self.evaluate_response_status_code_return_object(response, 'Delete opengraph', 'link', link_id)
+
+    async def set_opengraph(self, link_id, title, description='', image_url='', object_type='', locale='', workspace_id=''):
+        url = self.base_links_uri + '/' + link_id +'/opengraph'
+        opengraph_config = {
+                "title": title,
+                "description": description,
+                "image": image_url,
+                "type": object_type,
+                "locale": locale
+                }
+        data = self.codec.dumps(opengraph_config)
+        response = await self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.set_opengraph')
+        return self.evaluate_response_status_code_return_object(response, 'Update opengraph', 'link', link_id)
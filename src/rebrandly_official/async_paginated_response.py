@@ -0,0 +1,72 @@
+import asyncio
+from .paginated_response import PaginatedResponse, _LAST_PAGE
+
+class AsyncPaginatedResponse(PaginatedResponse):
+    async def next(self):
+        endpoint = self._next_page_endpoint()
+        if endpoint is None:
+            return
+        self._report_checkpoint(self.checkpoint())
+        await self._fetch(endpoint)
+
+    async def _fetch(self, endpoint):
+        response = await self.session.get(endpoint, operation=self.operation, page=self.iteration_count + 1)
+        self._update_from_response(response)
+
+    @classmethod
+    async def from_checkpoint(cls, checkpoint, session, codec=None, model=None):
+        page = cls._restore(checkpoint, session, codec, model)
+        endpoint = page._page_endpoint()
+        if endpoint is not None:
+            await page._fetch(endpoint)
+        return page
+
+    # Unlike __iter__, async iteration walks every remaining page
+    def __aiter__(self):
+        return self._iterate_pages()
+
+    async def iter_all(self, prefetch=1):
+        if prefetch < 1:
+            raise ValueError('prefetch must be at least 1.')
+        pages = asyncio.Queue(maxsize=prefetch)
+        first_page = (list(self.current_items), self.checkpoint())
+
+        async def fetch_pages():
+            try:
+                while True:
+                    endpoint = self._next_page_endpoint()
+                    if endpoint is None:
+                        break
+                    iteration_count = self.iteration_count
+                    await self._fetch(endpoint)
+                    if self.iteration_count == iteration_count:
+                        break
+                    await pages.put((list(self.current_items), self.checkpoint()))
+            except Exception as error:
+                await pages.put(error)
+                return
+            await pages.put(_LAST_PAGE)
+
+        fetcher = asyncio.ensure_future(fetch_pages())
+        try:
+            page = first_page
+            while page[0]:
+                for item in page[0]:
+                    yield item
+                self._report_checkpoint(page[1])
+                page = await pages.get()
+                if isinstance(page, Exception):
+                    raise page
+                if page is _LAST_PAGE:
+                    return
+        finally:
+            fetcher.cancel()
+
+    async def _iterate_pages(self):
+        while self.current_items_count > 0:
+            for item in self.current_items:
+                yield item
+            iteration_count = self.iteration_count
+            await self.next()
+            if self.iteration_count == iteration_count:
+                return
@@ -0,0 +1,61 @@
+import copy
+from .async_session import AsyncSession, AsyncScopedSession
+from .async_links import AsyncLinks
+from .async_workspaces import AsyncWorkspaces
+from .async_domains import AsyncDomains
+
+class AsyncRebrandlyClient:
+    API_URL = 'https://api.rebrandly.com/'
+    ENTERPRISE_API_URL = 'https://enterprise-api.rebrandly.com/'
+
+    def __init__(self, api_key: str, max_connections=100, max_keepalive_connections=20, http2=False, timeout=None, transport=None, retry_policy=None, rate_limiter=None, codec=None, use_models=False, instrumentation=None, api_url=API_URL, enterprise_api_url=ENTERPRISE_API_URL, single_flight=False):
+        headers = {"accept": "application/json", 'apikey': api_key, 'Content-type': 'application/json', 'User-Agent': 'rebrandly-python-sdk'}
+        self.session = AsyncSession(headers, max_connections=max_connections, max_keepalive_connections=max_keepalive_connections, http2=http2, timeout=timeout, transport=transport, retry_policy=retry_policy, rate_limiter=rate_limiter, instrumentation=instrumentation, single_flight=single_flight)
+        self.instrumentation = self.session.instrumentation
+        self.api_url = api_url
+        self.enterprise_api_url = enterprise_api_url
+        self._sub_client_options = {"codec": codec, "use_models": use_models}
+        self._root = None
+        self._scoped_headers = {}
+        self._create_sub_clients()
+
+    def _create_sub_clients(self):
+        self.links = AsyncLinks(self.session, api_url=self.api_url, enterprise_api_url=self.enterprise_api_url, **self._sub_client_options)
+        self.workspaces = AsyncWorkspaces(self.session, api_url=self.api_url, **self._sub_client_options)
+        self.domains = AsyncDomains(self.session, api_url=self.api_url, **self._sub_client_options)
+
+    # Views share this client's connection pool but send their own workspace or api key, see RebrandlyClient.for_workspace
+    def for_workspace(self, workspace_id):
+        return self._scoped({"workspace": workspace_id})
+
+    def with_api_key(self, api_key):
+        return self._scoped({"apikey": api_key})
+
+    def _scoped(self, headers):
+        view = copy.copy(self)
+        view._root = self._root or self
+        view._scoped_headers = dict(self._scoped_headers, **headers)
+        view.session = AsyncScopedSession(view._root.session, view._scoped_headers)
+        view._create_sub_clients()
+        return view
+
+    def update_api_key(self, api_key):
+        self._update_headers({"apikey":api_key})
+
+    def update_workspace(self, workspace_id):
+        self._update_headers({"workspace":workspace_id})
+
+    def _update_headers(self, headers):
+        if self._root is not None:
+            self._scoped_headers.update(headers)
+        else:
+            self.session.headers.update(headers)
+
+    async def aclose(self):
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+from .instrumentation import Instrumentation, RequestEvent
+from .async_single_flight import AsyncSingleFlight
+from .session import single_flight_key
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+class AsyncSession:
+    def __init__(self, headers, max_connections=100, max_keepalive_connections=20, http2=False, timeout=None, transport=None, retry_policy=None, rate_limiter=None, instrumentation=None, single_flight=False):
+        if httpx is None:
+            raise ImportError("The async client requires httpx. Install it with: pip install rebrandly-official[async]")
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        self.client = httpx.AsyncClient(headers=headers, limits=limits, http2=http2, timeout=timeout, transport=transport)
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.instrumentation = instrumentation or Instrumentation()
+        self.single_flight = AsyncSingleFlight() if single_flight else None
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    # headers are sent on top of the session headers for this request only
+    async def request(self, method, url, params=None, data=None, operation=None, page=None, headers=None):
+        # requests drops params set to None, httpx would send them empty
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+        if self.single_flight is not None and method.upper() == 'GET':
+            request_headers = httpx.Headers(self.headers)
+            request_headers.update(headers or {})
+            key = single_flight_key(method, url, params, request_headers)
+            return await self.single_flight.do(key, lambda: self._request_with_retries(method, url, params, data, operation, page, headers))
+        return await self._request_with_retries(method, url, params, data, operation, page, headers)
+
+    async def _request_with_retries(self, method, url, params, data, operation, page, headers):
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve())
+            try:
+                response = await self._send(method, url, params, data, operation, page, attempt, headers)
+            except httpx.TransportError:
+                if self.retry_policy is None or not self.retry_policy.should_retry_error(method, attempt):
+                    raise
+                await asyncio.sleep(self.retry_policy.get_delay(attempt))
+                attempt += 1
+                continue
+            if self.retry_policy is None or not self.retry_policy.should_retry(method, response.status_code, attempt):
+                return response
+            delay = self.retry_policy.get_delay(attempt, response)
+            if response.status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, method, url, params, data, operation, page, attempt, headers):
+        if not self.instrumentation.enabled:
+            return await self.client.request(method, url, params=params, content=data, headers=headers)
+        event = RequestEvent(operation or method.lower() + ' ' + urlsplit(url).path, method, url, page=page, attempt=attempt,
+            request_size=Instrumentation.payload_size(data))
+        self.instrumentation.before_request(event)
+        started_at = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, params=params, content=data, headers=headers)
+        except Exception as error:
+            event.latency = time.perf_counter() - started_at
+            event.error = error
+            self.instrumentation.after_response(event)
+            raise
+        event.latency = time.perf_counter() - started_at
+        event.status_code = response.status_code
+        event.response_size = len(response.content)
+        self.instrumentation.after_response(event)
+        return response
+
+    async def get(self, url, params=None, operation=None, page=None, headers=None):
+        return await self.request('GET', url, params=params, operation=operation, page=page, headers=headers)
+
+    async def post(self, url, params=None, data=None, operation=None, headers=None):
+        return await self.request('POST', url, params=params, data=data, operation=operation, headers=headers)
+
+    async def put(self, url, params=None, data=None, operation=None, headers=None):
+        return await self.request('PUT', url, params=params, data=data, operation=operation, headers=headers)
+
+    async def delete(self, url, params=None, data=None, operation=None, headers=None):
+        return await self.request('DELETE', url, params=params, data=data, operation=operation, headers=headers)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+# Async counterpart of ScopedSession, sharing the wrapped session's connection pool
+class AsyncScopedSession:
+    def __init__(self, session, scoped_headers):
+        self.session = session
+        self.scoped_headers = scoped_headers
+
+    @property
+    def headers(self):
+        headers = httpx.Headers(self.session.headers)
+        headers.update(self.scoped_headers)
+        return headers
+
+    async def request(self, method, url, headers=None, **kwargs):
+        request_headers = httpx.Headers(self.scoped_headers)
+        request_headers.update(headers or {})
+        return await self.session.request(method, url, headers=request_headers, **kwargs)
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request('PUT', url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request('DELETE', url, **kwargs)
+
+    async def aclose(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
@@ -0,0 +1,113 @@
+import asyncio
+import heapq
+from collections import deque
+from .sharded_scan import ShardedScan
+
+# Marks the end of a shard in its queue
+_SHARD_DONE = object()
+
+class AsyncShardedScan:
+    date_range_shards = staticmethod(ShardedScan.date_range_shards)
+    domain_shards = staticmethod(ShardedScan.domain_shards)
+
+    def __init__(self, links, shards, max_workers=4, order_by='', order_dir='', list_params=None, queue_size=2):
+        if len(shards) == 0:
+            raise ValueError('At least one shard must be specified.')
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        self.links = links
+        self.shards = shards
+        self.max_workers = max_workers
+        self.order_by = order_by
+        self.order_dir = order_dir
+        self.list_params = list_params or {}
+        self.queue_size = queue_size
+
+    def __aiter__(self):
+        return self._iterate()
+
+    # Every shard is walked by its own task, and at most max_workers page requests are in flight across all of them. A task
+    # stops fetching while queue_size of its shard's pages wait to be consumed.
+    async def _iterate(self):
+        # The API lists newest first when no direction is given
+        order_dir = self.order_dir or 'desc'
+        list_params = dict(self.list_params, order_by=self.order_by, order_dir=order_dir)
+        requests = asyncio.Semaphore(self.max_workers)
+        if self.order_by:
+            queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.shards]
+        else:
+            queues = [asyncio.Queue(maxsize=self.queue_size * len(self.shards))] * len(self.shards)
+        walkers = [asyncio.ensure_future(self._walk(dict(list_params, **shard), queue, requests)) for shard, queue in zip(self.shards, queues)]
+        if self.order_by:
+            links = self._merged(queues, reverse=order_dir.lower() == 'desc')
+        else:
+            links = self._arrived(queues[0], len(walkers))
+        try:
+            async for link in links:
+                yield link
+        finally:
+            await links.aclose()
+            for walker in walkers:
+                walker.cancel()
+
+    async def _walk(self, list_params, queue, requests):
+        try:
+            async with requests:
+                page = await self.links.list(**list_params)
+            while page is not None and page.current_items_count > 0:
+                await queue.put(list(page.current_items))
+                iteration_count = page.iteration_count
+                async with requests:
+                    await page.next()
+                if page.iteration_count == iteration_count:
+                    break
+        except Exception as error:
+            await queue.put(error)
+        else:
+            await queue.put(_SHARD_DONE)
+
+    async def _next_page(self, queue):
+        page = await queue.get()
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    # Yields links page by page in the order pages arrive from any shard
+    async def _arrived(self, queue, shard_count):
+        while shard_count > 0:
+            page = await self._next_page(queue)
+            if page is _SHARD_DONE:
+                shard_count -= 1
+                continue
+            for link in page:
+                yield link
+
+    # Keeps the next link of every shard on a heap, ties going to the earlier shard as with heapq.merge
+    async def _merged(self, queues, reverse):
+        remaining = [deque() for _ in queues]
+        heap = []
+        for index in range(len(queues)):
+            await self._push_next(heap, index, queues[index], remaining, reverse)
+        while heap:
+            _, index, link = heapq.heappop(heap)
+            yield link
+            await self._push_next(heap, index, queues[index], remaining, reverse)
+
+    async def _push_next(self, heap, index, queue, remaining, reverse):
+        while not remaining[index]:
+            page = await self._next_page(queue)
+            if page is _SHARD_DONE:
+                return
+            remaining[index].extend(page)
+        link = remaining[index].popleft()
+        key = link.get(self.order_by) or ''
+        heapq.heappush(heap, (_Descending(key) if reverse else key, index, link))
+
+class _Descending:
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
@@ -0,0 +1,35 @@
+import asyncio
+
+class _SharedCall:
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+class AsyncSingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self.coalesced = 0
+
+    # The call runs as a task shared by every caller of the same key. A caller being cancelled, the first one included, only
+    # stops its own wait; the task itself is cancelled once no caller is waiting for it any more.
+    async def do(self, key, fn):
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _SharedCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda task: self._forget(key, call))
+        else:
+            self.coalesced += 1
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def _forget(self, key, call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def stats(self):
+        return {"in_flight": len(self._calls), "coalesced": self.coalesced}
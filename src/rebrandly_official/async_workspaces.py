@@ -0,0 +1,49 @@
+from .concurrency import gather
+from .workspaces import Workspaces
+from .models import Workspace, Domain
+from .async_paginated_response import AsyncPaginatedResponse
+
+class AsyncWorkspaces(Workspaces):
+    async def create(self, name, type, domain_ids=[]):
+        workspace_type = type.lower()
+        if workspace_type not in self.WORKSPACE_TYPES:
+            workspace_types_str = ", ".join(self.WORKSPACE_TYPES)
+            raise ValueError(f'Workspace type must be one of the following: {workspace_types_str}')
+        workspace_config = {"name":name, "type":type}
+        data = self.codec.dumps(workspace_config)
+        response = await self.session.post(self.base_workspaces_uri, data=data, operation='workspaces.create')
+        workspace = self.evaluate_response_status_code_return_object(response, 'Create', '')
+        await gather(self._associate_domain(workspace["id"], domain_id) for domain_id in domain_ids)
+        return workspace
+
+    async def _associate_domain(self, workspace_id, domain_id):
+        add_domain_to_workspace_url = self.base_workspaces_uri + '/' + workspace_id + '/domains/' + domain_id
+        add_domain_response = await self.session.post(add_domain_to_workspace_url, operation='workspaces.associate_domain')
+        return self.evaluate_response_status_code_return_object(add_domain_response, 'Associate domains', workspace_id)
+
+    async def get(self, workspace_id):
+        url = self.base_workspaces_uri + '/' + workspace_id
+        response = await self.session.get(url, operation='workspaces.get')
+        return self._as_model(Workspace, self.evaluate_response_status_code_return_object(response, 'Get', ''))
+
+    async def list(self):
+        response = await self.session.get(self.base_workspaces_uri, operation='workspaces.list', page=1)
+        workspaces = self.evaluate_response_status_code_return_object(response, 'List', 'all')
+        if type(workspaces) == list:
+            return AsyncPaginatedResponse(response, self.session, items=workspaces, codec=self.codec, model=Workspace if self.use_models else None, operation='workspaces.list')
+
+    async def update(self, workspace_id, name=''):
+        url = self.base_workspaces_uri + '/' + workspace_id
+        data = self.codec.dumps({"name":name})
+        response = await self.session.post(url, data=data, operation='workspaces.update')
+        return self.evaluate_response_status_code_return_object(response, 'Update', workspace_id)
+
+    async def delete(self, workspace_id):
+        url = self.base_workspaces_uri + '/' + workspace_id
+        response = await self.session.delete(url, operation='workspaces.delete')
+        return self.evaluate_response_status_code_return_object(response, 'Delete', workspace_id)
+
+    async def get_domains(self, workspace_id):
+        url = self.base_workspaces_uri + '/' + workspace_id + '/domains'
+        response = await self.session.get(url, operation='workspaces.get_domains')
+        return self._as_model(Domain, self.evaluate_response_status_code_return_object(response, 'Get domains', workspace_id))
@@ -0,0 +1,31 @@
+class BulkCreateResult:
+    def __init__(self, total_count=0):
+        self.total_count = total_count
+        # Both are keyed by the index of the link in the input sequence
+        self.created = {}
+        self.errors = {}
+
+    def __repr__(self):
+        return f"BulkCreateResult(created={len(self.created)}, failed={len(self.errors)}, total={self.total_count})"
+
+    @property
+    def succeeded_indices(self):
+        return sorted(self.created)
+
+    @property
+    def failed_indices(self):
+        return sorted(self.errors)
+
+    @property
+    def created_links(self):
+        return [self.created[index] for index in self.succeeded_indices]
+
+    @property
+    def ok(self):
+        return len(self.errors) == 0
+
+    def add_success(self, index, link):
+        self.created[index] = link
+
+    def add_failure(self, index, error):
+        self.errors[index] = error
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from .rebrandly_client import RebrandlyClient
+from .rate_limiter import TokenBucketRateLimiter
+from .session import ScopedSession
+from .concurrency import ConcurrentExecutor
+
+# Limits the requests in flight across all tenants. When requests are waiting, freed slots go to tenants in round robin
+# order, so a tenant with many queued requests gets one slot per turn like everyone else instead of all of them.
+class FairScheduler:
+    def __init__(self, max_concurrency=16):
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1.')
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        # Requests started per tenant
+        self.started = {}
+        # Tenant -> deque of events of its waiting requests, in the order tenants get their next turn
+        self._waiting = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, tenant):
+        with self._lock:
+            if self.in_flight < self.max_concurrency and not self._waiting:
+                self._start(tenant)
+                return
+            granted = threading.Event()
+            self._waiting.setdefault(tenant, deque()).append(granted)
+        granted.wait()
+
+    def release(self):
+        with self._lock:
+            self.in_flight -= 1
+            while self.in_flight < self.max_concurrency and self._waiting:
+                tenant, waiting = self._waiting.popitem(last=False)
+                granted = waiting.popleft()
+                # A tenant with more waiting requests goes to the back of the line
+                if waiting:
+                    self._waiting[tenant] = waiting
+                self._start(tenant)
+                granted.set()
+
+    def _start(self, tenant):
+        self.in_flight += 1
+        self.started[tenant] = self.started.get(tenant, 0) + 1
+
+    def queued(self, tenant=None):
+        with self._lock:
+            if tenant is not None:
+                return len(self._waiting.get(tenant, ()))
+            return sum(len(waiting) for waiting in self._waiting.values())
+
+# Entered around every attempt of a tenant's request. The tenant's own budget is spent before a shared slot is taken, the slot
+# is given back before any retry backoff, and a 429 pauses only this tenant's budget, so a throttled tenant never holds a slot.
+class TenantGate:
+    def __init__(self, tenant, scheduler, rate_limiter=None, sleep=time.sleep):
+        self.tenant = tenant
+        self.scheduler = scheduler
+        self.rate_limiter = rate_limiter
+        self.sleep = sleep
+
+    def enter(self):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        self.scheduler.acquire(self.tenant)
+
+    def exit(self):
+        self.scheduler.release()
+
+    def throttle(self, seconds):
+        if self.rate_limiter is not None:
+            self.rate_limiter.pause(seconds)
+        else:
+            self.sleep(seconds)
+
+class TenantSession(ScopedSession):
+    def __init__(self, session, scoped_headers, tenant, scheduler, rate_limiter=None):
+        super().__init__(session, scoped_headers)
+        self.tenant = tenant
+        self.scheduler = scheduler
+        self.rate_limiter = rate_limiter
+        self.gate = TenantGate(tenant, scheduler, rate_limiter)
+
+    def request(self, method, url, *args, **kwargs):
+        return super().request(method, url, *args, gate=self.gate, **kwargs)
+
+# Serves many api keys over one set of connection pools. Every api key gets a client with its own rate budget and queue,
+# and its own executor of tenant_max_workers threads for fan-outs such as bulk_create_chunked or get_many, so a busy tenant's
+# tasks never queue ahead of another's. client_options are passed to the shared RebrandlyClient, e.g. transport, pool_maxsize,
+# retry_policy or link_cache.
+class RebrandlyClientPool:
+    def __init__(self, rate=None, burst=None, max_concurrency=16, tenant_max_workers=4, **client_options):
+        # Default budget, in requests per second, for api keys added without their own
+        self.rate = rate
+        self.burst = burst
+        self.tenant_max_workers = tenant_max_workers
+        self.scheduler = FairScheduler(max_concurrency)
+        client_options.setdefault('pool_maxsize', max_concurrency)
+        self.root = RebrandlyClient('', **client_options)
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    # Returns the client for api_key, created on first use. rate and burst only apply when it is created.
+    def client(self, api_key, rate=None, burst=None):
+        with self._lock:
+            client = self._clients.get(api_key)
+            if client is None:
+                client = self._clients[api_key] = self._create_client(api_key, rate or self.rate, burst or self.burst)
+            return client
+
+    def _create_client(self, api_key, rate, burst):
+        client = self.root.with_api_key(api_key)
+        rate_limiter = TokenBucketRateLimiter(rate, burst) if rate else None
+        client._session = TenantSession(self.root.session, client._scoped_headers, api_key, self.scheduler, rate_limiter=rate_limiter)
+        # Threads are only started when the tenant first fans out
+        client._executor = ConcurrentExecutor(max_workers=self.tenant_max_workers)
+        return client
+
+    def remove(self, api_key):
+        with self._lock:
+            client = self._clients.pop(api_key, None)
+        if client is not None:
+            client._executor.shutdown(wait=False)
+
+    def stats(self):
+        with self._lock:
+            clients = dict(self._clients)
+        return {
+            "in_flight": self.scheduler.in_flight,
+            "queued": self.scheduler.queued(),
+            "tenants": {api_key: {"requests": self.scheduler.started.get(api_key, 0), "queued": self.scheduler.queued(api_key)} for api_key in clients}
+        }
+
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            client._executor.shutdown()
+        self.root.session.close()
+        if self.root._executor is not None:
+            self.root._executor.shutdown()
@@ -0,0 +1,29 @@
+import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class JsonCodec:
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    # Accepts the raw response bytes so bodies are never decoded to str first
+    def loads(self, data):
+        return json.loads(data)
+
+class OrjsonCodec:
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with: pip install orjson")
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+def default_codec():
+    if orjson is not None:
+        return OrjsonCodec()
+    return JsonCodec()
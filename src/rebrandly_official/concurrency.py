@@ -0,0 +1,111 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait as wait_for_futures
+from requests.exceptions import HTTPError
+
+class BatchError(HTTPError):
+    def __init__(self, message, errors):
+        super().__init__(message)
+        # Maps the index of each failed item to its exception
+        self.errors = errors
+
+# Raises a single failure as is. Several are raised together as a BatchError that is also an instance of the closest class
+# all of them share, so callers catching e.g. ValueError around a fan-out still catch it. Classes that can't be combined with
+# BatchError, such as AttributeError, whose layout conflicts with OSError, give a plain BatchError.
+def raise_errors(errors, item_count):
+    if len(errors) == 1:
+        raise next(iter(errors.values()))
+    raise _batch_error_class(_common_error_class(errors.values()))(f"{len(errors)} of {item_count} concurrent requests failed", errors)
+
+def _common_error_class(errors):
+    errors = list(errors)
+    for error_class in type(errors[0]).__mro__:
+        if all(isinstance(error, error_class) for error in errors):
+            return error_class
+
+_batch_error_classes = {}
+
+def _batch_error_class(error_class):
+    if issubclass(BatchError, error_class):
+        return BatchError
+    if error_class not in _batch_error_classes:
+        try:
+            _batch_error_classes[error_class] = type(f'Batch{error_class.__name__}', (BatchError, error_class), {})
+        except TypeError:
+            _batch_error_classes[error_class] = BatchError
+    return _batch_error_classes[error_class]
+
+# The asyncio counterpart of ConcurrentExecutor.map: every awaitable runs to completion and failures are raised the same way
+async def gather(awaitables, return_exceptions=False):
+    # Imported here so the sync client does not load asyncio
+    import asyncio
+    outcomes = await asyncio.gather(*awaitables, return_exceptions=True)
+    errors = {index: outcome for index, outcome in enumerate(outcomes) if isinstance(outcome, BaseException)}
+    if errors and not return_exceptions:
+        raise_errors(errors, len(outcomes))
+    return outcomes
+
+class ConcurrentExecutor:
+    def __init__(self, max_workers=8):
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._worker_state = threading.local()
+
+    # The thread pool is only started the first time work is submitted
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='rebrandly')
+            return self._executor
+
+    def _run_as_worker(self, fn, args, kwargs):
+        self._worker_state.active = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._worker_state.active = False
+
+    def submit(self, fn, *args, **kwargs):
+        return self._get_executor().submit(self._run_as_worker, fn, args, kwargs)
+
+    # Calls fn for every item and returns the results in input order once all calls have finished.
+    # A single failure is re-raised as is, several are raised together as a BatchError.
+    # With return_exceptions, failures are returned in place of their results instead.
+    def map(self, fn, items, max_concurrency=None, return_exceptions=False):
+        items = list(items)
+        # Waiting on the pool from one of its own workers could deadlock, so nested fan-outs run inline
+        if getattr(self._worker_state, 'active', False):
+            outcomes = [self._call(fn, item) for item in items]
+        else:
+            outcomes = self._map_concurrently(fn, items, max_concurrency or self.max_workers)
+        errors = {index: outcome for index, (succeeded, outcome) in enumerate(outcomes) if not succeeded}
+        if errors and not return_exceptions:
+            raise_errors(errors, len(items))
+        return [outcome for _, outcome in outcomes]
+
+    def _call(self, fn, item):
+        try:
+            return (True, fn(item))
+        except Exception as error:
+            return (False, error)
+
+    def _map_concurrently(self, fn, items, max_concurrency):
+        outcomes = [None] * len(items)
+        pending = {}
+        next_index = 0
+        while next_index < len(items) or pending:
+            while next_index < len(items) and len(pending) < max_concurrency:
+                pending[self.submit(self._call, fn, items[next_index])] = next_index
+                next_index += 1
+            done, _ = wait_for_futures(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcomes[pending.pop(future)] = future.result()
+        return outcomes
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
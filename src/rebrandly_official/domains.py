@@ -1,19 +1,23 @@
 from .paginated_response import PaginatedResponse
-import json
+from .codec import default_codec
+from .models import Domain
 from requests.exceptions import HTTPError
 
 class Domains:
-    def __init__(self, session):
+    def __init__(self, session, codec=None, use_models=False, api_url='https://api.rebrandly.com/'):
         self.session = session
-        self.base_domains_uri = 'https://api.rebrandly.com/v1/domains'
+        self.codec = codec or default_codec()
+        self.use_models = use_models
+        self.base_domains_uri = api_url + 'v1/domains'
 
     def evaluate_response_status_code_return_object(self, response, request_type, object_id):
         if response.status_code == 200:
-            return json.loads(response.text)
+            return self.codec.loads(response.content)
         else:
             raise HTTPError(f"{request_type} request failed for domain with id {object_id}", response)
 
     def list(self):
-        response = self.session.get(self.base_domains_uri)
-        if type(self.evaluate_response_status_code_return_object(response, 'List', 'all')) == list:
-            return PaginatedResponse(response, self.session)
\ No newline at end of file
+        response = self.session.get(self.base_domains_uri, operation='domains.list', page=1)
+        domains = self.evaluate_response_status_code_return_object(response, 'List', 'all')
+        if type(domains) == list:
+            return PaginatedResponse(response, self.session, items=domains, codec=self.codec, model=Domain if self.use_models else None, operation='domains.list')
\ No newline at end of file
@@ -0,0 +1,132 @@
+import bisect
+import threading
+
+class RequestEvent:
+    __slots__ = ('operation', 'method', 'url', 'page', 'attempt', 'request_size', 'status_code', 'response_size', 'latency', 'error')
+
+    def __init__(self, operation, method, url, page=None, attempt=0, request_size=0):
+        self.operation = operation
+        self.method = method
+        self.url = url
+        # Page number for paginated calls, 1 being the initial request
+        self.page = page
+        # 0 for the first try, incremented for every retry
+        self.attempt = attempt
+        self.request_size = request_size
+        self.status_code = None
+        self.response_size = None
+        self.latency = None
+        self.error = None
+
+    def __repr__(self):
+        return f"RequestEvent(operation={self.operation!r}, status_code={self.status_code!r}, latency={self.latency!r})"
+
+class Instrumentation:
+    def __init__(self):
+        self.request_hooks = []
+        self.response_hooks = []
+
+    @property
+    def enabled(self):
+        return bool(self.request_hooks or self.response_hooks)
+
+    # Called with a RequestEvent before every attempt is sent
+    def on_request(self, hook):
+        self.request_hooks.append(hook)
+        return hook
+
+    # Called with the completed RequestEvent, including failed attempts
+    def on_response(self, hook):
+        self.response_hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook):
+        for hooks in (self.request_hooks, self.response_hooks):
+            if hook in hooks:
+                hooks.remove(hook)
+
+    def before_request(self, event):
+        self._fire(self.request_hooks, event)
+
+    def after_response(self, event):
+        self._fire(self.response_hooks, event)
+
+    # A failing hook must not fail the request it observes
+    def _fire(self, hooks, event):
+        for hook in list(hooks):
+            try:
+                hook(event)
+            except Exception:
+                # Imported on first failure so importing the client does not import logging
+                import logging
+                logging.getLogger(__name__).exception('Instrumentation hook %r failed', hook)
+
+    @staticmethod
+    def payload_size(data):
+        if data is None:
+            return 0
+        if isinstance(data, str):
+            return len(data.encode('utf-8'))
+        return len(data)
+
+class LatencyHistogram:
+    # Upper bounds in seconds, the last bucket catches everything slower
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float('inf'))
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self._operations = {}
+        self._lock = threading.Lock()
+
+    # Register with instrumentation.on_response(histogram)
+    def __call__(self, event):
+        with self._lock:
+            stats = self._operations.get(event.operation)
+            if stats is None:
+                stats = self._operations[event.operation] = {
+                    'count': 0, 'errors': 0, 'retries': 0, 'pages': 0, 'latency_sum': 0.0, 'latency_max': 0.0,
+                    'request_bytes': 0, 'response_bytes': 0, 'bucket_counts': [0] * len(self.buckets)
+                }
+            stats['count'] += 1
+            if event.error is not None or (event.status_code is not None and event.status_code >= 400):
+                stats['errors'] += 1
+            if event.attempt > 0:
+                stats['retries'] += 1
+            if event.page is not None and event.page > 1:
+                stats['pages'] += 1
+            stats['latency_sum'] += event.latency
+            stats['latency_max'] = max(stats['latency_max'], event.latency)
+            stats['request_bytes'] += event.request_size
+            stats['response_bytes'] += event.response_size or 0
+            stats['bucket_counts'][bisect.bisect_left(self.buckets, event.latency)] += 1
+
+    # Upper bound of the bucket holding the given quantile, e.g. 0.99 for p99
+    def percentile(self, operation, quantile):
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None or stats['count'] == 0:
+                return None
+            return self._percentile(stats, quantile)
+
+    def _percentile(self, stats, quantile):
+        rank = quantile * stats['count']
+        seen = 0
+        for upper_bound, bucket_count in zip(self.buckets, stats['bucket_counts']):
+            seen += bucket_count
+            if seen >= rank:
+                return min(upper_bound, stats['latency_max'])
+        return stats['latency_max']
+
+    def snapshot(self):
+        with self._lock:
+            snapshot = {}
+            for operation, stats in self._operations.items():
+                snapshot[operation] = dict(stats, bucket_counts=list(stats['bucket_counts']))
+                snapshot[operation]['latency_avg'] = stats['latency_sum'] / stats['count']
+                snapshot[operation]['p50'] = self._percentile(stats, 0.5)
+                snapshot[operation]['p99'] = self._percentile(stats, 0.99)
+            return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
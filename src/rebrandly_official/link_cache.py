@@ -0,0 +1,87 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+class LinkCache:
+    # Seconds each resource type stays fresh
+    DEFAULT_TTLS = {'link': 60, 'routes': 300, 'deep_links': 300, 'opengraph': 300}
+
+    def __init__(self, max_size=1024, ttls=None, clock=time.monotonic):
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1.')
+        self.max_size = max_size
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()
+        self._keys_by_link_id = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Keys are tuples of (resource, link_id, ...scope)
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        resource = key[0]
+        if resource not in self.ttls:
+            raise KeyError(f'No ttl is configured for resource {resource}.')
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttls[resource], value)
+            self._entries.move_to_end(key)
+            self._keys_by_link_id.setdefault(key[1], set()).add(key)
+            while len(self._entries) > self.max_size:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    # Drops the given resources of a link in every scope, or all of them when none are given
+    def invalidate(self, link_id, *resources):
+        with self._lock:
+            for key in list(self._keys_by_link_id.get(link_id, ())):
+                if not resources or key[0] in resources:
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_link_id.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+    def _remove(self, key):
+        del self._entries[key]
+        link_keys = self._keys_by_link_id.get(key[1])
+        if link_keys is not None:
+            link_keys.discard(key)
+            if not link_keys:
+                del self._keys_by_link_id[key[1]]
@@ -0,0 +1,84 @@
+import gzip
+import json
+
+# Field added to every exported link -> Links method reading it
+SUB_RESOURCES = {'routes': 'list_routes', 'deepLinks': 'list_deep_links', 'opengraph': 'get_opengraph'}
+
+# Paths ending in .gz are gzip compressed
+def open_export(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'wt', encoding='utf-8')
+    return open(path, 'w', encoding='utf-8')
+
+def _as_dict(value):
+    if isinstance(value, list):
+        return [_as_dict(item) for item in value]
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    return value
+
+class ExportSummary:
+    def __init__(self):
+        self.exported_count = 0
+        # Links exported without some of their sub-resources, see export_links
+        self.failed_count = 0
+        self.pages = 0
+        # Latest updatedAt exported, to pass as updated_since on the next incremental export
+        self.watermark = None
+
+    def __repr__(self):
+        return f"ExportSummary(exported={self.exported_count}, failed={self.failed_count}, pages={self.pages}, watermark={self.watermark!r})"
+
+    @property
+    def ok(self):
+        return self.failed_count == 0
+
+    def to_dict(self):
+        return {"exported": self.exported_count, "failed": self.failed_count, "pages": self.pages, "watermark": self.watermark}
+
+    def add(self, link):
+        self.exported_count += 1
+        updated_at = link.get('updatedAt')
+        if updated_at and (self.watermark is None or updated_at > self.watermark):
+            self.watermark = updated_at
+
+# Writes every link of the workspace as one JSON line to output, with the sub_resources named in SUB_RESOURCES added to it.
+# The sub-resources of a page are fetched concurrently on the links executor while the next page loads.
+# With updated_since, links are listed by updatedAt, newest first, and the export stops at the first link older than it.
+# A link whose sub-resources could not all be read is still written, without them and with an "errors" field mapping each
+# missing sub-resource to its error message, and counted in failed_count.
+def export_links(links, output, workspace_id='', updated_since='', sub_resources=tuple(SUB_RESOURCES), page_size=25):
+    for field in sub_resources:
+        if field not in SUB_RESOURCES:
+            raise ValueError(f'sub_resources must be among {", ".join(SUB_RESOURCES)}.')
+    summary = ExportSummary()
+    order_by = 'updatedAt' if updated_since else ''
+    page = links.list(workspace_id=workspace_id, order_by=order_by, order_dir='desc', limit=page_size)
+    while page is not None and page.current_items_count > 0:
+        summary.pages += 1
+        exported = [_as_dict(link) for link in page.current_items]
+        finished = False
+        if updated_since:
+            changed = [link for link in exported if (link.get('updatedAt') or '') >= updated_since]
+            finished = len(changed) < len(exported)
+            exported = changed
+        fetches = [[links.executor.submit(getattr(links, SUB_RESOURCES[field]), link['id'], workspace_id) for field in sub_resources] for link in exported]
+        if not finished:
+            iteration_count = page.iteration_count
+            page.next()
+            finished = page.iteration_count == iteration_count
+        for link, link_fetches in zip(exported, fetches):
+            errors = {}
+            for field, fetch in zip(sub_resources, link_fetches):
+                try:
+                    link[field] = _as_dict(fetch.result())
+                except Exception as error:
+                    errors[field] = error.args[0] if error.args else repr(error)
+            if errors:
+                link['errors'] = errors
+                summary.failed_count += 1
+            output.write(json.dumps(link) + '\n')
+            summary.add(link)
+        if finished:
+            break
+    return summary
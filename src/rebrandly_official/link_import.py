@@ -0,0 +1,72 @@
+import csv
+import json
+
+FORMATS = ('jsonl', 'csv')
+
+def detect_format(path):
+    if path.lower().endswith('.csv'):
+        return 'csv'
+    return 'jsonl'
+
+# Yields one link dict per JSONL line or CSV row without reading the whole file. CSV headers are API fields, with dotted
+# headers for nested ones, e.g. destination,slashtag,domain.id. Empty cells are left out. A line that is not valid JSON
+# is yielded as a ValueError, which the validator reports as that row's error, so the rest of the file is still imported.
+def read_links(file, format='jsonl'):
+    if format == 'jsonl':
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                link = json.loads(line)
+            except ValueError as error:
+                link = ValueError(f'Line {line_number} is not valid JSON: {error}.')
+            yield link
+    elif format == 'csv':
+        for row in csv.DictReader(file):
+            yield _nest_csv_row(row)
+    else:
+        raise ValueError(f'format must be one of {", ".join(FORMATS)}.')
+
+def _nest_csv_row(row):
+    link = {}
+    for header, value in row.items():
+        if header is None or value is None or value == '':
+            continue
+        target = link
+        *parents, field = header.strip().split('.')
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[field] = value
+    return link
+
+class ImportSummary:
+    def __init__(self):
+        self.total_count = 0
+        self.created_count = 0
+        self.failed_count = 0
+
+    def __repr__(self):
+        return f"ImportSummary(created={self.created_count}, failed={self.failed_count}, total={self.total_count})"
+
+    @property
+    def ok(self):
+        return self.failed_count == 0
+
+    def to_dict(self):
+        return {"total": self.total_count, "created": self.created_count, "failed": self.failed_count}
+
+# Creates the links read from source, a JSONL or CSV file object, and writes one JSON line per input row to output as soon
+# as its chunk finishes: {"index": 0, "link": {...}} when created, {"index": 1, "error": "..."} when not.
+def import_links(links, source, output, workspace_id='', format='jsonl', chunk_size=100, max_in_flight=4):
+    summary = ImportSummary()
+    outcomes = links.bulk_create_stream(workspace_id, read_links(source, format), chunk_size=chunk_size, max_in_flight=max_in_flight)
+    for index, created_link, error in outcomes:
+        summary.total_count += 1
+        if error is None:
+            summary.created_count += 1
+            record = {"index": index, "link": created_link}
+        else:
+            summary.failed_count += 1
+            record = {"index": index, "error": error.args[0] if error.args else repr(error)}
+        output.write(json.dumps(record) + '\n')
+    return summary
@@ -0,0 +1,158 @@
+import json
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    workspace TEXT NOT NULL,
+    id TEXT NOT NULL,
+    slashtag TEXT,
+    destination TEXT,
+    domain_id TEXT,
+    domain_name TEXT,
+    creator_id TEXT,
+    title TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    PRIMARY KEY (workspace, id)
+);
+CREATE INDEX IF NOT EXISTS links_id ON links (id);
+CREATE INDEX IF NOT EXISTS links_slashtag ON links (workspace, slashtag);
+CREATE INDEX IF NOT EXISTS links_destination ON links (workspace, destination);
+CREATE INDEX IF NOT EXISTS links_domain ON links (workspace, domain_id);
+CREATE INDEX IF NOT EXISTS links_creator ON links (workspace, creator_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    workspace TEXT PRIMARY KEY,
+    watermark TEXT,
+    generation INTEGER NOT NULL,
+    synced_at REAL
+);
+"""
+
+# Columns find() can filter on, all of them indexed
+_FILTER_COLUMNS = ('id', 'slashtag', 'destination', 'domain_id', 'domain_name', 'creator_id')
+
+class SyncResult:
+    def __init__(self, mode):
+        # 'full' on the first run, 'incremental' afterwards, 'sweep' when an incremental run also walked every link to find deletions
+        self.mode = mode
+        self.upserted = 0
+        self.deleted = 0
+        self.pages = 0
+
+    def __repr__(self):
+        return f"SyncResult(mode={self.mode!r}, upserted={self.upserted}, deleted={self.deleted}, pages={self.pages})"
+
+# Keeps the links of one workspace in a local SQLite database so lookups and reports don't page through the API.
+# The first sync walks every link. Later syncs list links by updatedAt, newest first, and stop at the last change already
+# mirrored. Deletions don't show up in listings, so when the API count differs from the local one every link is walked
+# again and rows that were not seen are removed.
+class LinkMirror:
+    def __init__(self, links, database=':memory:', workspace_id='', page_size=25):
+        self.links = links
+        self.workspace_id = workspace_id
+        self.page_size = page_size
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            self.connection.executescript(_SCHEMA)
+
+    # sweep=True always walks every link, sweep=False never does and None sweeps only when the counts disagree
+    def sync(self, sweep=None):
+        state = self._state()
+        if state is None:
+            return self._full_sync('full', 1)
+        watermark, generation = state
+        result = self._incremental_sync(watermark, generation)
+        if sweep is None:
+            sweep = self.links.count(workspace_id=self.workspace_id) != self.count()
+        if sweep:
+            swept = self._full_sync('sweep', generation + 1)
+            swept.upserted += result.upserted
+            swept.pages += result.pages
+            return swept
+        return result
+
+    def _full_sync(self, mode, generation):
+        result = SyncResult(mode)
+        watermark = None
+        for page in self._pages():
+            if watermark is None:
+                watermark = page[0].get('updatedAt')
+            self._upsert(page, generation)
+            result.upserted += len(page)
+            result.pages += 1
+        with self._lock, self.connection:
+            result.deleted = self.connection.execute('DELETE FROM links WHERE workspace = ? AND generation < ?', (self.workspace_id, generation)).rowcount
+        self._save_state(watermark, generation)
+        return result
+
+    # Links with updatedAt equal to the watermark are fetched again, so changes made within the same second are not missed
+    def _incremental_sync(self, watermark, generation):
+        result = SyncResult('incremental')
+        new_watermark = watermark
+        for page in self._pages():
+            result.pages += 1
+            changed = [link for link in page if (link.get('updatedAt') or '') >= (watermark or '')]
+            if changed:
+                if new_watermark is None or changed[0].get('updatedAt') > new_watermark:
+                    new_watermark = changed[0].get('updatedAt')
+                self._upsert(changed, generation)
+                result.upserted += len(changed)
+            if len(changed) < len(page):
+                break
+        self._save_state(new_watermark, generation)
+        return result
+
+    def _pages(self):
+        page = self.links.list(workspace_id=self.workspace_id, order_by='updatedAt', order_dir='desc', limit=self.page_size)
+        while page is not None and page.current_items_count > 0:
+            yield [link.to_dict() if hasattr(link, 'to_dict') else link for link in page.current_items]
+            iteration_count = page.iteration_count
+            page.next()
+            if page.iteration_count == iteration_count:
+                return
+
+    def _upsert(self, links, generation):
+        rows = [self._row(link, generation) for link in links]
+        with self._lock, self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def _row(self, link, generation):
+        domain = link.get('domain') or {}
+        creator = link.get('creator') or {}
+        return (self.workspace_id, link['id'], link.get('slashtag'), link.get('destination'), link.get('domainId') or domain.get('id'),
+            link.get('domainName') or domain.get('fullName'), creator.get('id'), link.get('title'), link.get('createdAt'),
+            link.get('updatedAt'), json.dumps(link), generation)
+
+    def _state(self):
+        with self._lock:
+            return self.connection.execute('SELECT watermark, generation FROM sync_state WHERE workspace = ?', (self.workspace_id,)).fetchone()
+
+    def _save_state(self, watermark, generation):
+        with self._lock, self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)', (self.workspace_id, watermark, generation, time.time()))
+
+    def get(self, link_id):
+        links = self.find(id=link_id)
+        return links[0] if links else None
+
+    # Returns the mirrored links matching every filter, e.g. find(domain_name='rebrand.ly', slashtag='promo')
+    def find(self, **filters):
+        for column in filters:
+            if column not in _FILTER_COLUMNS:
+                raise KeyError(f'Links can only be filtered by {", ".join(_FILTER_COLUMNS)}.')
+        sql = 'SELECT data FROM links WHERE workspace = ?' + ''.join(f' AND {column} = ?' for column in filters) + ' ORDER BY updated_at DESC'
+        with self._lock:
+            rows = self.connection.execute(sql, (self.workspace_id, *filters.values())).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self):
+        with self._lock:
+            return self.connection.execute('SELECT COUNT(*) FROM links WHERE workspace = ?', (self.workspace_id,)).fetchone()[0]
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,77 @@
+from collections.abc import Mapping
+
+class ValidationReport:
+    def __init__(self):
+        self.total_count = 0
+        self.valid_count = 0
+        # Maps the index of each invalid link to every KeyError or ValueError found for it
+        self.errors = {}
+
+    def __repr__(self):
+        return f"ValidationReport(valid={self.valid_count}, invalid={len(self.errors)}, total={self.total_count})"
+
+    @property
+    def ok(self):
+        return len(self.errors) == 0
+
+    @property
+    def invalid_indices(self):
+        return sorted(self.errors)
+
+    # Number of invalid links per error message, to see at a glance what an import gets wrong
+    def summary(self):
+        counts = {}
+        for errors in self.errors.values():
+            for error in errors:
+                message = error.args[0]
+                counts[message] = counts.get(message, 0) + 1
+        return counts
+
+class LinkValidator:
+    # Same rules and messages as the check run by bulk_create, but every problem of a link is reported
+    # A row that could not be read may be passed as its exception, which is then its only error
+    def link_errors(self, link):
+        if isinstance(link, Exception):
+            return [link]
+        if not isinstance(link, Mapping):
+            return [ValueError('Every link must be a dictionary.')]
+        errors = []
+        if not link.get("destination"):
+            errors.append(KeyError('Destination must be specified for every link.'))
+        if "domain" in link and "domainId" in link:
+            errors.append(KeyError('Specify the domain only once per link.'))
+        elif "domainId" in link:
+            if not link["domainId"]:
+                errors.append(ValueError('domainId key must have a valid value specified.'))
+        elif "domain" in link:
+            if "id" not in link["domain"]:
+                errors.append(KeyError('Domain object must have id key specified.'))
+            elif not link["domain"]["id"]:
+                errors.append(ValueError('Domain object must have a valid value for id key.'))
+        else:
+            errors.append(KeyError('A key specifying the domain or domainId must exist for every link.'))
+        return errors
+
+    # Yields (index, link) for every valid link while errors are recorded in report, so valid links can be sent on before the whole input is read.
+    # Links reusing a slashtag already taken on the same domain earlier in the input are reported as well.
+    def iter_valid(self, links, report):
+        slashtags = {}
+        for index, link in enumerate(links):
+            report.total_count += 1
+            errors = self.link_errors(link)
+            if not errors and link.get("slashtag"):
+                domain_id = link.get("domainId") or link["domain"]["id"]
+                first_index = slashtags.setdefault((domain_id, link["slashtag"]), index)
+                if first_index != index:
+                    errors.append(ValueError(f'Slashtag {link["slashtag"]} is already used by the link at index {first_index}.'))
+            if errors:
+                report.errors[index] = errors
+            else:
+                report.valid_count += 1
+                yield index, link
+
+    def validate(self, links):
+        report = ValidationReport()
+        for _ in self.iter_valid(links, report):
+            pass
+        return report
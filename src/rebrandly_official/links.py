@@ -1,16 +1,31 @@
 from .paginated_response import PaginatedResponse
-import json
-from requests.exceptions import HTTPError
+from .bulk_create_result import BulkCreateResult
+from .sharded_scan import ShardedScan
+from .codec import default_codec
+from .models import Link, Route, DeepLink
+from .concurrency import ConcurrentExecutor
+from .link_validator import LinkValidator, ValidationReport
+from collections import deque
+from requests.exceptions import HTTPError, RequestException
 
 class Links:
-    def __init__(self, session):
+    BULK_CREATE_CHUNK_SIZE = 100
+    # Most links the API returns per page of a listing
+    LIST_PAGE_SIZE = 25
+
+    def __init__(self, session, cache=None, codec=None, use_models=False, executor=None, api_url='https://api.rebrandly.com/', enterprise_api_url='https://enterprise-api.rebrandly.com/'):
         self.session = session
-        self.base_uri = 'https://api.rebrandly.com/v1'
-        self.base_links_uri = 'https://api.rebrandly.com/v1/links'
-        self.base_enterprise_links_uri = 'https://enterprise-api.rebrandly.com/v1/links'
+        self.cache = cache
+        self.codec = codec or default_codec()
+        self.use_models = use_models
+        self.executor = executor or ConcurrentExecutor()
+        self.validator = LinkValidator()
+        self.base_uri = api_url + 'v1'
+        self.base_links_uri = self.base_uri + '/links'
+        self.base_enterprise_links_uri = enterprise_api_url + 'v1/links'
 
     def evaluate_response_status_code_return_object(self, response, request_type, object_type, object_id):
-        response_json = json.loads(response.text)
+        response_json = self.codec.loads(response.content)
         if response.status_code == 200:
             if response_json:
                 return response_json
@@ -36,24 +51,100 @@ class Links:
 
     def evaluate_response_status_code_return_count(self, response, request_type, object_type, object_id):
         if response.status_code == 200:
-            response_json = json.loads(response.text)
+            response_json = self.codec.loads(response.content)
             return response_json['count']
         elif response.status_code == 401:
             raise HTTPError(f"{request_type} request failed for {object_type} with id {object_id}. Please ensure a valid api key is set.")
         else:
             raise HTTPError(f"{request_type} request failed for {object_type} with id {object_id}", response)
 
+    # With use_models, results are returned as slotted model objects instead of dicts
+    def _as_model(self, model, value):
+        if not self.use_models:
+            return value
+        if isinstance(value, list):
+            return model.from_list(value)
+        if isinstance(value, dict):
+            return model(value)
+        return value
+
+    # Reads are served from the optional LinkCache. Keys include the workspace and api key the request is made with.
+    def _cache_key(self, resource, link_id, workspace_id):
+        headers = self.session.headers
+        return (resource, link_id, workspace_id or '', headers.get('workspace') or '', headers.get('apikey') or '')
+
+    def _get_cached(self, resource, link_id, workspace_id):
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(resource, link_id, workspace_id))
+
+    def _set_cached(self, resource, link_id, workspace_id, value):
+        if self.cache is not None:
+            self.cache.set(self._cache_key(resource, link_id, workspace_id), value)
+
+    def _invalidate_cached(self, link_id, *resources):
+        if self.cache is not None:
+            self.cache.invalidate(link_id, *resources)
+
     def get(self, link_id, workspace_id=None):
+        cached_link = self._get_cached('link', link_id, workspace_id)
+        if cached_link is not None:
+            return self._as_model(Link, cached_link)
         url = self.base_links_uri + '/' + link_id
         params = {
             'workspace':workspace_id
         }
-        response = self.session.get(url, params=params)
-        return self.evaluate_response_status_code_return_object(response, 'Get', 'link', link_id)
+        response = self.session.get(url, params=params, operation='links.get')
+        link = self.evaluate_response_status_code_return_object(response, 'Get', 'link', link_id)
+        self._set_cached('link', link_id, workspace_id, link)
+        return self._as_model(Link, link)
+
+    # Reads each distinct id once, with at most max_workers requests in flight, and returns the links in input order with the
+    # exception in place of each link that could not be read. The API has no filter for several ids. With use_listing, when
+    # listing the whole workspace takes fewer requests than reading the ids one by one the listing is used, and only ids it
+    # lacks are read. That saves rate budget but is usually slower, since pages are read one after another.
+    def get_many(self, link_ids, workspace_id=None, max_workers=8, return_exceptions=True, use_listing=False):
+        unique_ids = list(dict.fromkeys(link_ids))
+        found = {}
+        for link_id in unique_ids:
+            cached_link = self._get_cached('link', link_id, workspace_id)
+            if cached_link is not None:
+                found[link_id] = self._as_model(Link, cached_link)
+        missing = [link_id for link_id in unique_ids if link_id not in found]
+        if use_listing and len(missing) > self.LIST_PAGE_SIZE and self._listing_is_cheaper(len(missing), workspace_id):
+            found.update(self._find_listed(set(missing), workspace_id))
+            missing = [link_id for link_id in missing if link_id not in found]
+        read_link = lambda link_id: self.get(link_id, workspace_id=workspace_id)
+        found.update(zip(missing, self.executor.map(read_link, missing, max_concurrency=max_workers, return_exceptions=return_exceptions)))
+        return [found[link_id] for link_id in link_ids]
 
-    def update(self, link_id, destination, title, favourite='', description='', workspace_id=''):
-        if favourite is not None:
+    def _listing_is_cheaper(self, link_count, workspace_id):
+        page_count = self.count(workspace_id=workspace_id or '') // self.LIST_PAGE_SIZE + 1
+        return page_count < link_count
+
+    # Walks the listing until every wanted id was seen, caching the links found
+    def _find_listed(self, link_ids, workspace_id):
+        found = {}
+        page = self.list(workspace_id=workspace_id or '', limit=self.LIST_PAGE_SIZE)
+        if page is None:
+            return found
+        for link in page.iter_all():
+            if link['id'] in link_ids:
+                found[link['id']] = link
+                self._set_cached('link', link['id'], workspace_id, link.to_dict() if self.use_models else link)
+                if len(found) == len(link_ids):
+                    break
+        return found
+
+    # favourite '' or None leaves it as is. Compared with the link's prior state, given as current or found in the cache,
+    # requests that would not change anything are skipped, so an update changing nothing sends no request at all.
+    def update(self, link_id, destination, title, favourite='', description='', workspace_id='', current=None):
+        current = self._known_link(link_id, workspace_id, current)
+        send_favourite, send_body = self._update_requests(destination, title, favourite, description, current)
+        if send_favourite:
             self.favourite(link_id, favourite, workspace_id=workspace_id)
+        if not send_body:
+            return self._as_model(Link, dict(current, favourite=favourite) if send_favourite else current)
         url = self.base_links_uri + '/' + link_id
         body = {
             'destination':destination,
@@ -61,17 +152,64 @@ class Links:
         }
         if description:
             body["description"] = description
-        data = json.dumps(body)
-        response = self.session.post(url, params={"workspace":workspace_id}, data=data)
-        return self.evaluate_response_status_code_return_object(response, 'Update', 'link', link_id)
+        data = self.codec.dumps(body)
+        response = self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.update')
+        self._invalidate_cached(link_id, 'link')
+        return self._as_model(Link, self.evaluate_response_status_code_return_object(response, 'Update', 'link', link_id))
+
+    def _known_link(self, link_id, workspace_id, current):
+        if current is None:
+            current = self._get_cached('link', link_id, workspace_id)
+        if hasattr(current, 'to_dict'):
+            current = current.to_dict()
+        return current
+
+    # Whether the favourite and the update requests would change the link, assuming they would when its state is unknown
+    def _update_requests(self, destination, title, favourite, description, current):
+        send_favourite = favourite not in ('', None) and (current is None or current.get('favourite') != favourite)
+        send_body = (current is None or destination != current.get('destination') or title != current.get('title')
+            or bool(description) and description != current.get('description'))
+        return send_favourite, send_body
+
+    # Arguments of update() for a dict holding the link id and the fields to change, the others taken from current
+    def _update_arguments(self, update, current):
+        known = current or {}
+        return {
+            'link_id': update['id'],
+            'destination': update['destination'] if 'destination' in update else known.get('destination'),
+            'title': update['title'] if 'title' in update else known.get('title'),
+            'favourite': update.get('favourite'),
+            'description': update.get('description', ''),
+            'current': current
+        }
+
+    def _index_known_links(self, current):
+        if current is None:
+            return {}
+        if isinstance(current, dict):
+            return current
+        return {link['id']: link for link in current}
+
+    # updates are dicts with the id of a link and the fields to change. current maps link ids to known links, or lists them,
+    # e.g. from a LinkMirror. Links missing from it and from the cache are read first when an update leaves out the destination
+    # or title. Returns the links in input order and raises failures like executor.map.
+    def update_many(self, updates, current=None, workspace_id='', max_workers=4, return_exceptions=False):
+        known_links = self._index_known_links(current)
+        def update_link(update):
+            link = self._known_link(update['id'], workspace_id, known_links.get(update['id']))
+            if link is None and not ('destination' in update and 'title' in update):
+                link = self._known_link(update['id'], workspace_id, self.get(update['id'], workspace_id=workspace_id or None))
+            return self.update(workspace_id=workspace_id, **self._update_arguments(update, link))
+        return self.executor.map(update_link, updates, max_concurrency=max_workers, return_exceptions=return_exceptions)
 
     def favourite(self, link_id, favourite, workspace_id=''):
         url = self.base_links_uri + '/' + link_id + '/favourite'
         body = {
             'favourite':favourite
         }
-        data = json.dumps(body)
-        response = self.session.post(url, params={"workspace":workspace_id}, data=data)
+        data = self.codec.dumps(body)
+        response = self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.favourite')
+        self._invalidate_cached(link_id, 'link')
         return self.evaluate_response_status_code_return_object(response, 'Favourite', 'link', link_id)
 
     def list(self, workspace_id='',order_by='', order_dir='', limit='',favourite='',domain_id='',domain_name='',creator_id='',slashtag='',date_from='',date_to=''):
@@ -89,9 +227,14 @@ class Links:
             'dateFrom':date_from,
             'dateTo':date_to
         }
-        response = self.session.get(url, params=params)
-        if type(self.evaluate_response_status_code_return_object(response, 'List', 'links', 'all_links')) == list:
-            return PaginatedResponse(response, self.session)
+        response = self.session.get(url, params=params, operation='links.list', page=1)
+        links = self.evaluate_response_status_code_return_object(response, 'List', 'links', 'all_links')
+        if type(links) == list:
+            return PaginatedResponse(response, self.session, items=links, codec=self.codec, model=Link if self.use_models else None, operation='links.list')
+
+    # Walks every shard (a dict of list() filters) concurrently. Results are merged in order_by order when it is set.
+    def scan(self, shards, max_workers=4, order_by='', order_dir='', **list_params):
+        return ShardedScan(self, shards, max_workers=max_workers, order_by=order_by, order_dir=order_dir, list_params=list_params)
 
     def create(self, destination, slashtag='', title='', domain_id='', domain_name='', description='', workspace_id=''):
         url = self.base_links_uri
@@ -109,40 +252,129 @@ class Links:
         }
         if description:
             body["description"] = description
-        data = json.dumps(body)
-        response = self.session.post(url, params=params, data=data)
-        return self.evaluate_response_status_code_return_object(response, 'Create', 'link', '')
+        data = self.codec.dumps(body)
+        response = self.session.post(url, params=params, data=data, operation='links.create')
+        return self._as_model(Link, self.evaluate_response_status_code_return_object(response, 'Create', 'link', ''))
 
     def bulk_create(self, workspace_id, links):
-        url = self.base_enterprise_links_uri
         # do we even want to check link validity?
         for link in links:
             self.check_link_validity(link)
-        data = json.dumps(links)
-        response = self.session.put(url, params={"workspace":workspace_id}, data=data)
+        response = self._send_bulk_create(workspace_id, links)
         return self.evaluate_response_status_code_return_object(response, 'Bulk create', 'links', '')
 
-    def check_link_validity(self, link):
-        if (not "destination" in link) or (not link["destination"]):
-            raise KeyError('Destination must be specified for every link.')
+    def _send_bulk_create(self, workspace_id, links):
+        data = self.codec.dumps(links)
+        return self.session.put(self.base_enterprise_links_uri, params={"workspace":workspace_id}, data=data, operation='links.bulk_create')
+
+    # Whether a failed bulk create was turned down because of some of its links, as opposed to the request as a whole
+    # (authentication, a missing feature, an outage or exhausted retries), which splitting the chunk would only repeat
+    def _rejects_individual_links(self, response):
+        if response.status_code not in (403, 404):
+            return False
+        try:
+            response_json = self.codec.loads(response.content)
+        except ValueError:
+            return False
+        if not isinstance(response_json, dict):
+            return False
+        if response.status_code == 404:
+            return response_json.get("code") == 'NotFound' and response_json.get("source") == 'domain'
+        return bool(response_json.get("errors")) and response_json.get("code") != 'OwnerFeatureNotIncluded'
 
-        if "domain" in link and "domainId" in link:
-            raise KeyError('Specify the domain only once per link.')
+    # Splits links into chunks created concurrently. Failures are reported per input index instead of raised.
+    # Slashtags reused within the input are rejected before sending, which bulk_create_stream leaves to the API.
+    def bulk_create_chunked(self, workspace_id, links, chunk_size=BULK_CREATE_CHUNK_SIZE, max_workers=4):
+        result = BulkCreateResult()
+        chunks = self._partition_bulk_create_chunks(links, chunk_size, result)
+        create_chunk = lambda chunk: self._bulk_create_chunk(workspace_id, chunk)
+        for outcomes in self.executor.map(create_chunk, chunks, max_concurrency=max_workers):
+            self._record_bulk_create_outcomes(outcomes, result)
+        return result
 
-        if "domainId" in link:
-            if link["domainId"]:
-                return
+    # Yields (index, created_link, error) for every link in input order while reading links lazily, so any iterable of any size
+    # can be imported with flat memory. At most max_in_flight chunks are pending; reading waits for the oldest to finish.
+    # Slashtags reused within the input are not checked, as that would keep every slashtag in memory; the API rejects them.
+    def bulk_create_stream(self, workspace_id, links, chunk_size=BULK_CREATE_CHUNK_SIZE, max_in_flight=4):
+        if max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1.')
+        pending = deque()
+        for batch in self._stream_bulk_create_batches(links, chunk_size):
+            if len(pending) >= max_in_flight:
+                yield from self._finish_bulk_create_batch(*pending.popleft())
+            future = self.executor.submit(self._bulk_create_chunk, workspace_id, batch[0]) if batch[0] else None
+            pending.append((future, batch[1]))
+        while pending:
+            yield from self._finish_bulk_create_batch(*pending.popleft())
+
+    # Groups the input into batches of up to chunk_size rows, the valid links to send and the failures of the invalid ones,
+    # so a run of invalid rows is reported as it is read instead of held back until enough valid links follow
+    def _stream_bulk_create_batches(self, links, chunk_size):
+        chunk = []
+        failures = []
+        for index, link in enumerate(links):
+            errors = self.validator.link_errors(link)
+            if errors:
+                failures.append((index, None, errors[0]))
             else:
-                raise ValueError('domainId key must have a valid value specified.')
-        elif "domain" in link:
-            if "id" in link["domain"] and link["domain"]["id"]:
-                return
-            elif "id" in link["domain"]:
-                raise ValueError('Domain object must have a valid value for id key.')
+                chunk.append((index, link))
+            if len(chunk) + len(failures) >= chunk_size:
+                yield chunk, failures
+                chunk = []
+                failures = []
+        if chunk or failures:
+            yield chunk, failures
+
+    def _finish_bulk_create_batch(self, future, failures):
+        outcomes = future.result() if future is not None else []
+        return sorted(outcomes + failures, key=lambda outcome: outcome[0])
+
+    def _partition_bulk_create_chunks(self, links, chunk_size, result):
+        report = ValidationReport()
+        valid_links = list(self.validator.iter_valid(links, report))
+        result.total_count += report.total_count
+        for index, errors in report.errors.items():
+            result.add_failure(index, errors[0])
+        return [valid_links[i:i + chunk_size] for i in range(0, len(valid_links), chunk_size)]
+
+    # Chunks hold links that were already validated, so they are sent without checking them again.
+    # A chunk rejected because of some of its links is split in halves until the offending links are isolated.
+    # When the request as a whole fails every link of the chunk is reported with that error instead.
+    def _bulk_create_chunk(self, workspace_id, chunk):
+        links = [link for _, link in chunk]
+        try:
+            response = self._send_bulk_create(workspace_id, links)
+        except RequestException as error:
+            return [(index, None, error) for index, _ in chunk]
+        try:
+            created_links = self.evaluate_response_status_code_return_object(response, 'Bulk create', 'links', '')
+        except (HTTPError, ValueError) as error:
+            if len(chunk) == 1 or not self._rejects_individual_links(response):
+                return [(index, None, error) for index, _ in chunk]
+            middle = len(chunk) // 2
+            return self._bulk_create_chunk(workspace_id, chunk[:middle]) + self._bulk_create_chunk(workspace_id, chunk[middle:])
+        return [(index, created_link, None) for (index, _), created_link in zip(chunk, created_links)]
+
+    def _record_bulk_create_outcomes(self, outcomes, result):
+        for index, created_link, error in outcomes:
+            if error is None:
+                result.add_success(index, created_link)
             else:
-                raise KeyError('Domain object must have id key specified.')
-        else:
-            raise KeyError('A key specifying the domain or domainId must exist for every link.')
+                result.add_failure(index, error)
+
+    # Raises the first problem found as a KeyError or ValueError
+    def check_link_validity(self, link):
+        errors = self.validator.link_errors(link)
+        if errors:
+            raise errors[0]
+
+    # Checks every link in one pass and returns a ValidationReport of all invalid indices and their errors
+    def validate_links(self, links):
+        return self.validator.validate(links)
+
+    # Yields (index, link) for valid links as they are read, recording the invalid ones in report
+    def iter_valid_links(self, links, report):
+        return self.validator.iter_valid(links, report)
 
     def count(self, favourite=None, domain_id='', domain_name='',workspace_id=''):
         url = self.base_links_uri + '/count'
@@ -153,86 +385,108 @@ class Links:
             'domain.fullName':domain_name,
             'workspace':workspace_id
         }
-        response = self.session.get(url, params=params)
+        response = self.session.get(url, params=params, operation='links.count')
         return self.evaluate_response_status_code_return_count(response, 'Count', 'links', '')
 
     def delete(self, link_id, workspace_id=''):
         url = self.base_links_uri + '/' + link_id
-        response = self.session.delete(url, params={"workspace":workspace_id})
+        response = self.session.delete(url, params={"workspace":workspace_id}, operation='links.delete')
+        self._invalidate_cached(link_id)
         return self.evaluate_response_status_code_return_object(response, 'Delete', 'link', link_id)
 
     # Links param expects an array of strings
     def bulk_delete(self, links, workspace_id=''):
         url = self.base_links_uri
-        data = json.dumps({"links": links})
-        response = self.session.delete(url, params={"workspace":workspace_id}, data=data)
+        data = self.codec.dumps({"links": links})
+        response = self.session.delete(url, params={"workspace":workspace_id}, data=data, operation='links.bulk_delete')
+        for link_id in links:
+            self._invalidate_cached(link_id)
         return self.evaluate_response_status_code_return_count(response, 'Bulk delete', 'workspace', workspace_id)
 
     # Route should specify the destination and conditions to be met for routing to that destination
     def create_route(self, link_id, route: dict, workspace_id=''):
         url = self.base_links_uri + '/' + link_id + '/rules'
-        data = json.dumps(route)
-        response = self.session.post(url, params={"workspace":workspace_id}, data=data)
+        data = self.codec.dumps(route)
+        response = self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.create_route')
+        self._invalidate_cached(link_id, 'routes', 'link')
         return self.evaluate_response_status_code_return_object(response, 'Create route', 'link', link_id)
 
     def update_route(self, link_id, route_id, routes, workspace_id=''):
         url = self.base_links_uri + '/' + link_id + '/rules/' + route_id
-        data = json.dumps(routes)
-        response = self.session.post(url, params={"workspace":workspace_id}, data=data)
+        data = self.codec.dumps(routes)
+        response = self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.update_route')
+        self._invalidate_cached(link_id, 'routes', 'link')
         return self.evaluate_response_status_code_return_object(response, 'Update route', 'link', link_id)
 
     def list_routes(self, link_id, workspace_id=''):
         url = self.base_links_uri + '/' + link_id + '/rules'
-        response = self.session.get(url, params={"workspace":workspace_id})
-        return self.evaluate_response_status_code_return_object(response, 'Get routes', 'link', link_id)
+        cached_routes = self._get_cached('routes', link_id, workspace_id)
+        if cached_routes is not None:
+            return self._as_model(Route, cached_routes)
+        response = self.session.get(url, params={"workspace":workspace_id}, operation='links.list_routes')
+        routes = self.evaluate_response_status_code_return_object(response, 'Get routes', 'link', link_id)
+        self._set_cached('routes', link_id, workspace_id, routes)
+        return self._as_model(Route, routes)
 
     def delete_route(self, link_id, route_id, workspace_id=''):
         url = self.base_links_uri + '/' + link_id + '/rules/' + route_id
-        response = self.session.delete(url, params={"workspace":workspace_id})
+        response = self.session.delete(url, params={"workspace":workspace_id}, operation='links.delete_route')
+        self._invalidate_cached(link_id, 'routes', 'link')
         return self.evaluate_response_status_code_return_object(response, 'Delete route', 'link', link_id)
 
     # Essential for configuring deep links
     def get_apps(self, workspace_id=''):
-        url = 'https://api.rebrandly.com/v1/apps'
-        response = self.session.get(url, params={"workspace":workspace_id})
+        url = self.base_uri + '/apps'
+        response = self.session.get(url, params={"workspace":workspace_id}, operation='links.get_apps')
         return self.evaluate_response_status_code_return_object(response, 'get', 'apps', 'any')
 
     # Deep links are also referred to as native routes in developer documentation for API
     def list_deep_links(self, link_id, workspace_id=''):
         url = self.base_links_uri + '/' + link_id + '/apps'
-        response = self.session.get(url, params={"workspace":workspace_id})
-        return self.evaluate_response_status_code_return_object(response, 'List deep links', 'link', link_id)
+        cached_deep_links = self._get_cached('deep_links', link_id, workspace_id)
+        if cached_deep_links is not None:
+            return self._as_model(DeepLink, cached_deep_links)
+        response = self.session.get(url, params={"workspace":workspace_id}, operation='links.list_deep_links')
+        deep_links = self.evaluate_response_status_code_return_object(response, 'List deep links', 'link', link_id)
+        self._set_cached('deep_links', link_id, workspace_id, deep_links)
+        return self._as_model(DeepLink, deep_links)
 
     # App must already be created within Rebrandly
     # Deep Links can only be created, read, and deleted. Deep Links can not be updated.
     def create_deep_link(self, link_id, app_id, path, workspace_id=''):
         url = self.base_links_uri + '/' + link_id + '/apps/' + app_id
-        data = json.dumps(path)
-        response = self.session.post(url, params={"workspace":workspace_id}, data=data)
+        data = self.codec.dumps(path)
+        response = self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.create_deep_link')
+        self._invalidate_cached(link_id, 'deep_links', 'link')
         return self.evaluate_response_status_code_return_object(response, 'Update deep link', 'link', link_id)
 
     def delete_deep_link(self, link_id, app_id, workspace_id=''):
         url = self.base_links_uri + '/' + link_id + '/apps/' + app_id
-        response = self.session.delete(url, params={"workspace":workspace_id})
+        response = self.session.delete(url, params={"workspace":workspace_id}, operation='links.delete_deep_link')
+        self._invalidate_cached(link_id, 'deep_links', 'link')
         return self.evaluate_response_status_code_return_object(response, 'Delete deep link', 'link', link_id)
 
     def delete_deep_links(self, link_id, workspace_id=''):
         apps = self.list_deep_links(link_id, workspace_id=workspace_id)
         if len(apps) == 0:
             return 0
-        for app in apps:
-            app_id = app['id']
-            self.delete_deep_link(link_id, app_id, workspace_id=workspace_id)
+        self.executor.map(lambda app: self.delete_deep_link(link_id, app['id'], workspace_id=workspace_id), apps)
         return len(apps)
 
     def get_opengraph(self, link_id, workspace_id=''):
         url = self.base_links_uri + '/' + link_id +'/opengraph'
-        response = self.session.get(url, params={"workspace":workspace_id})
-        return self.evaluate_response_status_code_return_object(response, 'Get opengraph', 'link', link_id)
+        cached_opengraph = self._get_cached('opengraph', link_id, workspace_id)
+        if cached_opengraph is not None:
+            return cached_opengraph
+        response = self.session.get(url, params={"workspace":workspace_id}, operation='links.get_opengraph')
+        opengraph = self.evaluate_response_status_code_return_object(response, 'Get opengraph', 'link', link_id)
+        self._set_cached('opengraph', link_id, workspace_id, opengraph)
+        return opengraph
 
     def delete_opengraph(self, link_id, workspace_id=''):
         url = self.base_links_uri + '/' + link_id +'/opengraph'
-        response = self.session.delete(url, params={"workspace":workspace_id})
+        response = self.session.delete(url, params={"workspace":workspace_id}, operation='links.delete_opengraph')
+        self._invalidate_cached(link_id, 'opengraph')
         return self.evaluate_response_status_code_return_object(response, 'Delete opengraph', 'link', link_id)
 
     def set_opengraph(self, link_id, title, description='', image_url='', object_type='', locale='', workspace_id=''):
@@ -244,6 +498,7 @@ class Links:
                 "type": object_type,
                 "locale": locale
                 }
-        data = json.dumps(opengraph_config)
-        response = self.session.post(url, params={"workspace":workspace_id}, data=data)
+        data = self.codec.dumps(opengraph_config)
+        response = self.session.post(url, params={"workspace":workspace_id}, data=data, operation='links.set_opengraph')
+        self._invalidate_cached(link_id, 'opengraph')
         return self.evaluate_response_status_code_return_object(response, 'Update opengraph', 'link', link_id)
\ No newline at end of file
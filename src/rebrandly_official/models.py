@@ -0,0 +1,167 @@
+import re
+
+def _attribute_name(api_field):
+    return re.sub('([A-Z])', r'_\1', api_field).lower()
+
+# Slot names for the given api fields. Nested models keep their raw dict in a private slot until first accessed.
+def _slot_names(api_fields, nested_fields=()):
+    return tuple('_' + _attribute_name(field) if field in nested_fields else _attribute_name(field) for field in api_fields)
+
+# Nested objects can be shared by several models, so they are copied before being handed out
+def _copy_json(value):
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+# How many distinct values of a nested field from_list compares new ones with
+_SHARED_VALUES_PER_FIELD = 8
+
+class NestedModel:
+    def __init__(self, api_field):
+        self.api_field = api_field
+        self.slot = '_' + _attribute_name(api_field)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            value = object.__getattribute__(instance, self.slot)
+        except AttributeError:
+            return None
+        if isinstance(value, dict):
+            value = owner._nested_fields[self.api_field](_copy_json(value))
+            setattr(instance, self.slot, value)
+        return value
+
+class Model:
+    __slots__ = ('_extra',)
+    _api_fields = ()
+    _nested_fields = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._slot_by_api_field = dict(zip(cls._api_fields, _slot_names(cls._api_fields, cls._nested_fields)))
+        cls._attribute_by_api_field = {field: _attribute_name(field) for field in cls._api_fields}
+        cls._attribute_names = frozenset(cls._attribute_by_api_field.values())
+
+    def __init__(self, data):
+        # Fields the model does not know about are kept so to_dict() round trips
+        self._extra = None
+        slot_by_api_field = self._slot_by_api_field
+        for api_field, value in data.items():
+            slot = slot_by_api_field.get(api_field)
+            if slot is None:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[api_field] = value
+            else:
+                setattr(self, slot, value)
+
+    # Builds one model per item. A nested object equal to one already seen in items, such as the domain most links of a page
+    # share, is stored once for all of them.
+    @classmethod
+    def from_list(cls, items):
+        if not cls._nested_fields:
+            return [cls(item) for item in items]
+        shared_values = {field: [] for field in cls._nested_fields}
+        models = []
+        for item in items:
+            model = cls(item)
+            for api_field, seen in shared_values.items():
+                value = item.get(api_field) if isinstance(item, dict) else None
+                if not isinstance(value, dict):
+                    continue
+                shared = next((seen_value for seen_value in seen if seen_value == value), None)
+                if shared is not None:
+                    setattr(model, cls._slot_by_api_field[api_field], shared)
+                elif len(seen) < _SHARED_VALUES_PER_FIELD:
+                    seen.append(value)
+            models.append(model)
+        return models
+
+    # Known fields missing from the response read as None
+    def __getattr__(self, name):
+        if name in self._attribute_names:
+            return None
+        raise AttributeError(f"{type(self).__name__} has no attribute {name}")
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.get('id')!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Model):
+            return NotImplemented
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    # Dict style access by api field name keeps code written against raw responses working
+    def __getitem__(self, api_field):
+        slot = self._slot_by_api_field.get(api_field)
+        if slot is None:
+            if self._extra is not None and api_field in self._extra:
+                return self._extra[api_field]
+            raise KeyError(api_field)
+        try:
+            object.__getattribute__(self, slot)
+        except AttributeError:
+            raise KeyError(api_field)
+        return getattr(self, self._attribute_by_api_field[api_field])
+
+    def __contains__(self, api_field):
+        try:
+            self[api_field]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, api_field, default=None):
+        try:
+            return self[api_field]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        data = {}
+        for api_field, slot in self._slot_by_api_field.items():
+            try:
+                value = object.__getattribute__(self, slot)
+            except AttributeError:
+                continue
+            if isinstance(value, Model):
+                value = value.to_dict()
+            elif api_field in self._nested_fields:
+                value = _copy_json(value)
+            data[api_field] = value
+        if self._extra is not None:
+            data.update(self._extra)
+        return data
+
+class Creator(Model):
+    _api_fields = ('id', 'fullName', 'avatarUrl')
+    __slots__ = _slot_names(_api_fields)
+
+class Domain(Model):
+    _api_fields = ('id', 'ref', 'fullName', 'topLevelDomain', 'level', 'type', 'active', 'status', 'https', 'sharing', 'createdAt', 'updatedAt')
+    __slots__ = _slot_names(_api_fields)
+
+class Link(Model):
+    _nested_fields = {'domain': Domain, 'creator': Creator}
+    _api_fields = ('id', 'title', 'description', 'slashtag', 'destination', 'shortUrl', 'domainId', 'domainName', 'domain', 'creator',
+        'status', 'https', 'favourite', 'isPublic', 'integrated', 'tags', 'scripts', 'forwardParameters', 'clicks', 'lastClickAt',
+        'lastClickDate', 'createdAt', 'updatedAt')
+    __slots__ = _slot_names(_api_fields, _nested_fields)
+    domain = NestedModel('domain')
+    creator = NestedModel('creator')
+
+class Route(Model):
+    _api_fields = ('id', 'destination', 'condition', 'createdAt', 'updatedAt')
+    __slots__ = _slot_names(_api_fields)
+
+class DeepLink(Model):
+    _api_fields = ('id', 'path', 'active', 'app', 'createdAt', 'updatedAt')
+    __slots__ = _slot_names(_api_fields)
+
+class Workspace(Model):
+    _api_fields = ('id', 'name', 'type', 'default', 'avatarUrl', 'links', 'teammates', 'domains', 'createdAt', 'updatedAt')
+    __slots__ = _slot_names(_api_fields)
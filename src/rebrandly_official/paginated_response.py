@@ -1,11 +1,24 @@
-import json
+import queue
+import threading
+from urllib.parse import urlsplit
 from requests.exceptions import HTTPError
+from .codec import default_codec
+
+# Marks the end of the pages handed over by a prefetching iterator
+_LAST_PAGE = object()
 
 class PaginatedResponse:
-    def __init__(self, initial_response, session):
+    # items lets callers that already decoded the initial response pass it along instead of decoding it again
+    def __init__(self, initial_response, session, items=None, codec=None, model=None, operation=None):
         self.session = session
+        # Operation reported to instrumentation hooks for every page request
+        self.operation = operation
+        self.codec = codec or default_codec()
+        self.model = model
         self.current_response = initial_response
-        self.current_items = json.loads(initial_response.text)
+        if items is None:
+            items = self.codec.loads(initial_response.content)
+        self.current_items = self._wrap_items(items)
         self.current_items_count = len(self.current_items)
         self.total_items_count = self.current_items_count
         self.iteration_count = 1
@@ -13,30 +26,162 @@ class PaginatedResponse:
             self.last_item = self.current_items[-1]["id"]
         else:
             self.last_item = None
-        self.request_url = initial_response.request.url
-        self.request_method = initial_response.request.method.lower()
-        self.request_path_url = initial_response.request.path_url.lower()
+        self._set_request(str(initial_response.request.url), initial_response.request.method)
+        self._checkpoint_callback = None
+        self._checkpoint_every = 1
+
+    def _set_request(self, url, method):
+        self.request_url = url
+        self.request_method = method.lower()
+        # Built from the url rather than request.path_url so responses from other HTTP clients work too
+        url_parts = urlsplit(self.request_url)
+        self.request_path_url = (url_parts.path + ('?' + url_parts.query if url_parts.query else '')).lower()
 
     def __iter__(self):
         return iter(self.current_items)
 
     def next(self):
-        if self.request_method == 'get' and self.request_path_url[:9] == '/v1/links':
-            if self.current_items_count == 0:
+        endpoint = self._next_page_endpoint()
+        if endpoint is None:
+            return
+        # Asking for the next page means the current one was processed
+        self._report_checkpoint(self.checkpoint())
+        self._fetch(endpoint)
+
+    def _fetch(self, endpoint):
+        response = self.session.get(endpoint, operation=self.operation, page=self.iteration_count + 1)
+        self._update_from_response(response)
+
+    # A JSON serializable cursor marking every page up to the current one as processed. from_checkpoint() resumes after it.
+    def checkpoint(self):
+        return {
+            "request_url": self.request_url,
+            "request_method": self.request_method,
+            "last_item": self.last_item,
+            "iteration_count": self.iteration_count,
+            "total_items_count": self.total_items_count,
+            "operation": self.operation
+        }
+
+    # Calls callback(checkpoint) every `every` pages, once the caller has moved past the page, e.g. to persist it
+    def on_checkpoint(self, callback, every=1):
+        if every < 1:
+            raise ValueError('every must be at least 1.')
+        self._checkpoint_callback = callback
+        self._checkpoint_every = every
+        return self
+
+    def _report_checkpoint(self, checkpoint):
+        if self._checkpoint_callback is not None and checkpoint["iteration_count"] % self._checkpoint_every == 0:
+            self._checkpoint_callback(checkpoint)
+
+    # Fetches the first page not covered by checkpoint, so processing continues exactly where it stopped.
+    # model and codec are not part of the checkpoint and must be given again if they were used.
+    @classmethod
+    def from_checkpoint(cls, checkpoint, session, codec=None, model=None):
+        page = cls._restore(checkpoint, session, codec, model)
+        endpoint = page._page_endpoint()
+        if endpoint is not None:
+            page._fetch(endpoint)
+        return page
+
+    @classmethod
+    def _restore(cls, checkpoint, session, codec, model):
+        page = cls.__new__(cls)
+        page.session = session
+        page.operation = checkpoint.get("operation")
+        page.codec = codec or default_codec()
+        page.model = model
+        page.current_response = None
+        page.current_items = []
+        page.current_items_count = 0
+        page.total_items_count = checkpoint["total_items_count"]
+        page.iteration_count = checkpoint["iteration_count"]
+        page.last_item = checkpoint["last_item"]
+        page._set_request(checkpoint["request_url"], checkpoint.get("request_method") or 'get')
+        page._checkpoint_callback = None
+        page._checkpoint_every = 1
+        return page
+
+    # Yields items from the current page onwards while up to `prefetch` following pages are fetched on a background thread
+    def iter_all(self, prefetch=1):
+        if prefetch < 1:
+            raise ValueError('prefetch must be at least 1.')
+        pages = queue.Queue(maxsize=prefetch)
+        stopped = threading.Event()
+        # Pages travel with their checkpoint, reported once the page has been consumed rather than when it was fetched
+        first_page = (list(self.current_items), self.checkpoint())
+
+        def put_page(page):
+            while not stopped.is_set():
+                try:
+                    pages.put(page, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch_pages():
+            try:
+                while not stopped.is_set():
+                    endpoint = self._next_page_endpoint()
+                    if endpoint is None:
+                        break
+                    iteration_count = self.iteration_count
+                    self._fetch(endpoint)
+                    if self.iteration_count == iteration_count:
+                        break
+                    if not put_page((list(self.current_items), self.checkpoint())):
+                        return
+            except Exception as error:
+                put_page(error)
                 return
-            last_item = self.last_item
-            endpoint = self.request_url + f"&last={last_item}"
-            response = self.session.get(endpoint)
-            response_json = json.loads(response.text)
-            if response.status_code != 200:
-                raise HTTPError("Next method failed due to error trying to get next page", response_json)
-            response_has_new_items = (len(json.loads(response.text)) > 0)
-            if response_has_new_items:
-                self.current_items = response_json
-                self.current_items_count = len(self.current_items)
-                self.total_items_count += self.current_items_count
-                self.last_item = self.current_items[-1]['id']
-                self.iteration_count += 1
-                self.current_response = response
-            else:
-                self.current_items_count = 0
\ No newline at end of file
+            put_page(_LAST_PAGE)
+
+        fetcher = threading.Thread(target=fetch_pages, daemon=True)
+        fetcher.start()
+        try:
+            page = first_page
+            while True:
+                if not page[0]:
+                    return
+                yield from page[0]
+                self._report_checkpoint(page[1])
+                next_page = pages.get()
+                if isinstance(next_page, Exception):
+                    raise next_page
+                if next_page is _LAST_PAGE:
+                    return
+                page = next_page
+        finally:
+            stopped.set()
+
+    def _wrap_items(self, items):
+        if self.model is None:
+            return items
+        return self.model.from_list(items)
+
+    def _next_page_endpoint(self):
+        if self.current_items_count == 0:
+            return None
+        return self._page_endpoint()
+
+    def _page_endpoint(self):
+        if self.request_method == 'get' and self.request_path_url[:9] == '/v1/links' and self.last_item is not None:
+            return self.request_url + f"&last={self.last_item}"
+        return None
+
+    def _update_from_response(self, response):
+        response_json = self.codec.loads(response.content)
+        if response.status_code != 200:
+            raise HTTPError("Next method failed due to error trying to get next page", response_json)
+        response_has_new_items = (len(response_json) > 0)
+        if response_has_new_items:
+            self.current_items = self._wrap_items(response_json)
+            self.current_items_count = len(self.current_items)
+            self.total_items_count += self.current_items_count
+            self.last_item = self.current_items[-1]['id']
+            self.iteration_count += 1
+            self.current_response = response
+        else:
+            self.current_items_count = 0
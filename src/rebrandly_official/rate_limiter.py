@@ -0,0 +1,36 @@
+import threading
+import time
+
+class TokenBucketRateLimiter:
+    def __init__(self, rate, burst=None, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError('rate must be greater than 0.')
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, rate)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._paused_until = 0
+        self._lock = threading.Lock()
+
+    # Takes a token and returns how many seconds the caller must wait before using it.
+    # Tokens may be borrowed from the future, so concurrent callers queue up instead of racing.
+    def reserve(self):
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            wait = 0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            self.sleep(wait)
+
+    # Holds back every caller, e.g. after the server answered with a 429
+    def pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, self.clock() + seconds)
@@ -1,19 +1,136 @@
-import requests
-from .links import Links
-from .workspaces import Workspaces
-from .domains import Domains
+import copy
+import threading
+from .instrumentation import Instrumentation
+
+# Same default as requests, defined here so importing the client does not import requests
+DEFAULT_POOLSIZE = 10
 
 class RebrandlyClient:
-    def __init__(self, api_key: str):
-        self.session = requests.Session()
-        headers = {"accept": "application/json", 'apikey': api_key, 'Content-type': 'application/json', 'User-Agent': 'rebrandly-python-sdk'}
-        self.session.headers.update(headers)
-        self.links = Links(self.session)
-        self.workspaces = Workspaces(self.session)
-        self.domains = Domains(self.session)
+    API_URL = 'https://api.rebrandly.com/'
+    ENTERPRISE_API_URL = 'https://enterprise-api.rebrandly.com/'
+
+    # pool_maxsize should be at least the number of threads sharing the client, enterprise_pool_maxsize sizes the pool used by bulk_create.
+    # The session, the executor and each sub-client are only built, and their modules imported, the first time they are used.
+    def __init__(self, api_key: str, link_cache=None, codec=None, use_models=False, retry_policy=None, rate_limiter=None, pool_maxsize=DEFAULT_POOLSIZE, enterprise_pool_maxsize=DEFAULT_POOLSIZE, pool_block=False, timeout=None, keep_alive=True, max_workers=8, instrumentation=None, api_url=API_URL, enterprise_api_url=ENTERPRISE_API_URL, transport=None, single_flight=False):
+        # Both urls end with a slash, e.g. to point the client at a local test server
+        self.api_url = api_url
+        self.enterprise_api_url = enterprise_api_url
+        # Register hooks here to observe every request made through this client
+        self.instrumentation = instrumentation or Instrumentation()
+        self.headers = {"accept": "application/json", 'apikey': api_key, 'Content-type': 'application/json', 'User-Agent': 'rebrandly-python-sdk'}
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
+        self.max_workers = max_workers
+        self._session_options = {"retry_policy": retry_policy, "rate_limiter": rate_limiter, "timeout": timeout, "single_flight": single_flight}
+        self._pool_options = {"transport": transport, "pool_maxsize": pool_maxsize, "enterprise_pool_maxsize": enterprise_pool_maxsize, "pool_block": pool_block}
+        self._sub_client_options = {"codec": codec, "use_models": use_models}
+        self._link_cache = link_cache
+        self._lock = threading.RLock()
+        # Set on views returned by for_workspace and with_api_key
+        self._root = None
+        self._scoped_headers = {}
+        self._session = None
+        self._executor = None
+        self._links = None
+        self._workspaces = None
+        self._domains = None
+
+    def _get_or_create(self, name, create):
+        value = getattr(self, name)
+        if value is None:
+            with self._lock:
+                value = getattr(self, name)
+                if value is None:
+                    value = create()
+                    setattr(self, name, value)
+        return value
+
+    @property
+    def session(self):
+        return self._get_or_create('_session', self._create_session)
+
+    # Shared by the sub-clients for their concurrent fan-outs and available for callers' own
+    @property
+    def executor(self):
+        return self._get_or_create('_executor', self._create_executor)
+
+    @property
+    def links(self):
+        return self._get_or_create('_links', self._create_links)
+
+    @property
+    def workspaces(self):
+        return self._get_or_create('_workspaces', self._create_workspaces)
+
+    @property
+    def domains(self):
+        return self._get_or_create('_domains', self._create_domains)
+
+    def _create_session(self):
+        if self._root is not None:
+            from .session import ScopedSession
+            return ScopedSession(self._root.session, self._scoped_headers)
+        from .session import RebrandlySession
+        session = RebrandlySession(instrumentation=self.instrumentation, **self._session_options)
+        options = self._pool_options
+        # A transport from .transports (or any requests adapter) replaces the default connection pools for both urls
+        if options["transport"] is not None:
+            for prefix in (self.api_url, self.enterprise_api_url):
+                session.mount(prefix, options["transport"])
+        else:
+            session.mount_pool(self.api_url, pool_maxsize=options["pool_maxsize"], pool_block=options["pool_block"])
+            # Both urls may point at the same host, which then shares the enterprise pool
+            if self.enterprise_api_url != self.api_url:
+                session.mount_pool(self.enterprise_api_url, pool_maxsize=options["enterprise_pool_maxsize"], pool_block=options["pool_block"])
+        session.headers.update(self.headers)
+        return session
+
+    def _create_executor(self):
+        if self._root is not None:
+            return self._root.executor
+        from .concurrency import ConcurrentExecutor
+        return ConcurrentExecutor(max_workers=self.max_workers)
+
+    def _create_links(self):
+        from .links import Links
+        return Links(self.session, cache=self._link_cache, executor=self.executor, api_url=self.api_url, enterprise_api_url=self.enterprise_api_url, **self._sub_client_options)
+
+    def _create_workspaces(self):
+        from .workspaces import Workspaces
+        return Workspaces(self.session, executor=self.executor, api_url=self.api_url, **self._sub_client_options)
+
+    def _create_domains(self):
+        from .domains import Domains
+        return Domains(self.session, api_url=self.api_url, **self._sub_client_options)
+
+    # Views share this client's connection pools, executor, cache and instrumentation but send their own workspace or api key.
+    # They are cheap to create, so a multi-tenant worker can make one per call instead of mutating shared headers.
+    def for_workspace(self, workspace_id):
+        return self._scoped({"workspace": workspace_id})
+
+    def with_api_key(self, api_key):
+        return self._scoped({"apikey": api_key})
+
+    def _scoped(self, headers):
+        view = copy.copy(self)
+        view._root = self._root or self
+        view._scoped_headers = dict(self._scoped_headers, **headers)
+        view.headers = dict(self.headers, **headers)
+        view._lock = threading.RLock()
+        view._session = view._executor = view._links = view._workspaces = view._domains = None
+        return view
 
     def update_api_key(self, api_key):
-        self.session.headers.update({"apikey":api_key})
+        self._update_headers({"apikey":api_key})
 
     def update_workspace(self, workspace_id):
-        self.session.headers.update({"workspace":workspace_id})
\ No newline at end of file
+        self._update_headers({"workspace":workspace_id})
+
+    def _update_headers(self, headers):
+        with self._lock:
+            self.headers.update(headers)
+            # A view's session reads its headers from _scoped_headers, leaving the shared session untouched
+            if self._root is not None:
+                self._scoped_headers.update(headers)
+            elif self._session is not None:
+                self._session.headers.update(headers)
@@ -0,0 +1,191 @@
+import json
+from requests.exceptions import HTTPError, RequestException
+from .links import Links
+from .link_export import _as_dict
+
+# Link fields compared with the live link when the desired link specifies them
+LINK_FIELDS = ('destination', 'title', 'description', 'favourite')
+SUB_RESOURCE_FIELDS = ('routes', 'deepLinks', 'opengraph')
+OPENGRAPH_FIELDS = ('title', 'description', 'image', 'type', 'locale')
+# Set by the API, so ignored when comparing routes
+_ROUTE_SERVER_FIELDS = ('id', 'ref', 'link', 'createdAt', 'updatedAt')
+DELETE_CHUNK_SIZE = 100
+
+# Links are identified by domain and slashtag, which are unique together
+def link_key(link):
+    return (link.get('domainId') or (link.get('domain') or {}).get('id'), link.get('slashtag'))
+
+def _route_signature(route):
+    return json.dumps({field: value for field, value in _as_dict(route).items() if field not in _ROUTE_SERVER_FIELDS}, sort_keys=True)
+
+def _deep_link_app_id(deep_link):
+    return deep_link.get('id') or deep_link['app']['id']
+
+class ReconcilePlan:
+    def __init__(self):
+        # Desired links missing from the workspace, with their sub-resources
+        self.creates = []
+        # (link_id, {field: desired value}, live link) for every link with differing fields
+        self.updates = []
+        # Ids of links missing from the desired state. Only filled when planning with prune.
+        self.deletes = []
+        # (method, link_id, *args) for every Links method call needed to bring routes, deep links and OpenGraph in line
+        self.sub_resource_changes = []
+
+    def __repr__(self):
+        return f"ReconcilePlan(creates={len(self.creates)}, updates={len(self.updates)}, deletes={len(self.deletes)}, sub_resource_changes={len(self.sub_resource_changes)})"
+
+    def __len__(self):
+        return len(self.creates) + len(self.updates) + len(self.deletes) + len(self.sub_resource_changes)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+class ReconcileResult:
+    def __init__(self):
+        self.created_count = 0
+        self.updated_count = 0
+        self.deleted_count = 0
+        self.sub_resource_count = 0
+        # (change, exception) for every change that failed, where change is the created link, update, deleted ids or call
+        self.errors = []
+
+    def __repr__(self):
+        return f"ReconcileResult(created={self.created_count}, updated={self.updated_count}, deleted={self.deleted_count}, sub_resource_changes={self.sub_resource_count}, failed={len(self.errors)})"
+
+    @property
+    def ok(self):
+        return len(self.errors) == 0
+
+# Brings a workspace in line with a desired state: a list of link dicts identified by domain id and slashtag, optionally with
+# routes, deepLinks and opengraph. Fields and sub-resources the desired links leave out are not compared or changed.
+class Reconciler:
+    def __init__(self, links, workspace_id=''):
+        self.links = links
+        self.workspace_id = workspace_id
+
+    # live defaults to listing every link of the workspace. Pass links from a synced LinkMirror or an export instead to avoid the
+    # walk; sub-resources found on them are used as is and only the missing ones are read from the API, for existing links only.
+    def plan(self, desired, live=None, prune=False):
+        desired_by_key = self._index_desired(desired)
+        plan = ReconcilePlan()
+        existing = []
+        seen = set()
+        for link in (live if live is not None else self._list_live()):
+            link = _as_dict(link)
+            key = link_key(link)
+            wanted = desired_by_key.get(key)
+            if wanted is None:
+                if prune:
+                    plan.deletes.append(link['id'])
+                continue
+            seen.add(key)
+            changes = {field: wanted[field] for field in LINK_FIELDS if field in wanted and wanted[field] != link.get(field)}
+            if changes:
+                plan.updates.append((link['id'], changes, link))
+            if any(field in wanted for field in SUB_RESOURCE_FIELDS):
+                existing.append((link, wanted))
+        plan.creates = [wanted for key, wanted in desired_by_key.items() if key not in seen]
+        for changes in self.links.executor.map(lambda pair: self._sub_resource_changes(*pair), existing):
+            plan.sub_resource_changes.extend(changes)
+        return plan
+
+    def _index_desired(self, desired):
+        desired_by_key = {}
+        for index, wanted in enumerate(desired):
+            self.links.check_link_validity(wanted)
+            if not wanted.get('slashtag'):
+                raise KeyError('Slashtag must be specified for every desired link.')
+            key = link_key(wanted)
+            if key in desired_by_key:
+                raise ValueError(f'Slashtag {wanted["slashtag"]} is used by more than one desired link, the last at index {index}.')
+            desired_by_key[key] = wanted
+        return desired_by_key
+
+    def _list_live(self):
+        page = self.links.list(workspace_id=self.workspace_id)
+        if page is None:
+            return iter(())
+        return page.iter_all()
+
+    # Live sub-resources are read unless the live link already carries them, as links from an export do
+    def _live_sub_resource(self, link, field, method):
+        if field in link:
+            return _as_dict(link[field])
+        return _as_dict(getattr(self.links, method)(link['id'], workspace_id=self.workspace_id))
+
+    def _sub_resource_changes(self, link, wanted):
+        link_id = link['id']
+        changes = []
+        if 'routes' in wanted:
+            live_routes = {}
+            for route in self._live_sub_resource(link, 'routes', 'list_routes'):
+                live_routes.setdefault(_route_signature(route), []).append(route['id'])
+            for route in wanted['routes'] or []:
+                route_ids = live_routes.get(_route_signature(route))
+                if route_ids:
+                    route_ids.pop()
+                else:
+                    changes.append(('create_route', link_id, route))
+            changes.extend(('delete_route', link_id, route_id) for route_ids in live_routes.values() for route_id in route_ids)
+        if 'deepLinks' in wanted:
+            live_paths = {_deep_link_app_id(deep_link): deep_link.get('path') for deep_link in self._live_sub_resource(link, 'deepLinks', 'list_deep_links')}
+            wanted_paths = {_deep_link_app_id(deep_link): deep_link.get('path') for deep_link in wanted['deepLinks'] or []}
+            # Deep links can not be updated, creating one again replaces it
+            changes.extend(('create_deep_link', link_id, app_id, {"path": path}) for app_id, path in wanted_paths.items() if live_paths.get(app_id) != path)
+            changes.extend(('delete_deep_link', link_id, app_id) for app_id in live_paths if app_id not in wanted_paths)
+        if 'opengraph' in wanted:
+            live_opengraph = self._live_sub_resource(link, 'opengraph', 'get_opengraph') or {}
+            wanted_opengraph = wanted['opengraph'] or {}
+            if not wanted_opengraph:
+                if any(live_opengraph.get(field) for field in OPENGRAPH_FIELDS):
+                    changes.append(('delete_opengraph', link_id))
+            elif any((wanted_opengraph.get(field) or '') != (live_opengraph.get(field) or '') for field in OPENGRAPH_FIELDS):
+                changes.append(('set_opengraph', link_id, *((wanted_opengraph.get(field) or '') for field in OPENGRAPH_FIELDS)))
+        return changes
+
+    # Creates go through bulk_create_chunked and deletes through bulk_delete. Updates and sub-resource changes, including those
+    # of the links just created, are sent concurrently. Failures are collected in the result instead of raised.
+    def apply(self, plan, chunk_size=Links.BULK_CREATE_CHUNK_SIZE, max_workers=4):
+        result = ReconcileResult()
+        calls = [('_update_link', link_id, changes, link) for link_id, changes, link in plan.updates] + list(plan.sub_resource_changes)
+        if plan.creates:
+            calls.extend(self._create_links(plan.creates, chunk_size, max_workers, result))
+        for start in range(0, len(plan.deletes), DELETE_CHUNK_SIZE):
+            link_ids = plan.deletes[start:start + DELETE_CHUNK_SIZE]
+            try:
+                result.deleted_count += self.links.bulk_delete(link_ids, workspace_id=self.workspace_id)
+            except (HTTPError, RequestException) as error:
+                result.errors.append((link_ids, error))
+        outcomes = self.links.executor.map(self._call, calls, max_concurrency=max_workers, return_exceptions=True)
+        for call, outcome in zip(calls, outcomes):
+            if isinstance(outcome, Exception):
+                result.errors.append((call, outcome))
+            elif call[0] == '_update_link':
+                result.updated_count += 1
+            else:
+                result.sub_resource_count += 1
+        return result
+
+    # Returns the sub-resource calls for the links created
+    def _create_links(self, creates, chunk_size, max_workers, result):
+        bodies = [{field: value for field, value in wanted.items() if field not in SUB_RESOURCE_FIELDS} for wanted in creates]
+        created = self.links.bulk_create_chunked(self.workspace_id, bodies, chunk_size=chunk_size, max_workers=max_workers)
+        for index, error in created.errors.items():
+            result.errors.append((creates[index], error))
+        calls = []
+        for index, created_link in created.created.items():
+            result.created_count += 1
+            empty_link = {"id": created_link["id"], "routes": [], "deepLinks": [], "opengraph": {}}
+            calls.extend(self._sub_resource_changes(empty_link, creates[index]))
+        return calls
+
+    def _call(self, call):
+        if call[0] == '_update_link':
+            return self._update_link(*call[1:])
+        return getattr(self.links, call[0])(*call[1:], workspace_id=self.workspace_id)
+
+    # Only the requests for fields that differ from the live link are sent
+    def _update_link(self, link_id, changes, link):
+        return self.links.update(workspace_id=self.workspace_id, **self.links._update_arguments(dict(changes, id=link_id), link))
@@ -0,0 +1,54 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+class RetryPolicy:
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    # Rejected with 429 means the request was never processed, so any method can be retried.
+    # Other failures are only retried for methods that are safe to repeat.
+    RETRYABLE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=30, status_codes=RETRYABLE_STATUS_CODES, methods=RETRYABLE_METHODS, random=random.random):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.random = random
+
+    def should_retry(self, method, status_code, attempt):
+        if attempt >= self.max_retries or status_code not in self.status_codes:
+            return False
+        return status_code == 429 or method.upper() in self.methods
+
+    def should_retry_error(self, method, attempt):
+        return attempt < self.max_retries and method.upper() in self.methods
+
+    # Seconds to wait before the next attempt. Server hints win over the jittered exponential backoff.
+    def get_delay(self, attempt, response=None):
+        if response is not None:
+            delay = self._delay_from_headers(response.headers)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+        return self.random() * min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+
+    def _delay_from_headers(self, headers):
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        if headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset'):
+            try:
+                reset = float(headers['X-RateLimit-Reset'])
+            except ValueError:
+                return None
+            # The reset header is either an epoch timestamp or a number of seconds
+            if reset > 1e9:
+                return max(0.0, reset - time.time())
+            return max(0.0, reset)
+        return None
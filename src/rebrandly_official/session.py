@@ -0,0 +1,137 @@
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.exceptions import ConnectionError, Timeout
+from requests.structures import CaseInsensitiveDict
+from .instrumentation import Instrumentation, RequestEvent
+from .transports import RequestsTransport
+from .single_flight import SingleFlight
+
+# Requests made with another api key or workspace never share a response
+def single_flight_key(method, url, params, headers):
+    params = tuple(sorted((key, str(value)) for key, value in (params or {}).items() if value is not None))
+    return (method.upper(), url, params, headers.get('apikey'), headers.get('workspace'))
+
+class RebrandlySession(requests.Session):
+    def __init__(self, retry_policy=None, rate_limiter=None, timeout=None, instrumentation=None, single_flight=False):
+        super().__init__()
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.instrumentation = instrumentation or Instrumentation()
+        # Either a number of seconds or a (connect, read) tuple, used when a request sets no timeout itself
+        self.timeout = timeout
+        # With single_flight, identical GETs made while one is in flight share its response
+        self.single_flight = SingleFlight() if single_flight else None
+
+    # Gives requests to urls starting with prefix their own connection pool
+    def mount_pool(self, prefix, pool_maxsize=DEFAULT_POOLSIZE, pool_block=False):
+        self.mount(prefix, RequestsTransport(pool_maxsize=pool_maxsize, pool_block=pool_block))
+
+    # operation names the SDK call (e.g. links.create_route) and page the page number of paginated calls.
+    # gate, when given, is entered before and exited after every attempt, and throttled in place of the shared rate limiter on a 429.
+    def request(self, method, url, *args, operation=None, page=None, gate=None, **kwargs):
+        if self.single_flight is not None and method.upper() == 'GET' and not args and not kwargs.get('stream'):
+            headers = CaseInsensitiveDict(self.headers)
+            headers.update(kwargs.get('headers') or {})
+            key = single_flight_key(method, url, kwargs.get('params'), headers)
+            return self.single_flight.do(key, lambda: self._request_with_retries(method, url, args, kwargs, operation, page, gate))
+        return self._request_with_retries(method, url, args, kwargs, operation, page, gate)
+
+    def _request_with_retries(self, method, url, args, kwargs, operation, page, gate=None):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self._send_attempt(gate, method, url, args, kwargs, operation, page, attempt)
+            except (ConnectionError, Timeout):
+                if self.retry_policy is None or not self.retry_policy.should_retry_error(method, attempt):
+                    raise
+                time.sleep(self.retry_policy.get_delay(attempt))
+                attempt += 1
+                continue
+            if self.retry_policy is None or not self.retry_policy.should_retry(method, response.status_code, attempt):
+                return response
+            self._wait_before_retry(attempt, response, gate)
+            attempt += 1
+
+    # The gate is only held while the attempt is in flight, so backoff delays are never waited out inside it
+    def _send_attempt(self, gate, method, url, args, kwargs, operation, page, attempt):
+        if gate is None:
+            return self._send(method, url, args, kwargs, operation, page, attempt)
+        gate.enter()
+        try:
+            return self._send(method, url, args, kwargs, operation, page, attempt)
+        finally:
+            gate.exit()
+
+    def _send(self, method, url, args, kwargs, operation, page, attempt):
+        if not self.instrumentation.enabled:
+            return super().request(method, url, *args, **kwargs)
+        event = RequestEvent(operation or method.lower() + ' ' + urlsplit(url).path, method, url, page=page, attempt=attempt,
+            request_size=Instrumentation.payload_size(kwargs.get('data')))
+        self.instrumentation.before_request(event)
+        started_at = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except Exception as error:
+            event.latency = time.perf_counter() - started_at
+            event.error = error
+            self.instrumentation.after_response(event)
+            raise
+        event.latency = time.perf_counter() - started_at
+        event.status_code = response.status_code
+        event.response_size = len(response.content)
+        self.instrumentation.after_response(event)
+        return response
+
+    def _wait_before_retry(self, attempt, response, gate=None):
+        delay = self.retry_policy.get_delay(attempt, response)
+        # A throttled client backs off as a whole rather than one thread at a time
+        if response.status_code == 429 and gate is not None:
+            gate.throttle(delay)
+        elif response.status_code == 429 and self.rate_limiter is not None:
+            self.rate_limiter.pause(delay)
+        else:
+            time.sleep(delay)
+
+# A view of a RebrandlySession that adds its own headers, e.g. another api key or workspace, to every request.
+# It sends through the wrapped session, so views for any number of tenants share its connection pools, retries and rate limiter.
+class ScopedSession:
+    def __init__(self, session, scoped_headers):
+        self.session = session
+        self.scoped_headers = scoped_headers
+
+    # The headers requests are sent with, changing the returned dict has no effect
+    @property
+    def headers(self):
+        headers = CaseInsensitiveDict(self.session.headers)
+        headers.update(self.scoped_headers)
+        return headers
+
+    def request(self, method, url, *args, headers=None, **kwargs):
+        request_headers = CaseInsensitiveDict(self.scoped_headers)
+        request_headers.update(headers or {})
+        return self.session.request(method, url, *args, headers=request_headers, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self.request('POST', url, data=data, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    # The connection pools belong to the wrapped session
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
@@ -0,0 +1,144 @@
+import heapq
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+class ShardedScan:
+    def __init__(self, links, shards, max_workers=4, order_by='', order_dir='', list_params=None, queue_size=2):
+        if len(shards) == 0:
+            raise ValueError('At least one shard must be specified.')
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        self.links = links
+        self.shards = shards
+        self.max_workers = max_workers
+        self.order_by = order_by
+        self.order_dir = order_dir
+        self.list_params = list_params or {}
+        self.queue_size = queue_size
+
+    # Splits [date_from, date_to) into shard_count windows of equal length
+    @staticmethod
+    def date_range_shards(date_from, date_to, shard_count):
+        start = ShardedScan._to_datetime(date_from)
+        end = ShardedScan._to_datetime(date_to)
+        if end <= start:
+            raise ValueError('date_to must be later than date_from.')
+        if shard_count < 1:
+            raise ValueError('shard_count must be at least 1.')
+        step = (end - start) / shard_count
+        boundaries = [start + step * i for i in range(shard_count)] + [end]
+        return [{'date_from': boundaries[i].isoformat(), 'date_to': boundaries[i + 1].isoformat()} for i in range(shard_count)]
+
+    @staticmethod
+    def domain_shards(domain_ids):
+        return [{'domain_id': domain_id} for domain_id in domain_ids]
+
+    @staticmethod
+    def _to_datetime(value):
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+        return datetime.fromisoformat(value)
+
+    # Shards are walked one page at a time on a pool of max_workers threads. A shard is only fetched further while fewer than
+    # queue_size of its pages wait to be consumed, so a worker never blocks on a slow consumer or on another shard.
+    def __iter__(self):
+        # The API lists newest first when no direction is given
+        order_dir = self.order_dir or 'desc'
+        list_params = dict(self.list_params, order_by=self.order_by, order_dir=order_dir)
+        run = _ScanRun(self.links, [_ShardWalk(dict(list_params, **shard)) for shard in self.shards], self.max_workers, self.queue_size)
+        try:
+            if self.order_by:
+                reverse = order_dir.lower() == 'desc'
+                yield from heapq.merge(*(run.links_of([walk]) for walk in run.walks), key=self._order_key, reverse=reverse)
+            else:
+                yield from run.links_of(run.walks)
+        finally:
+            run.stop()
+
+    def _order_key(self, link):
+        return link.get(self.order_by) or ''
+
+class _ShardWalk:
+    def __init__(self, list_params):
+        self.list_params = list_params
+        self.page = None
+        # Fetched pages not consumed yet, or the exception that ended the walk
+        self.pages = deque()
+        self.fetching = False
+        self.done = False
+
+class _ScanRun:
+    def __init__(self, links, walks, max_workers, queue_size):
+        self.links = links
+        self.walks = walks
+        self.queue_size = queue_size
+        self.stopped = False
+        self.condition = threading.Condition()
+        self.executor = ThreadPoolExecutor(max_workers=min(max_workers, len(walks)), thread_name_prefix='rebrandly-scan')
+        with self.condition:
+            for walk in walks:
+                self._schedule(walk)
+
+    # Called with the condition held
+    def _schedule(self, walk):
+        if not (self.stopped or walk.fetching or walk.done) and len(walk.pages) < self.queue_size:
+            walk.fetching = True
+            self.executor.submit(self._fetch_page, walk)
+
+    def _fetch_page(self, walk):
+        try:
+            items = self._next_items(walk)
+        except Exception as error:
+            items = error
+        with self.condition:
+            walk.fetching = False
+            if items:
+                walk.pages.append(items)
+            if not items or isinstance(items, Exception):
+                walk.done = True
+            self._schedule(walk)
+            self.condition.notify_all()
+
+    # Returns the links of the shard's next page, or None once it has no more
+    def _next_items(self, walk):
+        if walk.page is None:
+            walk.page = self.links.list(**walk.list_params)
+        else:
+            iteration_count = walk.page.iteration_count
+            walk.page.next()
+            if walk.page.iteration_count == iteration_count:
+                return None
+        if walk.page is None or walk.page.current_items_count == 0:
+            return None
+        return list(walk.page.current_items)
+
+    # Yields the links of walks, page by page in the order their pages arrive
+    def links_of(self, walks):
+        while True:
+            page = self._take_page(walks)
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield from page
+
+    def _take_page(self, walks):
+        with self.condition:
+            while True:
+                for walk in walks:
+                    if walk.pages:
+                        page = walk.pages.popleft()
+                        self._schedule(walk)
+                        return page
+                if all(walk.done for walk in walks):
+                    return None
+                self.condition.wait()
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
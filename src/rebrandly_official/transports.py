@@ -0,0 +1,119 @@
+import json
+import os
+import ssl
+import threading
+from urllib.parse import urlsplit, parse_qs
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
+from requests.structures import CaseInsensitiveDict
+from requests.utils import select_proxy
+
+# Transports are requests adapters, so retries, rate limiting and instrumentation in RebrandlySession apply to all of them
+
+class RequestsTransport(HTTPAdapter):
+    def __init__(self, pool_maxsize=10, pool_block=False, max_retries=0):
+        super().__init__(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=pool_block, max_retries=max_retries)
+
+def _build_response(request, status_code, content, headers, reason=None):
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = 'utf-8'
+    response.reason = reason
+    response.url = request.url
+    response.request = request
+    return response
+
+# Answers requests by calling handler(method, path, params, body, headers), which returns (status_code, json_body) or
+# (status_code, json_body, headers). Nothing touches the network, which makes it suitable for tests and load simulation.
+class InMemoryTransport(BaseAdapter):
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.request_count = 0
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.request_count += 1
+        url_parts = urlsplit(request.url)
+        params = {key: values[-1] for key, values in parse_qs(url_parts.query, keep_blank_values=True).items()}
+        body = json.loads(request.body) if request.body else None
+        result = self.handler(request.method, url_parts.path, params, body, request.headers)
+        headers = dict(result[2]) if len(result) > 2 else {}
+        headers.setdefault('Content-Type', 'application/json')
+        return _build_response(request, result[0], json.dumps(result[1]).encode('utf-8'), headers)
+
+    def close(self):
+        pass
+
+# Maps the verify and cert values of requests onto what httpx accepts as verify
+def _ssl_verify(verify, cert):
+    if verify is True and cert is None:
+        return True
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str):
+        context = ssl.create_default_context(capath=verify) if os.path.isdir(verify) else ssl.create_default_context(cafile=verify)
+    else:
+        # The CA bundle httpx verifies against by default, certifi is one of its dependencies
+        import certifi
+        context = ssl.create_default_context(cafile=certifi.where())
+    if isinstance(cert, tuple):
+        context.load_cert_chain(*cert)
+    elif cert is not None:
+        context.load_cert_chain(cert)
+    return context
+
+# Sends requests through a pooled httpx client, over HTTP/2 when the server supports it. Requires httpx[http2].
+class Http2Transport(BaseAdapter):
+    def __init__(self, max_connections=100, max_keepalive_connections=20, http2=True):
+        # Imported here so using the other transports never pays for importing httpx
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("Http2Transport requires httpx. Install it with: pip install rebrandly-official[http2]")
+        super().__init__()
+        self.httpx = httpx
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        self.http2 = http2
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        httpx = self.httpx
+        client = self._client(verify, cert, select_proxy(request.url, proxies or {}))
+        try:
+            response = client.request(request.method, request.url, headers=dict(request.headers), content=request.body,
+                timeout=self._timeout(timeout))
+        # Mapped onto the requests exceptions RetryPolicy and callers already handle
+        except httpx.ConnectTimeout as error:
+            raise ConnectTimeout(error, request=request)
+        except httpx.TimeoutException as error:
+            raise ReadTimeout(error, request=request)
+        except httpx.TransportError as error:
+            raise ConnectionError(error, request=request)
+        headers = {key: value for key, value in response.headers.items() if key.lower() != 'content-encoding'}
+        return _build_response(request, response.status_code, response.content, headers, response.reason_phrase)
+
+    # httpx takes TLS settings and the proxy per client, so one pooled client is kept for every combination requests passes in
+    def _client(self, verify, cert, proxy):
+        key = (verify, cert, proxy)
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = self.httpx.Client(limits=self.limits, http2=self.http2, verify=_ssl_verify(verify, cert), proxy=proxy)
+            return self._clients[key]
+
+    def _timeout(self, timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self.httpx.Timeout(read, connect=connect)
+        return self.httpx.Timeout(timeout)
+
+    def close(self):
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
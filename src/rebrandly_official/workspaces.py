@@ -1,17 +1,32 @@
-import json
 from requests.exceptions import HTTPError
 from .paginated_response import PaginatedResponse
+from .codec import default_codec
+from .models import Workspace, Domain
+from .concurrency import ConcurrentExecutor
 
 class Workspaces:
     WORKSPACE_TYPES = {'classic','extended'}
 
-    def __init__(self, session):
+    def __init__(self, session, codec=None, use_models=False, executor=None, api_url='https://api.rebrandly.com/'):
         self.session = session
-        self.base_workspaces_uri = 'https://api.rebrandly.com/v1/workspaces'
+        self.codec = codec or default_codec()
+        self.use_models = use_models
+        self.executor = executor or ConcurrentExecutor()
+        self.base_workspaces_uri = api_url + 'v1/workspaces'
+
+    # With use_models, results are returned as slotted model objects instead of dicts
+    def _as_model(self, model, value):
+        if not self.use_models:
+            return value
+        if isinstance(value, list):
+            return model.from_list(value)
+        if isinstance(value, dict):
+            return model(value)
+        return value
 
     def evaluate_response_status_code_return_object(self, response, request_type, object_id):
         if response.status_code == 200:
-            response_json = json.loads(response.text)
+            response_json = self.codec.loads(response.content)
             if response_json:
                 return response_json
             else:
@@ -19,7 +34,7 @@ class Workspaces:
         elif response.status_code == 401:
             raise HTTPError(f"{request_type} request failed for workspace with id {object_id} as the request was unauthorized. Please ensure a valid api key is specified.")
         elif response.status_code == 403:
-            response_json = json.loads(response.text)
+            response_json = self.codec.loads(response.content)
             code = response_json["code"]
             if response.request.method == "DELETE":
                 if code == 'CouldNotDeleteExtendedWorkspace':
@@ -32,8 +47,9 @@ class Workspaces:
         elif response.status_code == 404:
             raise ValueError(f"{request_type} request failed for workspace with id {object_id} as the resource was not found. Please ensure all ids specified are correct.")
         else:
-            raise HTTPError(f"{request_type} request failed for workspace with id {object_id}", json.loads(response.text))
-        raise HTTPError(f"{request_type} request failed for workspace with id {object_id}", json.loads(response.text))
+            raise HTTPError(f"{request_type} request failed for workspace with id {object_id}", self.codec.loads(response.content))
+        # Only reached from the 403 branch, which has already decoded the body
+        raise HTTPError(f"{request_type} request failed for workspace with id {object_id}", response_json)
 
     def create(self, name, type, domain_ids=[]):
         workspace_type = type.lower()
@@ -41,37 +57,40 @@ class Workspaces:
             workspace_types_str = ", ".join(self.WORKSPACE_TYPES)
             raise ValueError(f'Workspace type must be one of the following: {workspace_types_str}')
         workspace_config = {"name":name, "type":type}
-        data = json.dumps(workspace_config)
-        response = self.session.post(self.base_workspaces_uri, data=data)
+        data = self.codec.dumps(workspace_config)
+        response = self.session.post(self.base_workspaces_uri, data=data, operation='workspaces.create')
         workspace = self.evaluate_response_status_code_return_object(response, 'Create', '')
-        for domain_id in domain_ids:
-                add_domain_to_workspace_url = self.base_workspaces_uri + '/' + workspace["id"] + '/domains/' + domain_id
-                add_domain_response = self.session.post(add_domain_to_workspace_url)
-                self.evaluate_response_status_code_return_object(add_domain_response, 'Associate domains', workspace["id"])
+        self.executor.map(lambda domain_id: self._associate_domain(workspace["id"], domain_id), domain_ids)
         return workspace
 
+    def _associate_domain(self, workspace_id, domain_id):
+        add_domain_to_workspace_url = self.base_workspaces_uri + '/' + workspace_id + '/domains/' + domain_id
+        add_domain_response = self.session.post(add_domain_to_workspace_url, operation='workspaces.associate_domain')
+        return self.evaluate_response_status_code_return_object(add_domain_response, 'Associate domains', workspace_id)
+
     def get(self, workspace_id):
         url = self.base_workspaces_uri + '/' + workspace_id
-        response = self.session.get(url)
-        return self.evaluate_response_status_code_return_object(response, 'Get', '')
+        response = self.session.get(url, operation='workspaces.get')
+        return self._as_model(Workspace, self.evaluate_response_status_code_return_object(response, 'Get', ''))
 
     def list(self):
-        response = self.session.get(self.base_workspaces_uri)
-        if type(self.evaluate_response_status_code_return_object(response, 'List', 'all')) == list:
-            return PaginatedResponse(response, self.session)
+        response = self.session.get(self.base_workspaces_uri, operation='workspaces.list', page=1)
+        workspaces = self.evaluate_response_status_code_return_object(response, 'List', 'all')
+        if type(workspaces) == list:
+            return PaginatedResponse(response, self.session, items=workspaces, codec=self.codec, model=Workspace if self.use_models else None, operation='workspaces.list')
 
     def update(self, workspace_id, name=''):
         url = self.base_workspaces_uri + '/' + workspace_id
-        data = json.dumps({"name":name})
-        response = self.session.post(url, data=data)
+        data = self.codec.dumps({"name":name})
+        response = self.session.post(url, data=data, operation='workspaces.update')
         return self.evaluate_response_status_code_return_object(response, 'Update', workspace_id)
 
     def delete(self, workspace_id):
         url = self.base_workspaces_uri + '/' + workspace_id
-        response = self.session.delete(url)
+        response = self.session.delete(url, operation='workspaces.delete')
         return self.evaluate_response_status_code_return_object(response, 'Delete', workspace_id)
 
     def get_domains(self, workspace_id):
         url = self.base_workspaces_uri + '/' + workspace_id + '/domains'
-        response = self.session.get(url)
-        return self.evaluate_response_status_code_return_object(response, 'Get domains', workspace_id)
\ No newline at end of file
+        response = self.session.get(url, operation='workspaces.get_domains')
+        return self._as_model(Domain, self.evaluate_response_status_code_return_object(response, 'Get domains', workspace_id))
\ No newline at end of file
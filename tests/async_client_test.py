@@ -0,0 +1,118 @@
+import asyncio
+import json
+import pytest
+from requests.exceptions import HTTPError
+
+httpx = pytest.importorskip("httpx")
+
+from src.rebrandly_official.async_rebrandly_client import AsyncRebrandlyClient
+from src.rebrandly_official.async_paginated_response import AsyncPaginatedResponse
+from src.rebrandly_official.concurrency import BatchError
+
+all_links = [{"id": f"link{i}", "destination": "https://rb.gy"} for i in range(5)]
+
+def handler(request):
+    if request.url.path == '/v1/links' and request.method == 'GET':
+        limit = int(request.url.params.get('limit') or 25)
+        last = request.url.params.get('last')
+        start = 0
+        if last:
+            start = [link['id'] for link in all_links].index(last) + 1
+        return httpx.Response(200, json=all_links[start:start + limit])
+    if request.url.path == '/v1/links' and request.method == 'PUT':
+        return httpx.Response(200, json=[dict(link, id=f"created-{link['slashtag']}") for link in json.loads(request.content)])
+    if request.url.path == '/v1/links' and request.method == 'POST':
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"id": "new", "destination": body["destination"]})
+    if request.url.path == '/v1/links/link0/apps':
+        return httpx.Response(200, json=[{"id": "ios"}, {"id": "android"}])
+    if request.url.path.startswith('/v1/links/link0/apps/') and request.method == 'DELETE':
+        return httpx.Response(200, json={})
+    return httpx.Response(404, json={"code": "NotFound", "source": "link"})
+
+def test_async_link_create_and_list_all_pages():
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            link = await client.links.create('https://rb.gy')
+            assert link['destination'] == 'https://rb.gy'
+
+            page_of_links = await client.links.list(limit=2)
+            assert page_of_links.current_items_count == 2
+            listed = [link async for link in page_of_links]
+            assert [link['id'] for link in listed] == [link['id'] for link in all_links]
+            assert page_of_links.iteration_count == 3
+            assert page_of_links.total_items_count == 5
+    asyncio.run(run())
+
+def test_async_delete_deep_links():
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            assert await client.links.delete_deep_links('link0') == 2
+    asyncio.run(run())
+
+def test_async_get_missing_link_raises():
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(HTTPError):
+                await client.links.get('missing')
+    asyncio.run(run())
+
+def test_async_iter_all_prefetches_pages():
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            page_of_links = await client.links.list(limit=2)
+            listed = [link async for link in page_of_links.iter_all(prefetch=2)]
+            assert [link['id'] for link in listed] == [link['id'] for link in all_links]
+    asyncio.run(run())
+
+def test_async_resume_from_checkpoint():
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            checkpoints = []
+            page_of_links = (await client.links.list(limit=2)).on_checkpoint(checkpoints.append)
+            await page_of_links.next()
+            resumed = await AsyncPaginatedResponse.from_checkpoint(checkpoints[-1], client.session)
+            listed = [link async for link in resumed]
+            assert [link['id'] for link in listed] == ['link2', 'link3', 'link4']
+            assert resumed.total_items_count == 5
+    asyncio.run(run())
+
+def test_async_update_without_changes_sends_nothing():
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            events = []
+            client.instrumentation.on_request(events.append)
+            link = dict(all_links[0], title='Title', favourite=False)
+            assert await client.links.update('link0', link['destination'], 'Title', favourite=False, current=link) == link
+            assert events == []
+    asyncio.run(run())
+
+def test_async_bulk_create_stream_yields_outcomes_in_input_order():
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            links = [{"destination": "https://rb.gy", "slashtag": f"tag{i}", "domain": {"id": "domain"}} for i in range(5)]
+            links.insert(2, {"slashtag": "no-destination", "domain": {"id": "domain"}})
+            outcomes = [outcome async for outcome in client.links.bulk_create_stream('', links, chunk_size=2, max_in_flight=2)]
+            assert [index for index, _, _ in outcomes] == list(range(6))
+            assert isinstance(outcomes[2][2], KeyError)
+            assert [created_link['id'] for _, created_link, error in outcomes if error is None] == [f'created-tag{i}' for i in range(5)]
+    asyncio.run(run())
+
+def test_async_workspace_create_waits_for_every_domain_and_raises_them_together():
+    associated = []
+    def workspace_handler(request):
+        if request.url.path == '/v1/workspaces':
+            return httpx.Response(200, json={"id": "workspace"})
+        domain_id = request.url.path.rsplit('/', 1)[-1]
+        associated.append(domain_id)
+        if domain_id.startswith('bad'):
+            return httpx.Response(404, json={"code": "NotFound", "source": "domain"})
+        return httpx.Response(200, json={})
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(workspace_handler)) as client:
+            with pytest.raises(ValueError) as error:
+                await client.workspaces.create('Team', 'extended', domain_ids=['bad1', 'good', 'bad2'])
+            assert isinstance(error.value, BatchError)
+            assert sorted(error.value.errors) == [0, 2]
+            assert sorted(associated) == ['bad1', 'bad2', 'good']
+    asyncio.run(run())
@@ -0,0 +1,40 @@
+from benchmarks.fake_server import FakeRebrandlyApi, FakeRebrandlyServer
+from benchmarks.suite import SCENARIOS, run_benchmarks
+from benchmarks.model_memory import run_model_memory_benchmark
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from src.rebrandly_official.retry_policy import RetryPolicy
+from tests.fake_client import create_client
+
+def test_every_scenario_runs_against_the_fake_server():
+    results = run_benchmarks(size=30)
+    assert [result.name for result in results] == list(SCENARIOS)
+    for result in results:
+        assert result.operations == 30
+        assert result.errors == 0
+        assert result.percentile(0.99) >= result.percentile(0.5) > 0
+
+def test_injected_errors_are_retried_for_reads():
+    results = run_benchmarks(size=20, scenarios=['get'], error_rate=0.2, seed=1)
+    assert results[0].errors == 0
+
+def test_models_hold_less_memory_than_dicts():
+    results = run_model_memory_benchmark(size=200)
+    assert all(result['ratio'] < 0.6 for result in results.values())
+
+def test_client_talks_to_the_configured_api_url():
+    with FakeRebrandlyServer() as server:
+        client = RebrandlyClient('api-key', api_url=server.url, enterprise_api_url=server.url)
+        link = client.links.create('https://example.com')
+        route = client.links.create_route(link['id'], {"destination": "https://example.com/mobile", "condition": {}})
+        assert client.links.list_routes(link['id']) == [route]
+        assert client.links.count() == 1
+        assert server.api.request_count == 4
+
+def test_fake_api_paginates_like_the_api():
+    api = FakeRebrandlyApi()
+    seeded = api.seed_links(60)
+    client, transport = create_client(api.handle, retry_policy=RetryPolicy(backoff_factor=0))
+    listed = list(client.links.list().iter_all())
+    assert [link['id'] for link in listed] == [link['id'] for link in reversed(seeded)]
+    assert client.links.bulk_delete([link['id'] for link in seeded[:10]]) == 10
+    assert client.links.count() == 50
@@ -0,0 +1,56 @@
+from tests.fake_client import create_client
+
+invalid_domain_id = 'invalid-domain'
+
+def bulk_create_handler(method, path, params, body, headers):
+    if method == 'PUT' and path == '/v1/links':
+        if any(link.get('domainId') == invalid_domain_id for link in body):
+            return 403, {"errors": [{"property": "domain", "code": "NotFound"}]}
+        return 200, [dict(link, id=link['slashtag']) for link in body]
+    return 404, {"code": "NotFound", "source": "link"}
+
+def test_bulk_create_chunked_creates_in_chunks():
+    client, transport = create_client(bulk_create_handler)
+    link_array = [{"destination": "https://rb.gy", "slashtag": f"s{i}", "domainId": "domain"} for i in range(25)]
+
+    result = client.links.bulk_create_chunked('workspace', link_array, chunk_size=10)
+
+    assert result.ok
+    assert transport.request_count == 3
+    assert result.succeeded_indices == list(range(25))
+    assert [link['id'] for link in result.created_links] == [f"s{i}" for i in range(25)]
+
+def test_bulk_create_chunked_reports_failed_indices():
+    client, transport = create_client(bulk_create_handler)
+    link_array = [{"destination": "https://rb.gy", "slashtag": f"s{i}", "domainId": "domain"} for i in range(8)]
+    link_array[2] = {"destination": "https://rb.gy", "slashtag": "no-domain"}
+    link_array[5]["domainId"] = invalid_domain_id
+
+    result = client.links.bulk_create_chunked('workspace', link_array, chunk_size=4)
+
+    assert not result.ok
+    assert result.failed_indices == [2, 5]
+    assert isinstance(result.errors[2], KeyError)
+    assert result.succeeded_indices == [0, 1, 3, 4, 6, 7]
+
+def test_bulk_create_chunked_does_not_split_chunks_failing_as_a_whole():
+    client, transport = create_client(lambda *args: (401, {"code": "Unauthorized"}))
+    link_array = [{"destination": "https://rb.gy", "slashtag": f"s{i}", "domainId": "domain"} for i in range(100)]
+
+    result = client.links.bulk_create_chunked('workspace', link_array, chunk_size=50)
+
+    assert result.failed_indices == list(range(100))
+    assert transport.request_count == 2
+
+def test_bulk_create_chunked_validates_each_link_once():
+    client, transport = create_client(bulk_create_handler)
+    checked = []
+    link_errors = client.links.validator.link_errors
+    client.links.validator.link_errors = lambda link: checked.append(link) or link_errors(link)
+    link_array = [{"destination": "https://rb.gy", "slashtag": f"s{i}", "domainId": "domain"} for i in range(8)]
+    link_array[5]["domainId"] = invalid_domain_id
+
+    result = client.links.bulk_create_chunked('workspace', link_array, chunk_size=8)
+
+    assert result.failed_indices == [5]
+    assert len(checked) == 8
@@ -0,0 +1,109 @@
+import threading
+import time
+from src.rebrandly_official.client_pool import FairScheduler, RebrandlyClientPool
+from src.rebrandly_official.retry_policy import RetryPolicy
+from src.rebrandly_official.transports import InMemoryTransport
+
+def wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+def test_scheduler_takes_turns_between_waiting_tenants():
+    scheduler = FairScheduler(max_concurrency=1)
+    scheduler.acquire('noisy')
+    order = []
+    def request(tenant):
+        scheduler.acquire(tenant)
+        order.append(tenant)
+
+    threads = []
+    for queued, tenant in enumerate(['noisy', 'noisy', 'noisy', 'quiet', 'other']):
+        thread = threading.Thread(target=request, args=(tenant,), daemon=True)
+        thread.start()
+        threads.append(thread)
+        wait_until(lambda: scheduler.queued() == queued + 1)
+    for granted in range(1, 6):
+        scheduler.release()
+        wait_until(lambda: len(order) == granted)
+    for thread in threads:
+        thread.join()
+
+    assert order == ['noisy', 'quiet', 'other', 'noisy', 'noisy']
+    assert scheduler.started == {'noisy': 4, 'quiet': 1, 'other': 1}
+
+def test_tenants_share_the_transport_and_send_their_own_key():
+    seen_keys = []
+    def handler(method, path, params, body, headers):
+        seen_keys.append(headers['apikey'])
+        return 200, {"id": "abc"}
+    transport = InMemoryTransport(handler)
+    pool = RebrandlyClientPool(transport=transport)
+
+    assert pool.client('first-key').links.get('abc') == {"id": "abc"}
+    assert pool.client('second-key').links.count is not None
+    pool.client('second-key').domains.list()
+
+    assert seen_keys == ['first-key', 'second-key']
+    assert pool.client('first-key') is pool.client('first-key')
+    assert pool.stats()["tenants"] == {'first-key': {"requests": 1, "queued": 0}, 'second-key': {"requests": 1, "queued": 0}}
+
+def test_each_key_gets_its_own_rate_budget():
+    pool = RebrandlyClientPool(rate=5, transport=InMemoryTransport(lambda *args: (200, {"id": "abc"})))
+    limited = pool.client('limited-key', rate=1, burst=1)
+    default = pool.client('default-key')
+    assert limited.session.rate_limiter.rate == 1
+    assert default.session.rate_limiter.rate == 5
+    assert limited.session.rate_limiter is not default.session.rate_limiter
+
+def test_a_noisy_tenant_does_not_starve_others():
+    def handler(method, path, params, body, headers):
+        time.sleep(0.01)
+        if method == 'PUT':
+            return 200, [dict(link, id='created') for link in body]
+        return 200, {"id": "abc"}
+    pool = RebrandlyClientPool(max_concurrency=2, transport=InMemoryTransport(handler))
+    links = [{"destination": "https://rb.gy", "domainId": "domain"} for _ in range(40)]
+    noisy = threading.Thread(target=pool.client('noisy-key').links.bulk_create_chunked, args=(None, links), kwargs={"chunk_size": 1}, daemon=True)
+    noisy.start()
+    wait_until(lambda: pool.scheduler.queued('noisy-key') > 0)
+
+    started_at = time.monotonic()
+    pool.client('quiet-key').links.get('abc')
+    waited = time.monotonic() - started_at
+    noisy.join()
+
+    # Served within a couple of turns rather than behind all 40 queued chunks
+    assert waited < 0.15
+    pool.close()
+
+def test_a_throttled_tenant_backs_off_without_holding_a_slot():
+    throttled = threading.Event()
+    def handler(method, path, params, body, headers):
+        if headers['apikey'] == 'throttled-key' and not throttled.is_set():
+            throttled.set()
+            return 429, {"code": "TooManyRequests"}, {"Retry-After": "0.5"}
+        return 200, {"id": "abc"}
+    pool = RebrandlyClientPool(rate=100, max_concurrency=1, transport=InMemoryTransport(handler), retry_policy=RetryPolicy(max_retries=1))
+    throttled_client = pool.client('throttled-key')
+    thread = threading.Thread(target=throttled_client.links.get, args=('abc',), daemon=True)
+    thread.start()
+    throttled.wait(5)
+
+    started_at = time.monotonic()
+    pool.client('quiet-key').links.get('abc')
+    assert time.monotonic() - started_at < 0.25
+    # Only the throttled tenant's own budget was paused
+    assert throttled_client.session.rate_limiter.reserve() > 0.2
+    assert pool.client('quiet-key').session.rate_limiter.reserve() < 0.1
+    thread.join()
+    pool.close()
+
+def test_tenants_fan_out_on_their_own_executors():
+    pool = RebrandlyClientPool(tenant_max_workers=2, transport=InMemoryTransport(lambda *args: (200, {"id": "abc"})))
+    first, second = pool.client('first-key'), pool.client('second-key')
+    assert first.executor is not second.executor
+    assert first.links.executor is first.executor
+    assert first.executor.max_workers == 2
+    pool.close()
@@ -0,0 +1,38 @@
+from src.rebrandly_official.codec import JsonCodec
+from tests.fake_client import create_client
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        self.dumps_count = 0
+        self.loads_count = 0
+
+    def dumps(self, obj):
+        self.dumps_count += 1
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loads_count += 1
+        return super().loads(data)
+
+all_links = [{"id": f"link{i}"} for i in range(6)]
+
+def handler(method, path, params, body, headers):
+    if method == 'POST':
+        return 200, dict(body, id='new')
+    start = [link['id'] for link in all_links].index(params['last']) + 1 if params.get('last') else 0
+    return 200, all_links[start:start + 2]
+
+def test_every_response_body_is_decoded_once():
+    codec = CountingCodec()
+    client, transport = create_client(handler, codec=codec)
+
+    page_of_links = client.links.list(limit=2)
+    assert codec.loads_count == 1
+    assert len(list(page_of_links.iter_all())) == 6
+    assert codec.loads_count == 4
+
+def test_request_bodies_are_encoded_with_the_codec():
+    codec = CountingCodec()
+    client, transport = create_client(handler, codec=codec)
+    assert client.links.create('https://rb.gy')['destination'] == 'https://rb.gy'
+    assert codec.dumps_count == 1
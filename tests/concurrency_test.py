@@ -0,0 +1,82 @@
+import threading
+import time
+import pytest
+from src.rebrandly_official.concurrency import ConcurrentExecutor, BatchError
+from tests.fake_client import create_client
+
+def test_map_returns_results_in_input_order():
+    executor = ConcurrentExecutor(max_workers=4)
+    def slow_double(value):
+        time.sleep(0.01 * (5 - value))
+        return value * 2
+    assert executor.map(slow_double, range(5)) == [0, 2, 4, 6, 8]
+
+def test_map_collects_every_failure():
+    executor = ConcurrentExecutor(max_workers=4)
+    calls = []
+    def fail_on_odd(value):
+        calls.append(value)
+        if value % 2:
+            raise ValueError(value)
+        return value
+
+    with pytest.raises(BatchError) as error:
+        executor.map(fail_on_odd, range(6))
+    assert sorted(calls) == list(range(6))
+    assert sorted(error.value.errors) == [1, 3, 5]
+    assert isinstance(error.value, ValueError)
+
+    with pytest.raises(ValueError):
+        executor.map(fail_on_odd, [0, 1, 2])
+
+    results = executor.map(fail_on_odd, [0, 1], return_exceptions=True)
+    assert results[0] == 0 and isinstance(results[1], ValueError)
+
+def test_failures_of_a_class_that_cannot_be_combined_still_raise_a_batch_error():
+    executor = ConcurrentExecutor(max_workers=2)
+    def fail(value):
+        raise AttributeError(value)
+    with pytest.raises(BatchError) as error:
+        executor.map(fail, [1, 2])
+    assert sorted(error.value.errors) == [0, 1]
+    assert all(isinstance(failure, AttributeError) for failure in error.value.errors.values())
+
+def test_nested_map_does_not_deadlock():
+    executor = ConcurrentExecutor(max_workers=1)
+    assert executor.map(lambda value: sum(executor.map(lambda inner: inner, range(value))), [3, 4]) == [3, 6]
+
+def test_max_concurrency_bounds_calls_in_flight():
+    executor = ConcurrentExecutor(max_workers=8)
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+    def track(value):
+        with lock:
+            in_flight.append(value)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(value)
+    executor.map(track, range(10), max_concurrency=2)
+    assert max(peak) <= 2
+
+def test_delete_deep_links_and_workspace_domains_fan_out():
+    requests = []
+    def handler(method, path, params, body, headers):
+        requests.append((method, path))
+        if path == '/v1/links/abc/apps' and method == 'GET':
+            return 200, [{"id": f"app{i}"} for i in range(3)]
+        if path == '/v1/workspaces' and method == 'POST':
+            return 200, {"id": "workspace"}
+        if path.endswith('/domains/missing'):
+            return 404, {"code": "NotFound"}
+        return 200, {"id": path.split('/')[-1]}
+    client, transport = create_client(handler)
+
+    assert client.links.delete_deep_links('abc') == 3
+    assert sorted(path for method, path in requests if method == 'DELETE') == [f'/v1/links/abc/apps/app{i}' for i in range(3)]
+
+    assert client.workspaces.create('workspace', 'classic', domain_ids=['d1', 'd2'])['id'] == 'workspace'
+    with pytest.raises(ValueError):
+        client.workspaces.create('workspace', 'classic', domain_ids=['d1', 'missing', 'd3'])
+    assert [path for _, path in requests].count('/v1/workspaces/workspace/domains/d3') == 1
@@ -0,0 +1,8 @@
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from src.rebrandly_official.transports import InMemoryTransport
+
+# Returns a client whose requests an InMemoryTransport answers with handler(method, path, params, body, headers), such as
+# FakeRebrandlyApi().handle, and that transport, which counts them
+def create_client(handler, **options):
+    transport = InMemoryTransport(handler)
+    return RebrandlyClient('api-key', transport=transport, **options), transport
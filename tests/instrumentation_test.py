@@ -0,0 +1,71 @@
+from src.rebrandly_official.retry_policy import RetryPolicy
+from src.rebrandly_official.instrumentation import LatencyHistogram, RequestEvent
+from tests import fake_client
+
+all_links = [{"id": f"link{i}", "destination": "https://rb.gy"} for i in range(5)]
+
+def handler(method, path, params, body, headers):
+    if method == 'GET' and path == '/v1/links':
+        start = 0
+        if params.get('last'):
+            start = [link['id'] for link in all_links].index(params['last']) + 1
+        return 200, all_links[start:start + int(params.get('limit') or 25)]
+    if method == 'POST' and path == '/v1/links':
+        return 200, {"id": "abc", "destination": body['destination']}
+    return 404, {"code": "NotFound", "source": "link"}
+
+def create_client(handler=handler, **kwargs):
+    client, _ = fake_client.create_client(handler, **kwargs)
+    events = []
+    client.instrumentation.on_response(events.append)
+    return client, events
+
+def test_events_report_operation_status_and_sizes():
+    client, events = create_client()
+    client.links.create('https://rb.gy')
+
+    event, = events
+    assert event.operation == 'links.create'
+    assert event.method == 'POST'
+    assert event.status_code == 200
+    assert event.request_size > 0
+    assert event.response_size == len(b'{"id": "abc", "destination": "https://rb.gy"}')
+    assert event.latency >= 0
+
+def test_paginated_requests_report_page_numbers():
+    client, events = create_client()
+    list(client.links.list(limit=2).iter_all())
+    assert [(event.operation, event.page) for event in events] == [('links.list', 1), ('links.list', 2), ('links.list', 3), ('links.list', 4)]
+
+def test_retries_are_reported_as_separate_attempts():
+    statuses = [429]
+    def throttling_handler(method, path, params, body, headers):
+        if statuses:
+            return statuses.pop(), {"code": "Throttled"}, {"Retry-After": "0"}
+        return handler(method, path, params, body, headers)
+    client, events = create_client(throttling_handler, retry_policy=RetryPolicy(backoff_factor=0))
+    client.links.create('https://rb.gy')
+    assert [(event.attempt, event.status_code) for event in events] == [(0, 429), (1, 200)]
+
+def test_failing_hooks_do_not_fail_requests():
+    client, events = create_client()
+    def failing_hook(event):
+        raise RuntimeError('hook failed')
+    client.instrumentation.on_request(failing_hook)
+    assert client.links.create('https://rb.gy')['id'] == 'abc'
+    client.instrumentation.remove_hook(failing_hook)
+    assert client.instrumentation.request_hooks == []
+
+def test_histogram_aggregates_latency_per_operation():
+    histogram = LatencyHistogram()
+    for latency in (0.001, 0.002, 0.003, 0.2):
+        event = RequestEvent('links.get', 'GET', 'https://api.rebrandly.com/v1/links/abc')
+        event.latency, event.status_code, event.response_size = latency, 200, 10
+        histogram(event)
+
+    stats = histogram.snapshot()['links.get']
+    assert stats['count'] == 4
+    assert stats['response_bytes'] == 40
+    assert stats['p50'] == 0.005
+    assert stats['p99'] == 0.2
+    assert histogram.percentile('links.list', 0.5) is None
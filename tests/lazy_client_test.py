@@ -0,0 +1,40 @@
+import json
+import subprocess
+import sys
+import pytest
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from tests.fake_client import create_client
+
+def loaded_modules_after(code):
+    script = f"import json, sys\n{code}\nprint(json.dumps([name for name in ('requests', 'httpx', 'asyncio', 'src.rebrandly_official.links') if name in sys.modules]))"
+    return json.loads(subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout)
+
+def test_constructing_a_client_imports_nothing_heavy():
+    assert loaded_modules_after("from src.rebrandly_official import RebrandlyClient\nRebrandlyClient('api-key')") == []
+
+def test_sub_clients_are_imported_on_first_use():
+    assert loaded_modules_after("from src.rebrandly_official import RebrandlyClient\nRebrandlyClient('api-key').links") == ['requests', 'src.rebrandly_official.links']
+
+def test_sub_clients_are_built_once_and_share_the_session():
+    client = RebrandlyClient('api-key')
+    assert client._session is None and client._links is None
+    assert client.links is client.links
+    assert client.links.session is client.session is client.workspaces.session
+    assert client.links.executor is client.workspaces.executor
+
+def test_header_updates_before_first_use_are_applied():
+    requests_headers = []
+    def handler(method, path, params, body, headers):
+        requests_headers.append((headers['apikey'], headers.get('workspace')))
+        return 200, {"id": "abc"}
+    client, transport = create_client(handler)
+    client.update_workspace('workspace')
+    client.links.get('abc')
+    client.update_api_key('other-key')
+    client.links.get('def')
+    assert requests_headers == [('api-key', 'workspace'), ('other-key', 'workspace')]
+
+def test_unknown_package_attributes_raise():
+    import src.rebrandly_official as package
+    with pytest.raises(AttributeError):
+        package.NotAClient
@@ -0,0 +1,62 @@
+from src.rebrandly_official.link_cache import LinkCache
+from tests.fake_client import create_client
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+def link_handler(method, path, params, body, headers):
+    if path.endswith('/rules'):
+        if method == 'GET':
+            return 200, [{"id": "route"}]
+        return 200, {"id": "route"}
+    if method == 'GET':
+        return 200, {"id": path.split('/')[3], "title": "a link"}
+    return 200, {"id": path.split('/')[3], "title": "updated"}
+
+def test_cached_reads_and_invalidation():
+    cache = LinkCache()
+    client, transport = create_client(link_handler, link_cache=cache)
+
+    assert client.links.get('abc')['title'] == 'a link'
+    assert client.links.get('abc')['title'] == 'a link'
+    assert client.links.list_routes('abc') == [{"id": "route"}]
+    assert client.links.list_routes('abc') == [{"id": "route"}]
+    assert transport.request_count == 2
+    assert cache.stats()['hits'] == 2
+
+    client.links.create_route('abc', {"destination": "https://rb.gy"})
+    client.links.list_routes('abc')
+    client.links.get('abc')
+    assert transport.request_count == 5
+
+def test_cached_reads_are_scoped_by_workspace():
+    client, transport = create_client(link_handler, link_cache=LinkCache())
+    client.links.get('abc')
+    client.update_workspace('other-workspace')
+    client.links.get('abc')
+    client.links.get('abc', workspace_id='third-workspace')
+    assert transport.request_count == 3
+
+def test_cached_values_cannot_be_mutated_by_callers():
+    client, transport = create_client(link_handler, link_cache=LinkCache())
+    client.links.get('abc')['title'] = 'changed'
+    assert client.links.get('abc')['title'] == 'a link'
+
+def test_ttl_expiry_and_lru_eviction():
+    clock = FakeClock()
+    cache = LinkCache(max_size=2, ttls={'link': 10}, clock=clock)
+    cache.set(('link', 'a'), {"id": "a"})
+    cache.set(('link', 'b'), {"id": "b"})
+    assert cache.get(('link', 'a')) == {"id": "a"}
+    cache.set(('link', 'c'), {"id": "c"})
+    assert cache.get(('link', 'b')) is None
+    assert cache.evictions == 1
+
+    clock.now = 11
+    assert cache.get(('link', 'a')) is None
+    assert cache.stats()['expirations'] == 1
+    assert len(cache) == 1
@@ -0,0 +1,69 @@
+import gzip
+import io
+import json
+from benchmarks.fake_server import FakeRebrandlyApi, FakeRebrandlyServer
+from src.rebrandly_official.link_export import export_links
+from tests.fake_client import create_client
+from src.rebrandly_official.__main__ import main
+
+def test_export_adds_sub_resources_to_every_link():
+    api = FakeRebrandlyApi()
+    links = api.seed_links(30)
+    client, transport = create_client(api.handle)
+    client.links.create_route(links[0]['id'], {"condition": {"property": "req.country", "operator": "eq", "values": ["it"]}, "destination": "https://example.it"})
+    client.links.set_opengraph(links[0]['id'], 'Title')
+    transport.request_count = 0
+    output = io.StringIO()
+
+    summary = export_links(client.links, output)
+    exported = {link['id']: link for link in map(json.loads, output.getvalue().splitlines())}
+    assert (summary.exported_count, summary.pages) == (30, 2)
+    assert set(exported) == {link['id'] for link in links}
+    assert exported[links[0]['id']]['routes'][0]['destination'] == 'https://example.it'
+    assert exported[links[0]['id']]['opengraph']['title'] == 'Title'
+    assert exported[links[1]['id']]['deepLinks'] == []
+    # Three pages and three sub-resources per link
+    assert transport.request_count == 3 + 30 * 3
+
+def test_export_records_sub_resource_failures_and_carries_on():
+    api = FakeRebrandlyApi()
+    links = api.seed_links(30)
+    failing_path = f"/v1/links/{links[4]['id']}/rules"
+    def handler(method, path, params, body, headers):
+        if path == failing_path:
+            return 500, {"code": "InternalError"}
+        return api.handle(method, path, params, body, headers)
+    client, transport = create_client(handler)
+    output = io.StringIO()
+
+    summary = export_links(client.links, output)
+    exported = {link['id']: link for link in map(json.loads, output.getvalue().splitlines())}
+    assert (summary.exported_count, summary.failed_count, summary.ok) == (30, 1, False)
+    assert 'routes' not in exported[links[4]['id']] and list(exported[links[4]['id']]['errors']) == ['routes']
+    assert exported[links[4]['id']]['opengraph'] is not None
+    assert all('errors' not in link for link_id, link in exported.items() if link_id != links[4]['id'])
+
+def test_incremental_export_stops_at_older_links():
+    api = FakeRebrandlyApi()
+    links = api.seed_links(30)
+    client, transport = create_client(api.handle)
+    watermark = export_links(client.links, io.StringIO(), sub_resources=()).watermark
+    client.links.update(links[3]['id'], 'https://example.com/updated', 'Updated', favourite=None)
+    transport.request_count = 0
+    output = io.StringIO()
+
+    summary = export_links(client.links, output, updated_since=watermark, sub_resources=())
+    exported = [json.loads(line) for line in output.getvalue().splitlines()]
+    # The link updated last before the previous export is included again, as its updatedAt equals the watermark
+    assert [link['id'] for link in exported] == [links[3]['id'], links[29]['id']]
+    assert summary.watermark > watermark
+    assert transport.request_count == 1
+
+def test_export_command_writes_gzip(tmp_path, capsys):
+    output = tmp_path / 'links.jsonl.gz'
+    with FakeRebrandlyServer() as server:
+        server.api.seed_links(10)
+        assert main(['export', str(output), '--api-key', 'api-key', '--api-url', server.url]) == 0
+    with gzip.open(output, 'rt') as exported:
+        assert len(exported.readlines()) == 10
+    assert json.loads(capsys.readouterr().err)['exported'] == 10
@@ -0,0 +1,57 @@
+import threading
+import time
+from requests.exceptions import HTTPError
+from benchmarks.fake_server import FakeRebrandlyApi
+from src.rebrandly_official.link_cache import LinkCache
+from tests.fake_client import create_client
+
+def create_seeded_client(link_count, **options):
+    api = FakeRebrandlyApi()
+    links = api.seed_links(link_count)
+    client, transport = create_client(api.handle, **options)
+    return client, links, transport
+
+def test_get_many_reads_each_id_once_in_input_order():
+    client, links, transport = create_seeded_client(5)
+    link_ids = [links[2]['id'], 'missing', links[0]['id'], links[2]['id']]
+    result = client.links.get_many(link_ids)
+
+    assert [result[0]['id'], result[2]['id'], result[3]['id']] == [links[2]['id'], links[0]['id'], links[2]['id']]
+    assert isinstance(result[1], HTTPError)
+    assert transport.request_count == 3
+
+def test_get_many_bounds_requests_in_flight():
+    api = FakeRebrandlyApi()
+    links = api.seed_links(20)
+    in_flight = [0, 0]
+    lock = threading.Lock()
+    def handler(method, path, params, body, headers):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight[0] -= 1
+        return api.handle(method, path, params, body, headers)
+    client, transport = create_client(handler)
+    result = client.links.get_many([link['id'] for link in links], max_workers=3)
+    assert [link['id'] for link in result] == [link['id'] for link in links]
+    assert in_flight[1] <= 3
+
+def test_get_many_reads_ids_one_by_one_by_default():
+    client, links, transport = create_seeded_client(60)
+    client.links.get_many([link['id'] for link in links[:50]])
+    assert transport.request_count == 50
+
+def test_get_many_lists_the_workspace_when_that_takes_fewer_requests():
+    client, links, transport = create_seeded_client(60, link_cache=LinkCache())
+    link_ids = [link['id'] for link in links[:50]] + ['missing']
+    result = client.links.get_many(link_ids, use_listing=True)
+
+    assert [link['id'] for link in result[:50]] == link_ids[:50]
+    assert isinstance(result[50], HTTPError)
+    # The count, three pages, the empty page ending the listing and the id it lacked
+    assert transport.request_count == 6
+    transport.request_count = 0
+    client.links.get_many(link_ids[:50], use_listing=True)
+    assert transport.request_count == 0
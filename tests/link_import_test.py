@@ -0,0 +1,92 @@
+import io
+import json
+import threading
+import time
+from benchmarks.fake_server import FakeRebrandlyApi, FakeRebrandlyServer, DEFAULT_DOMAIN
+from src.rebrandly_official.link_import import read_links, import_links
+from tests.fake_client import create_client
+from src.rebrandly_official.__main__ import main
+
+def make_link(i):
+    return {"destination": f"https://example.com/{i}", "domainId": DEFAULT_DOMAIN["id"]}
+
+def test_bulk_create_stream_reads_lazily_and_bounds_requests_in_flight():
+    api = FakeRebrandlyApi()
+    in_flight = [0, 0]
+    lock = threading.Lock()
+    def handler(method, path, params, body, headers):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return api.handle(method, path, params, body, headers)
+    client, transport = create_client(handler)
+    read = []
+    def rows():
+        for i in range(100):
+            read.append(i)
+            yield {"title": "missing destination"} if i == 7 else make_link(i)
+
+    outcomes = client.links.bulk_create_stream(None, rows(), chunk_size=5, max_in_flight=2)
+    first = next(outcomes)
+    # Only the chunks allowed in flight, plus the one waiting to be sent, have been read
+    assert len(read) <= 5 * 3 + 1
+    outcomes = [first] + list(outcomes)
+    assert [index for index, _, _ in outcomes] == list(range(100))
+    assert isinstance(outcomes[7][2], KeyError)
+    assert outcomes[8][1]['destination'] == 'https://example.com/8'
+    assert in_flight[1] <= 2
+    assert len(api.links) == 99
+
+def test_bulk_create_stream_reports_invalid_rows_as_they_are_read():
+    client, transport = create_client(FakeRebrandlyApi().handle)
+    read = []
+    def rows():
+        for i in range(100000):
+            read.append(i)
+            yield {"destination": f"https://example.com/{i}"}
+
+    outcomes = client.links.bulk_create_stream(None, rows(), chunk_size=10, max_in_flight=2)
+    assert isinstance(next(outcomes)[2], KeyError)
+    assert len(read) <= 10 * 3
+
+def test_read_links_nests_dotted_csv_headers():
+    source = io.StringIO('destination,slashtag,domain.id,title\nhttps://rb.gy,promo,abc,\n')
+    assert list(read_links(source, 'csv')) == [{"destination": "https://rb.gy", "slashtag": "promo", "domain": {"id": "abc"}}]
+
+def test_import_links_writes_a_result_per_row():
+    api = FakeRebrandlyApi()
+    client, transport = create_client(api.handle)
+    source = io.StringIO(''.join(json.dumps(make_link(i)) + '\n' for i in range(3)) + '{"destination": "https://rb.gy"}\n')
+    output = io.StringIO()
+
+    summary = import_links(client.links, source, output, chunk_size=2)
+    assert summary.to_dict() == {"total": 4, "created": 3, "failed": 1}
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records[0]['link']['destination'] == 'https://example.com/0'
+    assert records[3] == {"index": 3, "error": 'A key specifying the domain or domainId must exist for every link.'}
+
+def test_import_links_reports_malformed_lines_and_carries_on():
+    api = FakeRebrandlyApi()
+    client, transport = create_client(api.handle)
+    source = io.StringIO(json.dumps(make_link(0)) + '\n{"destination": \n' + json.dumps(make_link(2)) + '\n')
+    output = io.StringIO()
+
+    summary = import_links(client.links, source, output)
+    assert summary.to_dict() == {"total": 3, "created": 2, "failed": 1}
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records[1]['error'].startswith('Line 2 is not valid JSON')
+    assert len(api.links) == 2
+
+def test_import_command(tmp_path, capsys):
+    source = tmp_path / 'links.csv'
+    source.write_text('destination,domainId\n' + ''.join(f'https://example.com/{i},{DEFAULT_DOMAIN["id"]}\n' for i in range(30)))
+    output = tmp_path / 'results.jsonl'
+    with FakeRebrandlyServer() as server:
+        exit_code = main(['import', str(source), '--output', str(output), '--api-key', 'api-key', '--api-url', server.url, '--chunk-size', '10'])
+        assert len(server.api.links) == 30
+    assert exit_code == 0
+    assert len(output.read_text().splitlines()) == 30
+    assert json.loads(capsys.readouterr().err) == {"total": 30, "created": 30, "failed": 0}
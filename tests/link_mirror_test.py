@@ -0,0 +1,61 @@
+from benchmarks.fake_server import FakeRebrandlyApi
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from src.rebrandly_official.link_mirror import LinkMirror
+from tests.fake_client import create_client
+
+def create_mirror(api, **options):
+    client, transport = create_client(api.handle)
+    return LinkMirror(client.links, **options), transport
+
+def test_first_sync_walks_every_link():
+    api = FakeRebrandlyApi()
+    api.seed_links(60)
+    mirror, transport = create_mirror(api)
+    result = mirror.sync()
+    assert (result.mode, result.upserted, result.pages) == ('full', 60, 3)
+    assert mirror.count() == 60
+    link = next(iter(api.links.values()))
+    assert mirror.get(link['id']) == link
+    assert mirror.find(domain_name='rebrand.ly', slashtag=link['slashtag']) == [link]
+
+def test_later_syncs_only_fetch_changes():
+    api = FakeRebrandlyApi()
+    links = api.seed_links(60)
+    mirror, transport = create_mirror(api)
+    mirror.sync()
+    client = RebrandlyClient('api-key', transport=transport)
+    client.links.update(links[0]['id'], 'https://example.com/updated', 'Updated', favourite=None)
+    client.links.create('https://example.com/new')
+    transport.request_count = 0
+
+    result = mirror.sync()
+    assert (result.mode, result.upserted, result.deleted) == ('incremental', 3, 0)
+    # One page of changes and the count used to detect deletions
+    assert transport.request_count == 2
+    assert mirror.count() == 61
+    assert mirror.get(links[0]['id'])['destination'] == 'https://example.com/updated'
+    assert len(mirror.find(destination='https://example.com/new')) == 1
+
+def test_deleted_links_are_swept():
+    api = FakeRebrandlyApi()
+    links = api.seed_links(30)
+    mirror, transport = create_mirror(api)
+    mirror.sync()
+    del api.links[links[5]['id']]
+
+    result = mirror.sync()
+    assert (result.mode, result.deleted) == ('sweep', 1)
+    assert mirror.get(links[5]['id']) is None
+    assert mirror.count() == 29
+    assert mirror.sync(sweep=False).deleted == 0
+
+def test_mirror_persists_between_runs(tmp_path):
+    api = FakeRebrandlyApi()
+    api.seed_links(10)
+    database = str(tmp_path / 'links.db')
+    mirror, _ = create_mirror(api, database=database)
+    mirror.sync()
+    mirror.close()
+    mirror, _ = create_mirror(api, database=database)
+    assert mirror.count() == 10
+    assert mirror.sync().mode == 'incremental'
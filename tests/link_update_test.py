@@ -0,0 +1,56 @@
+from benchmarks.fake_server import FakeRebrandlyApi
+from src.rebrandly_official.link_cache import LinkCache
+from tests.fake_client import create_client
+
+def create_seeded_client(**options):
+    api = FakeRebrandlyApi()
+    links = api.seed_links(5)
+    client, transport = create_client(api.handle, **options)
+    return client, api, links, transport
+
+def test_update_leaves_favourite_alone_by_default():
+    client, api, links, transport = create_seeded_client()
+    updated = client.links.update(links[0]['id'], 'https://example.com/changed', 'Changed')
+    assert updated['destination'] == 'https://example.com/changed'
+    assert transport.request_count == 1
+
+def test_update_skips_requests_that_change_nothing():
+    client, api, links, transport = create_seeded_client()
+    link = dict(links[0])
+    assert client.links.update(link['id'], link['destination'], link['title'], favourite=False, current=link) == link
+    assert transport.request_count == 0
+
+    updated = client.links.update(link['id'], link['destination'], link['title'], favourite=True, current=link)
+    assert updated['favourite'] is True
+    assert api.links[link['id']]['favourite'] is True
+    assert transport.request_count == 1
+
+def test_update_compares_with_the_cached_link():
+    client, api, links, transport = create_seeded_client(link_cache=LinkCache())
+    link = client.links.get(links[0]['id'])
+    client.links.update(link['id'], link['destination'], link['title'])
+    assert transport.request_count == 1
+
+def test_update_many_skips_no_ops_and_fills_missing_fields():
+    client, api, links, transport = create_seeded_client()
+    updates = [
+        {"id": links[0]['id'], "title": links[0]['title']},
+        {"id": links[1]['id'], "title": "New title"},
+        {"id": links[2]['id'], "favourite": True},
+        {"id": links[3]['id'], "destination": "https://example.com/3", "title": "Without known state"}
+    ]
+    updated = client.links.update_many(updates, current=[dict(link) for link in links[:3]])
+
+    assert [link['id'] for link in updated] == [update['id'] for update in updates]
+    assert api.links[links[1]['id']]['title'] == 'New title'
+    assert api.links[links[1]['id']]['destination'] == links[1]['destination']
+    assert api.links[links[2]['id']]['favourite'] is True
+    assert api.links[links[3]['id']]['title'] == 'Without known state'
+    # Nothing for the first link, one request for each of the others
+    assert transport.request_count == 3
+
+def test_update_many_reads_links_it_does_not_know():
+    client, api, links, transport = create_seeded_client()
+    client.links.update_many([{"id": links[0]['id'], "title": "Changed"}])
+    assert api.links[links[0]['id']]['destination'] == links[0]['destination']
+    assert transport.request_count == 2
@@ -0,0 +1,45 @@
+import pytest
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from src.rebrandly_official.link_validator import LinkValidator, ValidationReport
+
+def links_with_errors():
+    links = [{"destination": "https://rb.gy", "slashtag": f"s{i}", "domainId": "domain"} for i in range(10)]
+    links[1] = {"slashtag": "no-destination", "domain": {"id": "domain"}}
+    links[4] = {"destination": "https://rb.gy"}
+    links[6] = {"destination": "", "domain": {"id": ""}}
+    links[9] = {"destination": "https://rb.gy", "slashtag": "s3", "domainId": "domain"}
+    return links
+
+def test_report_lists_every_invalid_link_and_reason():
+    report = LinkValidator().validate(links_with_errors())
+
+    assert not report.ok
+    assert report.total_count == 10
+    assert report.valid_count == 6
+    assert report.invalid_indices == [1, 4, 6, 9]
+    assert [type(error) for error in report.errors[6]] == [KeyError, ValueError]
+    assert report.errors[9][0].args[0] == 'Slashtag s3 is already used by the link at index 3.'
+    assert report.summary()['Destination must be specified for every link.'] == 2
+
+def test_valid_links_are_streamed_while_the_input_is_read():
+    read = []
+    def links():
+        for index, link in enumerate(links_with_errors()):
+            read.append(index)
+            yield link
+
+    report = ValidationReport()
+    valid_links = LinkValidator().iter_valid(links(), report)
+
+    assert next(valid_links)[0] == 0
+    assert read == [0]
+    assert [index for index, _ in valid_links] == [2, 3, 5, 7, 8]
+    assert report.invalid_indices == [1, 4, 6, 9]
+
+def test_check_link_validity_raises_the_first_error():
+    links = RebrandlyClient('api-key').links
+    with pytest.raises(KeyError, match='Destination must be specified'):
+        links.check_link_validity({"domain": {"id": ""}})
+    with pytest.raises(ValueError, match='domainId key'):
+        links.check_link_validity({"destination": "https://rb.gy", "domainId": ""})
+    links.check_link_validity({"destination": "https://rb.gy", "domain": {"id": "domain"}})
@@ -0,0 +1,56 @@
+from src.rebrandly_official.models import Link, Domain
+from tests.fake_client import create_client
+
+link_json = {
+    "id": "abc",
+    "title": "Your Rebrandly link title",
+    "slashtag": "the-rb-gy-homepage",
+    "destination": "https://rb.gy",
+    "shortUrl": "rebrand.ly/the-rb-gy-homepage",
+    "domain": {"id": "domain", "fullName": "rebrand.ly", "active": True},
+    "creator": {"id": "creator", "fullName": "Rebrandly"},
+    "favourite": False,
+    "customField": 1
+}
+
+def test_link_model_fields_and_lazy_nested_models():
+    link = Link(dict(link_json))
+    assert link.id == 'abc'
+    assert link.short_url == 'rebrand.ly/the-rb-gy-homepage'
+    assert link.description is None
+    assert isinstance(link._domain, dict)
+    assert link.domain.full_name == 'rebrand.ly'
+    assert isinstance(link._domain, Domain)
+    assert link.creator.full_name == 'Rebrandly'
+    assert not hasattr(link, '__dict__')
+
+def test_link_model_dict_access_and_round_trip():
+    link = Link(dict(link_json))
+    assert link['destination'] == 'https://rb.gy'
+    assert link['domain']['fullName'] == 'rebrand.ly'
+    assert link['customField'] == 1
+    assert 'description' not in link
+    assert link.get('description', '') == ''
+    assert link.to_dict() == link_json
+
+def test_client_returns_models_when_enabled():
+    def handler(method, path, params, body, headers):
+        if path == '/v1/links':
+            return 200, [link_json]
+        return 200, link_json
+    client, transport = create_client(handler, use_models=True)
+
+    assert isinstance(client.links.get('abc'), Link)
+    page_of_links = client.links.list()
+    assert all(isinstance(link, Link) for link in page_of_links)
+    assert page_of_links.last_item == 'abc'
+
+def test_links_of_a_list_share_equal_nested_objects_without_leaking_changes():
+    links = Link.from_list([dict(link_json, id=f"link{i}", domain=dict(link_json['domain'])) for i in range(3)])
+    assert links[0]._domain is links[1]._domain is links[2]._domain
+
+    exported = links[0].to_dict()
+    exported['domain']['fullName'] = 'changed'
+    assert links[1].to_dict()['domain']['fullName'] == 'rebrand.ly'
+    assert links[2].domain.full_name == 'rebrand.ly'
+    assert links[2].domain is not links[1].domain
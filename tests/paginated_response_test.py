@@ -0,0 +1,80 @@
+import json
+import pytest
+from requests.exceptions import HTTPError
+from src.rebrandly_official.paginated_response import PaginatedResponse
+from tests.fake_client import create_client
+
+all_links = [{"id": f"link{i:03}", "slashtag": f"s{i}", "destination": "https://rb.gy"} for i in range(23)]
+
+def list_links_handler(method, path, params, body, headers):
+    if method == 'GET' and path == '/v1/links':
+        limit = int(params.get('limit') or 25)
+        start = 0
+        if params.get('last'):
+            start = [link['id'] for link in all_links].index(params['last']) + 1
+        return 200, all_links[start:start + limit]
+    return 404, {"code": "NotFound", "source": "link"}
+
+def test_iter_all_yields_every_page():
+    client, transport = create_client(list_links_handler)
+    page_of_links = client.links.list(limit=5)
+
+    listed = list(page_of_links.iter_all(prefetch=2))
+
+    assert [link['id'] for link in listed] == [link['id'] for link in all_links]
+    assert page_of_links.total_items_count == 23
+    assert transport.request_count == 6
+
+def test_iter_all_on_empty_list():
+    client, transport = create_client(lambda *args: (200, []))
+    page_of_links = client.links.list()
+    assert list(page_of_links.iter_all()) == []
+
+def test_iter_all_raises_page_errors():
+    def handler(method, path, params, body, headers):
+        if params.get('last'):
+            return 500, {"code": "InternalError"}
+        return 200, all_links[:5]
+    client, transport = create_client(handler)
+    page_of_links = client.links.list(limit=5)
+
+    listed = []
+    with pytest.raises(HTTPError):
+        for link in page_of_links.iter_all():
+            listed.append(link)
+    assert len(listed) == 5
+
+def test_resume_from_checkpoint_skips_processed_pages():
+    client, transport = create_client(list_links_handler)
+    page_of_links = client.links.list(limit=5)
+    checkpoints = []
+    page_of_links.on_checkpoint(checkpoints.append)
+    listed = [link['id'] for link in page_of_links]
+    page_of_links.next()
+    listed += [link['id'] for link in page_of_links]
+    # The second page is fetched but not processed when the scan stops
+    page_of_links.next()
+
+    checkpoint = json.loads(json.dumps(checkpoints[-1]))
+    assert checkpoint['iteration_count'] == 2
+    requests_before = transport.request_count
+    resumed = PaginatedResponse.from_checkpoint(checkpoint, client.session)
+    while resumed.current_items_count > 0:
+        listed += [link['id'] for link in resumed]
+        resumed.next()
+
+    assert listed == [link['id'] for link in all_links]
+    assert resumed.total_items_count == 23
+    assert transport.request_count - requests_before == 4
+
+def test_iter_all_reports_checkpoints_for_consumed_pages():
+    client, transport = create_client(list_links_handler)
+    checkpoints = []
+    page_of_links = client.links.list(limit=5).on_checkpoint(checkpoints.append, every=2)
+
+    for index, link in enumerate(page_of_links.iter_all(prefetch=3)):
+        if index == 11:
+            break
+
+    assert [checkpoint['iteration_count'] for checkpoint in checkpoints] == [2]
+    assert checkpoints[0]['last_item'] == 'link009'
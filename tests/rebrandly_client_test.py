@@ -0,0 +1,22 @@
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from src.rebrandly_official.transports import InMemoryTransport
+
+def test_connection_pools_are_sized_per_host():
+    client = RebrandlyClient('api-key', pool_maxsize=32, enterprise_pool_maxsize=4, pool_block=True)
+    api_adapter = client.session.get_adapter('https://api.rebrandly.com/v1/links')
+    enterprise_adapter = client.session.get_adapter('https://enterprise-api.rebrandly.com/v1/links')
+    assert api_adapter is not enterprise_adapter
+    assert api_adapter._pool_maxsize == 32
+    assert enterprise_adapter._pool_maxsize == 4
+    assert api_adapter._pool_block
+
+def test_default_timeout_and_keep_alive():
+    timeouts = []
+    class TimeoutRecordingTransport(InMemoryTransport):
+        def send(self, request, **kwargs):
+            timeouts.append(kwargs.get('timeout'))
+            return super().send(request, **kwargs)
+    client = RebrandlyClient('api-key', timeout=(3.05, 27), keep_alive=False, transport=TimeoutRecordingTransport(lambda *args: (200, {"id": "abc"})))
+    client.links.get('abc')
+    assert timeouts == [(3.05, 27)]
+    assert client.session.headers['Connection'] == 'close'
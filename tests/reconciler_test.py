@@ -0,0 +1,66 @@
+from benchmarks.fake_server import FakeRebrandlyApi, DEFAULT_DOMAIN, APPS
+from src.rebrandly_official.reconciler import Reconciler
+from tests.fake_client import create_client
+
+ITALY_ROUTE = {"condition": {"property": "req.country", "operator": "eq", "values": ["it"]}, "destination": "https://example.it"}
+
+def desired_link(slashtag, destination, **fields):
+    return dict({"slashtag": slashtag, "destination": destination, "domainId": DEFAULT_DOMAIN["id"]}, **fields)
+
+def create_reconciler():
+    api = FakeRebrandlyApi()
+    client, transport = create_client(api.handle)
+    client.links.bulk_create(None, [desired_link(f'promo{i}', f'https://example.com/{i}') for i in range(40)])
+    transport.request_count = 0
+    return Reconciler(client.links), api, transport
+
+def test_plan_of_an_unchanged_workspace_is_empty():
+    reconciler, api, transport = create_reconciler()
+    desired = [desired_link(f'promo{i}', f'https://example.com/{i}') for i in range(40)]
+    plan = reconciler.plan(desired)
+    assert plan.empty
+    # Listing only, nothing to compare below the link fields
+    assert transport.request_count == 3
+
+def test_apply_only_sends_the_differences():
+    reconciler, api, transport = create_reconciler()
+    desired = [desired_link(f'promo{i}', f'https://example.com/{i}') for i in range(2, 40)]
+    desired[0]['destination'] = 'https://example.com/changed'
+    desired[1]['favourite'] = True
+    desired[2]['routes'] = [ITALY_ROUTE]
+    desired.append(desired_link('new', 'https://example.com/new', deepLinks=[{"id": APPS[0]["id"], "path": "/open"}], opengraph={"title": "New"}))
+
+    plan = reconciler.plan(desired, prune=True)
+    assert (len(plan.creates), len(plan.updates), len(plan.deletes)) == (1, 2, 2)
+    assert plan.sub_resource_changes[0][0] == 'create_route'
+    result = reconciler.apply(plan)
+    assert result.ok
+    assert (result.created_count, result.updated_count, result.deleted_count, result.sub_resource_count) == (1, 2, 2, 3)
+
+    links_by_slashtag = {link['slashtag']: link for link in api.links.values()}
+    assert len(links_by_slashtag) == 39
+    assert links_by_slashtag['promo2']['destination'] == 'https://example.com/changed'
+    assert links_by_slashtag['promo3']['favourite'] is True
+    assert api.opengraphs[links_by_slashtag['new']['id']]['title'] == 'New'
+    assert api.deep_links[links_by_slashtag['new']['id']][APPS[0]["id"]]['path'] == '/open'
+    assert reconciler.plan(desired, prune=True).empty
+
+def test_sub_resources_found_on_live_links_are_not_read_again():
+    reconciler, api, transport = create_reconciler()
+    live = list(api.links.values())
+    link_id = live[0]['id']
+    route = reconciler.links.create_route(link_id, ITALY_ROUTE)
+    transport.request_count = 0
+    desired = [desired_link(link['slashtag'], link['destination'], routes=[]) for link in live]
+
+    plan = reconciler.plan(desired, live=[dict(link, routes=list(api.routes.get(link['id'], {}).values())) for link in live])
+    assert plan.sub_resource_changes == [('delete_route', link_id, route['id'])]
+    assert transport.request_count == 0
+
+def test_apply_collects_failures():
+    reconciler, api, transport = create_reconciler()
+    desired = [desired_link(f'promo{i}', f'https://example.com/{i}') for i in range(40)]
+    desired[0]['deepLinks'] = [{"id": "unknown-app", "path": "/open"}]
+    result = reconciler.apply(reconciler.plan(desired))
+    assert not result.ok
+    assert result.errors[0][0][0] == 'create_deep_link'
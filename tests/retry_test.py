@@ -0,0 +1,65 @@
+import pytest
+from requests.exceptions import HTTPError
+from src.rebrandly_official.retry_policy import RetryPolicy
+from src.rebrandly_official.rate_limiter import TokenBucketRateLimiter
+from tests.fake_client import create_client
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def failing_handler(*statuses):
+    remaining = list(statuses)
+    def handler(method, path, params, body, headers):
+        if remaining:
+            return remaining.pop(0), {"code": "Throttled"}, {"Retry-After": "0"}
+        return 200, {"id": "abc"}
+    return handler
+
+def test_throttled_requests_are_retried():
+    client, transport = create_client(failing_handler(429, 429), retry_policy=RetryPolicy(backoff_factor=0))
+    assert client.links.create('https://rb.gy')['id'] == 'abc'
+    assert transport.request_count == 3
+
+def test_server_errors_are_only_retried_for_safe_methods():
+    client, transport = create_client(failing_handler(503), retry_policy=RetryPolicy(backoff_factor=0))
+    assert client.links.get('abc')['id'] == 'abc'
+
+    client, transport = create_client(failing_handler(503), retry_policy=RetryPolicy(backoff_factor=0))
+    with pytest.raises(HTTPError):
+        client.links.create('https://rb.gy')
+    assert transport.request_count == 1
+
+def test_retries_stop_after_max_retries():
+    client, transport = create_client(failing_handler(429, 429, 429), retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+    with pytest.raises(HTTPError):
+        client.links.get('abc')
+    assert transport.request_count == 3
+
+def test_retry_delay_honors_headers_and_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=10, random=lambda: 1.0)
+    assert policy.get_delay(2) == 4
+    assert policy.get_delay(5) == 10
+
+    class Response:
+        headers = {"Retry-After": "7"}
+    assert policy.get_delay(0, Response()) == 7
+
+def test_token_bucket_spaces_out_requests():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=2, burst=2, clock=clock, sleep=clock.sleep)
+    for _ in range(4):
+        limiter.acquire()
+    assert clock.sleeps == [0.5, 0.5]
+
+    limiter.pause(3)
+    limiter.acquire()
+    assert clock.sleeps[-1] == 3
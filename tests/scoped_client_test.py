@@ -0,0 +1,60 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.rebrandly_official.link_cache import LinkCache
+from tests import fake_client
+
+def echo_headers_handler(method, path, params, body, headers):
+    return 200, {"id": path.rsplit('/', 1)[-1], "apikey": headers['apikey'], "workspace": headers.get('workspace')}
+
+def create_client(**kwargs):
+    return fake_client.create_client(echo_headers_handler, **kwargs)[0]
+
+def test_views_send_their_own_workspace_concurrently():
+    client = create_client()
+    def get_as_tenant(index):
+        return client.for_workspace(f"workspace{index}").links.get(f"link{index}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        links = list(pool.map(get_as_tenant, range(32)))
+
+    assert [link['workspace'] for link in links] == [f"workspace{index}" for index in range(32)]
+    assert 'workspace' not in client.session.headers
+
+def test_views_share_the_connection_pool_and_executor():
+    client = create_client()
+    view = client.for_workspace('workspace')
+    assert view.session.session is client.session
+    assert view.session.get_adapter(client.api_url) is client.session.get_adapter(client.api_url)
+    assert view.executor is client.executor
+    assert view.instrumentation is client.instrumentation
+
+def test_views_combine_and_keep_their_own_headers():
+    client = create_client()
+    view = client.with_api_key('tenant-key').for_workspace('workspace')
+    assert view.links.get('abc') == {"id": "abc", "apikey": "tenant-key", "workspace": "workspace"}
+
+    view.update_workspace('other-workspace')
+    assert view.links.get('abc')['workspace'] == 'other-workspace'
+    assert client.links.get('abc') == {"id": "abc", "apikey": "api-key", "workspace": None}
+
+def test_cached_reads_are_not_shared_between_views():
+    client = create_client(link_cache=LinkCache())
+    assert client.for_workspace('first').links.get('abc')['workspace'] == 'first'
+    assert client.for_workspace('second').links.get('abc')['workspace'] == 'second'
+    assert client.links.cache is client.for_workspace('first').links.cache
+
+def test_async_views_send_their_own_headers():
+    httpx = pytest.importorskip('httpx')
+    from src.rebrandly_official.async_rebrandly_client import AsyncRebrandlyClient
+    def handler(request):
+        return httpx.Response(200, json={"apikey": request.headers['apikey'], "workspace": request.headers.get('workspace')})
+
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            views = [client.for_workspace(f"workspace{index}") for index in range(4)]
+            return await asyncio.gather(*(view.links.get('abc') for view in views)), client.session.headers.get('workspace')
+
+    links, root_workspace = asyncio.run(run())
+    assert [link['workspace'] for link in links] == [f"workspace{index}" for index in range(4)]
+    assert root_workspace is None
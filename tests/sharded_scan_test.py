@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import pytest
+from datetime import datetime, timedelta
+from src.rebrandly_official.sharded_scan import ShardedScan
+from src.rebrandly_official.async_sharded_scan import AsyncShardedScan
+from tests.fake_client import create_client
+
+start_date = datetime(2024, 1, 1)
+all_links = [{
+    "id": f"link{i:03}",
+    "createdAt": (start_date + timedelta(hours=7 * i)).isoformat(),
+    "domain": {"id": f"domain{i % 3}"}
+} for i in range(40)]
+
+def list_links_handler(method, path, params, body, headers):
+    matching_links = [link for link in all_links
+        if (not params.get('domain.id') or link['domain']['id'] == params['domain.id'])
+        and (not params.get('dateFrom') or link['createdAt'] >= params['dateFrom'])
+        and (not params.get('dateTo') or link['createdAt'] < params['dateTo'])]
+    if params.get('orderBy') == 'createdAt':
+        matching_links.sort(key=lambda link: link['createdAt'], reverse=(params.get('orderDir') or 'desc') == 'desc')
+    if params.get('last'):
+        matching_links = matching_links[[link['id'] for link in matching_links].index(params['last']) + 1:]
+    return 200, matching_links[:int(params.get('limit') or 25)]
+
+def test_date_range_shards_are_contiguous():
+    shards = ShardedScan.date_range_shards('2024-01-01', '2024-01-05', 4)
+    assert shards[0] == {'date_from': '2024-01-01T00:00:00', 'date_to': '2024-01-02T00:00:00'}
+    assert shards[-1]['date_to'] == '2024-01-05T00:00:00'
+    assert all(shards[i]['date_to'] == shards[i + 1]['date_from'] for i in range(3))
+
+def test_scan_by_domain_returns_every_link():
+    links = create_client(list_links_handler)[0].links
+    shards = ShardedScan.domain_shards(['domain0', 'domain1', 'domain2'])
+    listed = list(links.scan(shards, max_workers=2, limit=4))
+    assert sorted(link['id'] for link in listed) == [link['id'] for link in all_links]
+
+def test_scan_by_date_range_merges_in_order():
+    links = create_client(list_links_handler)[0].links
+    shards = ShardedScan.date_range_shards(start_date, start_date + timedelta(days=14), 5)
+    listed = list(links.scan(shards, order_by='createdAt', order_dir='desc', limit=3))
+    assert [link['id'] for link in listed] == [link['id'] for link in reversed(all_links)]
+
+def test_scan_without_order_dir_merges_newest_first_like_the_api():
+    links = create_client(list_links_handler)[0].links
+    shards = ShardedScan.date_range_shards(start_date, start_date + timedelta(days=14), 3)
+    listed = list(links.scan(shards, order_by='createdAt', limit=4))
+    assert [link['id'] for link in listed] == [link['id'] for link in reversed(all_links)]
+
+def test_scan_walks_many_shards_on_max_workers_threads():
+    threads = set()
+    def recording_handler(*args):
+        threads.add(threading.get_ident())
+        return list_links_handler(*args)
+    client, transport = create_client(recording_handler)
+    shards = ShardedScan.date_range_shards(start_date, start_date + timedelta(days=14), 12)
+    listed = list(client.links.scan(shards, max_workers=2, order_by='createdAt', order_dir='asc', limit=2))
+    assert [link['id'] for link in listed] == [link['id'] for link in all_links]
+    assert len(threads) <= 2
+
+def scan_async(shards, **options):
+    httpx = pytest.importorskip("httpx")
+    from src.rebrandly_official.async_rebrandly_client import AsyncRebrandlyClient
+    in_flight = [0, 0]
+    async def handler(request):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.001)
+        in_flight[0] -= 1
+        status, body = list_links_handler(request.method, request.url.path, dict(request.url.params), None, request.headers)
+        return httpx.Response(status, json=body)
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler)) as client:
+            return [link async for link in client.links.scan(shards, **options)]
+    return asyncio.run(run()), in_flight[1]
+
+def test_async_scan_by_domain_returns_every_link():
+    shards = AsyncShardedScan.domain_shards(['domain0', 'domain1', 'domain2'])
+    listed, _ = scan_async(shards, max_workers=2, limit=4)
+    assert sorted(link['id'] for link in listed) == [link['id'] for link in all_links]
+
+def test_async_scan_merges_in_order_with_at_most_max_workers_requests():
+    shards = AsyncShardedScan.date_range_shards(start_date, start_date + timedelta(days=14), 12)
+    listed, most_in_flight = scan_async(shards, max_workers=3, order_by='createdAt', limit=2)
+    assert [link['id'] for link in listed] == [link['id'] for link in reversed(all_links)]
+    assert 1 < most_in_flight <= 3
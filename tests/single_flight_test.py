@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+import pytest
+from requests.exceptions import HTTPError
+from tests.fake_client import create_client
+from src.rebrandly_official.single_flight import SingleFlight
+
+def slow_handler(calls, status_code=200):
+    def handler(method, path, params, body, headers):
+        calls.append((path, params.get('workspace')))
+        time.sleep(0.1)
+        if status_code != 200:
+            return status_code, {"code": "InternalError"}
+        return 200, {"id": path.rsplit('/', 1)[-1]}
+    return handler
+
+def run_concurrently(fn, count=8):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    def run(index):
+        barrier.wait()
+        try:
+            results[index] = fn(index)
+        except Exception as error:
+            results[index] = error
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def test_identical_concurrent_gets_share_one_request():
+    calls = []
+    client, transport = create_client(slow_handler(calls), single_flight=True)
+
+    results = run_concurrently(lambda index: client.links.get('abc'))
+
+    assert results == [{"id": "abc"}] * 8
+    assert len(calls) == 1
+    assert client.session.single_flight.stats() == {"in_flight": 0, "coalesced": 7}
+    # Every caller decodes its own copy
+    results[0]['id'] = 'changed'
+    assert results[1]['id'] == 'abc'
+
+def test_different_params_are_not_coalesced():
+    calls = []
+    client, transport = create_client(slow_handler(calls), single_flight=True)
+    run_concurrently(lambda index: client.links.get('abc', workspace_id=f"workspace{index % 2}"))
+    assert sorted(calls) == [('/v1/links/abc', 'workspace0'), ('/v1/links/abc', 'workspace1')]
+
+def test_errors_are_shared_by_every_waiting_caller():
+    calls = []
+    client, transport = create_client(slow_handler(calls, status_code=500), single_flight=True)
+    results = run_concurrently(lambda index: client.links.list_routes('abc'), count=4)
+    assert all(isinstance(result, HTTPError) for result in results)
+    assert len(calls) == 1
+
+def test_calls_after_completion_are_not_shared():
+    single_flight = SingleFlight()
+    assert single_flight.do('key', lambda: 1) == 1
+    assert single_flight.do('key', lambda: 2) == 2
+
+def test_async_single_flight():
+    httpx = pytest.importorskip('httpx')
+    from src.rebrandly_official.async_rebrandly_client import AsyncRebrandlyClient
+    calls = []
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[{"id": "domain"}])
+
+    async def run():
+        async with AsyncRebrandlyClient('api-key', transport=httpx.MockTransport(handler), single_flight=True) as client:
+            return await asyncio.gather(*(client.domains.list() for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert [result.current_items for result in results] == [[{"id": "domain"}]] * 5
+    assert calls == ['/v1/domains']
+
+def test_async_single_flight_survives_a_cancelled_leader():
+    from src.rebrandly_official.async_single_flight import AsyncSingleFlight
+    single_flight = AsyncSingleFlight()
+    calls = []
+    async def fetch():
+        calls.append('fetch')
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            calls.append('cancelled')
+            raise
+        return 'result'
+
+    async def run():
+        leader = asyncio.ensure_future(single_flight.do('key', fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do('key', fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == 'result'
+        assert leader.cancelled()
+        assert calls == ['fetch']
+
+        abandoned = asyncio.ensure_future(single_flight.do('other', fetch))
+        await asyncio.sleep(0.01)
+        abandoned.cancel()
+        await asyncio.sleep(0.01)
+        # Nobody waits for the other call any more, so it is cancelled
+        assert calls == ['fetch', 'fetch', 'cancelled']
+        assert single_flight.stats()['in_flight'] == 0
+
+    asyncio.run(run())
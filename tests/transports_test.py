@@ -0,0 +1,64 @@
+import pytest
+from requests.exceptions import ConnectionError
+from benchmarks.fake_server import FakeRebrandlyApi, FakeRebrandlyServer
+from src.rebrandly_official.rebrandly_client import RebrandlyClient
+from src.rebrandly_official.retry_policy import RetryPolicy
+from src.rebrandly_official.transports import InMemoryTransport, Http2Transport
+
+def test_in_memory_transport_serves_every_sub_client():
+    api = FakeRebrandlyApi()
+    api.seed_links(30)
+    transport = InMemoryTransport(api.handle)
+    client = RebrandlyClient('api-key', transport=transport)
+
+    assert len(list(client.links.list().iter_all())) == 30
+    assert client.links.bulk_create(None, [{"destination": "https://rb.gy", "domainId": "8f104cc5b6ee4a4ba7897b06ac2ddcfb"}])[0]['destination'] == 'https://rb.gy'
+    assert client.workspaces.list().current_items[0]['name'] == 'Main workspace'
+    assert client.domains.list().current_items[0]['fullName'] == 'rebrand.ly'
+    # Listing stops at the first empty page
+    assert transport.request_count == 6
+
+def test_in_memory_transport_goes_through_retries_and_instrumentation():
+    statuses = [503]
+    def handler(method, path, params, body, headers):
+        if statuses:
+            return statuses.pop(), {"code": "ServiceUnavailable"}
+        return 200, {"id": "abc", "apikey": headers['apikey']}
+    client = RebrandlyClient('api-key', transport=InMemoryTransport(handler), retry_policy=RetryPolicy(backoff_factor=0))
+    events = []
+    client.instrumentation.on_response(events.append)
+
+    assert client.links.get('abc') == {"id": "abc", "apikey": "api-key"}
+    assert [event.status_code for event in events] == [503, 200]
+
+def test_http2_transport_talks_to_a_server():
+    pytest.importorskip('httpx')
+    with FakeRebrandlyServer() as server:
+        client = RebrandlyClient('api-key', api_url=server.url, enterprise_api_url=server.url, transport=Http2Transport())
+        link = client.links.create('https://example.com')
+        assert client.links.get(link['id']) == link
+        client.session.close()
+
+def test_http2_transport_raises_requests_connection_errors():
+    pytest.importorskip('httpx')
+    client = RebrandlyClient('api-key', api_url='http://127.0.0.1:9/', enterprise_api_url='http://127.0.0.1:9/', transport=Http2Transport())
+    with pytest.raises(ConnectionError):
+        client.links.get('abc')
+
+def test_http2_transport_applies_the_session_tls_and_proxy_settings(monkeypatch):
+    pytest.importorskip('httpx')
+    # requests prefers these over session.verify
+    monkeypatch.delenv('REQUESTS_CA_BUNDLE', raising=False)
+    monkeypatch.delenv('CURL_CA_BUNDLE', raising=False)
+    with FakeRebrandlyServer() as server:
+        transport = Http2Transport()
+        client = RebrandlyClient('api-key', api_url=server.url, enterprise_api_url=server.url, transport=transport)
+        client.session.verify = False
+        assert client.links.count() == 0
+        assert list(transport._clients) == [(False, None, None)]
+
+        client.session.proxies = {"http": "http://127.0.0.1:9"}
+        with pytest.raises(ConnectionError):
+            client.links.count()
+        assert list(transport._clients)[-1] == (False, None, 'http://127.0.0.1:9')
+        client.session.close()